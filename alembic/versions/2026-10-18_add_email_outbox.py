@@ -0,0 +1,47 @@
+"""add email outbox
+
+Revision ID: 5d8e1f3a9c62
+Revises: a61e0c4b9d27
+Create Date: 2026-10-18 13:20:05.418233
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d8e1f3a9c62"
+down_revision = "a61e0c4b9d27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outboxemail",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("recipients", sa.JSON(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column("subtype", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_outboxemail_id"), "outboxemail", ["id"], unique=False)
+    op.create_index(
+        "ix_outboxemail_pending",
+        "outboxemail",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("sent_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outboxemail_pending", table_name="outboxemail", postgresql_where=sa.text("sent_at IS NULL"))
+    op.drop_index(op.f("ix_outboxemail_id"), table_name="outboxemail")
+    op.drop_table("outboxemail")
@@ -0,0 +1,46 @@
+"""add event type closure
+
+Revision ID: 1dbbb513441c
+Revises: 971aeee2050f
+Create Date: 2026-10-18 13:56:33.594681
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1dbbb513441c"
+down_revision = "971aeee2050f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "eventtypeclosure",
+        sa.Column("ancestor_id", sa.Integer(), nullable=False),
+        sa.Column("descendant_id", sa.Integer(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ancestor_id"], ["eventtype.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["descendant_id"], ["eventtype.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id"),
+    )
+    op.create_index(op.f("ix_eventtypeclosure_descendant_id"), "eventtypeclosure", ["descendant_id"], unique=False)
+    op.execute(
+        """
+        WITH RECURSIVE closure(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM eventtype
+            UNION ALL
+            SELECT closure.ancestor_id, eventtype.id, closure.depth + 1
+            FROM closure JOIN eventtype ON eventtype.parent_type_id = closure.descendant_id
+        )
+        INSERT INTO eventtypeclosure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM closure;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_eventtypeclosure_descendant_id"), table_name="eventtypeclosure")
+    op.drop_table("eventtypeclosure")
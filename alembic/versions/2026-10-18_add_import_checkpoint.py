@@ -0,0 +1,30 @@
+"""add import checkpoint
+
+Revision ID: c37b9e52d0f4
+Revises: 1dbbb513441c
+Create Date: 2026-10-18 15:42:11.207351
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c37b9e52d0f4"
+down_revision = "1dbbb513441c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "importcheckpoint",
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("rows", sa.Integer(), nullable=False),
+        sa.Column("tables", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("source"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("importcheckpoint")
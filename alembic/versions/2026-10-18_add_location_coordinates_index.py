@@ -0,0 +1,22 @@
+"""add location coordinates index
+
+Revision ID: 074d9c461d92
+Revises: 72c84306791e
+Create Date: 2026-10-18 13:47:15.308388
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "074d9c461d92"
+down_revision = "72c84306791e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_location_coordinates", "location", ["latitude", "longitude"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_location_coordinates", table_name="location")
@@ -0,0 +1,46 @@
+"""add query shape indexes
+
+Revision ID: 971aeee2050f
+Revises: 074d9c461d92
+Create Date: 2026-10-18 13:51:00.416931
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "971aeee2050f"
+down_revision = "074d9c461d92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_active_held_at", "event", ["held_at"], unique=False, postgresql_where=sa.text("is_active")
+    )
+    op.create_index("ix_event_event_type_held_at", "event", ["event_type_id", "held_at"], unique=False)
+    op.create_index("ix_event_location_held_at", "event", ["location_id", "held_at"], unique=False)
+    op.create_index(op.f("ix_ticket_ticket_category_id"), "ticket", ["ticket_category_id"], unique=False)
+    op.create_index("ix_ticket_user_ticket_category", "ticket", ["user_id", "ticket_category_id"], unique=False)
+    op.create_index(
+        "ix_ticketcategory_available",
+        "ticketcategory",
+        ["event_id"],
+        unique=False,
+        postgresql_where=sa.text("quota > tickets_sold"),
+    )
+    op.create_index(op.f("ix_ticketcategory_event_id"), "ticketcategory", ["event_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_ticketcategory_event_id"), table_name="ticketcategory")
+    op.drop_index(
+        "ix_ticketcategory_available", table_name="ticketcategory", postgresql_where=sa.text("quota > tickets_sold")
+    )
+    op.drop_index("ix_ticket_user_ticket_category", table_name="ticket")
+    op.drop_index(op.f("ix_ticket_ticket_category_id"), table_name="ticket")
+    op.drop_index("ix_event_location_held_at", table_name="event")
+    op.drop_index("ix_event_event_type_held_at", table_name="event")
+    op.drop_index("ix_event_active_held_at", table_name="event", postgresql_where=sa.text("is_active"))
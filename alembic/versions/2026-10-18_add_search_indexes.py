@@ -0,0 +1,54 @@
+"""add search indexes
+
+Revision ID: 72c84306791e
+Revises: 5d8e1f3a9c62
+Create Date: 2026-10-18 13:42:08.655616
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "72c84306791e"
+down_revision = "5d8e1f3a9c62"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_event_name_search",
+        "event",
+        [sa.literal_column("to_tsvector('simple', name)")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_location_city_search",
+        "location",
+        [sa.literal_column("to_tsvector('simple', city)")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_location_name_search",
+        "location",
+        [sa.literal_column("to_tsvector('simple', name)")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_speaker_name_search",
+        "speaker",
+        [sa.literal_column("to_tsvector('simple', name)")],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_speaker_name_search", table_name="speaker", postgresql_using="gin")
+    op.drop_index("ix_location_name_search", table_name="location", postgresql_using="gin")
+    op.drop_index("ix_location_city_search", table_name="location", postgresql_using="gin")
+    op.drop_index("ix_event_name_search", table_name="event", postgresql_using="gin")
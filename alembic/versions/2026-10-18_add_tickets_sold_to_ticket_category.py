@@ -0,0 +1,30 @@
+"""add tickets sold to ticket category
+
+Revision ID: 3f9c2d71a8b4
+Revises: 7ba4a157a11f
+Create Date: 2026-10-18 10:12:41.204117
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f9c2d71a8b4"
+down_revision = "7ba4a157a11f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("ticketcategory", sa.Column("tickets_sold", sa.Integer(), server_default="0", nullable=False))
+    op.execute(
+        """
+        UPDATE ticketcategory
+        SET tickets_sold = (SELECT count(*) FROM ticket WHERE ticket.ticket_category_id = ticketcategory.id);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ticketcategory", "tickets_sold")
@@ -0,0 +1,31 @@
+"""add updated at to event related models
+
+Revision ID: a61e0c4b9d27
+Revises: 3f9c2d71a8b4
+Create Date: 2026-10-18 14:03:52.611390
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a61e0c4b9d27"
+down_revision = "3f9c2d71a8b4"
+branch_labels = None
+depends_on = None
+
+TABLES = ("event", "organizer", "eventtype", "location", "speaker")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "updated_at")
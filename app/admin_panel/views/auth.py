@@ -1,6 +1,9 @@
+from typing import Any
+
 from sqladmin import ModelView
 
 from app.admin_panel.views.registry import register_view
+from app.auth.cache import principal_cache
 from app.auth.models import User
 
 
@@ -19,3 +22,6 @@ class UserView(ModelView, model=User):  # type: ignore[call-arg]
     ]
     column_details_exclude_list = [User.password_reset_tokens, User.verification_token, User.tickets]
     can_delete = False
+
+    async def after_model_change(self, data: dict, model: Any, is_created: bool) -> None:
+        principal_cache.invalidate(model.id)
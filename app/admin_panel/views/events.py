@@ -19,8 +19,21 @@ class EventView(FileModelView, model=Event):  # type: ignore[call-arg]
     column_list = [Event.id, Event.name, Event.held_at, Event.is_active, Event.slug]
     column_searchable_list = [Event.name, Event.slug]
     column_sortable_list = [Event.id, Event.name, Event.held_at, Event.is_active, Event.slug]
-    form_excluded_columns = [Event.ticket_categories, Event.created_by]
-    column_details_exclude_list = [Event.location_id, Event.organizer_id, Event.created_by_id, Event.event_type_id]
+    form_excluded_columns = [
+        Event.ticket_categories,
+        Event.created_by,
+        Event.updated_at,
+        Event.relevance,
+        Event.distance,
+    ]
+    column_details_exclude_list = [
+        Event.location_id,
+        Event.organizer_id,
+        Event.created_by_id,
+        Event.event_type_id,
+        Event.relevance,
+        Event.distance,
+    ]
     form_ajax_refs = {
         "organizer": {
             "fields": ("name", "id"),
@@ -79,7 +92,7 @@ class OrganizerView(ModelView, model=Organizer):  # type: ignore[call-arg]
     column_list = [Organizer.id, Organizer.name]
     column_searchable_list = [Organizer.name]
     column_sortable_list = [Organizer.id, Organizer.name]
-    form_excluded_columns = [Organizer.events]
+    form_excluded_columns = [Organizer.events, Organizer.updated_at]
 
 
 @register_view
@@ -89,7 +102,7 @@ class EventTypeView(ModelView, model=EventType):  # type: ignore[call-arg]
     column_details_exclude_list = [EventType.events, EventType.parent_type_id]
     column_searchable_list = [EventType.name, EventType.slug]
     column_sortable_list = [EventType.id, EventType.name, EventType.slug]
-    form_excluded_columns = [EventType.events, EventType.children]
+    form_excluded_columns = [EventType.events, EventType.children, EventType.updated_at]
     form_ajax_refs = {
         "parent": {
             "fields": ("name", "id"),
@@ -104,7 +117,7 @@ class LocationView(ModelView, model=Location):  # type: ignore[call-arg]
     column_list = [Location.id, Location.name, Location.city, Location.slug]
     column_searchable_list = [Location.name, Location.city, Location.slug]
     column_sortable_list = [Location.id, Location.name, Location.city, Location.slug]
-    form_excluded_columns = [Location.events]
+    form_excluded_columns = [Location.events, Location.updated_at]
     column_details_exclude_list = [Location.events]
 
 
@@ -115,7 +128,7 @@ class SpeakerView(FileModelView, model=Speaker):  # type: ignore[call-arg]
     column_list = [Speaker.id, Speaker.name, Speaker.slug]
     column_searchable_list = [Speaker.name, Speaker.slug]
     column_sortable_list = [Speaker.id, Speaker.name, Speaker.slug]
-    form_excluded_columns = [Speaker.events]
+    form_excluded_columns = [Speaker.events, Speaker.updated_at]
     column_details_exclude_list = [Speaker.events]
     form_overrides = {"description": CKTextAreaField}
     edit_template = "edit.html"
@@ -24,7 +24,7 @@ class TicketCategoryView(ModelView, model=TicketCategory):  # type: ignore[call-
     column_list = [TicketCategory.id, TicketCategory.name, TicketCategory.quota, TicketCategory.event]
     column_searchable_list = [TicketCategory.name]
     column_sortable_list = [TicketCategory.id, TicketCategory.name, TicketCategory.quota]
-    form_excluded_columns = [TicketCategory.tickets]
+    form_excluded_columns = [TicketCategory.tickets, TicketCategory.tickets_sold]
     column_details_exclude_list = [TicketCategory.event_id, TicketCategory.tickets]
     form_ajax_refs = {
         "event": {
@@ -4,13 +4,19 @@ from fastapi import APIRouter, Depends, status
 
 from app.auth import crud, models, schemas
 from app.auth.deps import (
+    hash_new_password,
     open_registration_allowed,
     register_new_user_and_send_verification_email,
     user_exists,
-    user_update_unique_email,
+    verify_current_password,
+)
+from app.common.deps import (
+    CurrentActiveUser,
+    CurrentActiveUserInDB,
+    DBSession,
+    Pagination,
+    get_current_active_superuser,
 )
-from app.auth.exceptions import InvalidCurrentPassword
-from app.common.deps import CurrentActiveUser, DBSession, Pagination, get_current_active_superuser
 
 router = APIRouter()
 
@@ -55,15 +61,14 @@ def read_current_user(user: CurrentActiveUser) -> Any:
 @router.patch("/me", response_model=schemas.User)
 def update_current_user(
     db: DBSession,
-    user: CurrentActiveUser,
-    user_in: Annotated[schemas.UserUpdateWithCurrentPassword, Depends(user_update_unique_email)],
+    user: CurrentActiveUserInDB,
+    user_in: Annotated[schemas.UserUpdateWithCurrentPassword, Depends(verify_current_password)],
+    hashed_password: Annotated[str | None, Depends(hash_new_password)],
 ) -> Any:
     """
     Update currently authenticated user
     """
-    if not crud.user.check_password(db, user=user, password=user_in.current_password):
-        raise InvalidCurrentPassword
-    user = crud.user.update(db, db_obj=user, obj_in=user_in)
+    user = crud.user.update(db, db_obj=user, obj_in=user_in, hashed_password=hashed_password)
     return user
 
 
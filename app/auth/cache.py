@@ -0,0 +1,44 @@
+import hashlib
+
+from app.auth.schemas import Principal
+from app.common.cache import CacheBackend, create_cache_backend
+from app.core.config import settings
+
+
+class PrincipalCache:
+    def __init__(self, backend: CacheBackend, ttl: int, namespace: str = "principal") -> None:
+        """
+        Cache of authenticated users, keyed by user id and access token
+
+        :param backend: storage for the cached principals
+        :param ttl: lifetime of cached principals in seconds, caching is disabled if not positive
+        :param namespace: prefix of the cache keys
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace = namespace
+
+    def make_key(self, user_id: int | str | None, token: str) -> str:
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        return f"{self.namespace}:{user_id}:{token_hash}"
+
+    def get(self, user_id: int | str | None, token: str) -> Principal | None:
+        value = self.backend.get(self.make_key(user_id, token))
+        if value is None:
+            return None
+        return Principal.model_validate_json(value)
+
+    def set(self, principal: Principal, token: str) -> None:
+        if self.ttl <= 0:
+            return
+        self.backend.set(self.make_key(principal.id, token), principal.model_dump_json().encode(), ttl=self.ttl)
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """
+        Drop cached principals of the user, or all of them if no user is given
+        """
+        prefix = f"{self.namespace}:" if user_id is None else f"{self.namespace}:{user_id}:"
+        self.backend.delete_prefix(prefix)
+
+
+principal_cache = PrincipalCache(create_cache_backend(), ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
@@ -1,24 +1,38 @@
-from typing import Any
+from typing import Any, Type
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select  # type: ignore[attr-defined]
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.auth.cache import principal_cache
 from app.auth.models import User
-from app.auth.schemas import UserCreate, UserUpdate
-from app.auth.security import get_password_hash, verify_password
-from app.common.crud import CRUDBase
+from app.auth.schemas import Principal, UserCreate, UserUpdate
+from app.auth.security import get_password_hash, verify_and_update_password, verify_and_update_password_async
+from app.common.crud import AsyncCRUDBase, CRUDBase
 
 
-class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
+class UserQueryMixin:
+    model: Type[User]
+
+    def _get_by_email_query(self, email: str) -> Select:
+        return select(self.model).where(func.lower(self.model.email) == func.lower(email))
+
+
+class CRUDUser(CRUDBase[User, UserCreate, UserUpdate], UserQueryMixin):
+    model: Type[User]
+
     def get_by_email(self, db: Session, *, email: str) -> User | None:
-        query = select(self.model).where(func.lower(self.model.email) == func.lower(email))
+        query = self._get_by_email_query(email)
         result = db.execute(query)
         return result.scalar()
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    def create(self, db: Session, *, obj_in: UserCreate, hashed_password: str | None = None) -> User:
+        """
+        :param hashed_password: hash of the password computed beforehand, e.g. in the password hashing executor
+        """
         db_obj = self.model(
             email=obj_in.email.lower(),
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=hashed_password or get_password_hash(obj_in.password),
             is_superuser=obj_in.is_superuser,
             is_activated=obj_in.is_activated,
             is_disabled=obj_in.is_disabled,
@@ -29,27 +43,36 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db.refresh(db_obj)
         return db_obj
 
-    def update(self, db: Session, *, db_obj: User, obj_in: UserUpdate | dict[str, Any]) -> User:
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: User,
+        obj_in: UserUpdate | dict[str, Any],
+        hashed_password: str | None = None,
+    ) -> User:
+        """
+        :param hashed_password: hash of the new password computed beforehand, e.g. in the password hashing executor
+        """
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
         new_password = update_data.get("new_password")
         if new_password:
-            hashed_password = get_password_hash(new_password)
             del update_data["new_password"]
-            update_data["hashed_password"] = hashed_password
+            update_data["hashed_password"] = hashed_password or get_password_hash(new_password)
         if update_data.get("email"):
             update_data["email"] = update_data["email"].lower()
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
-
-    def check_password(self, db: Session, *, user: User, password: str) -> bool:
-        authenticated_user = self.authenticate_by_mail(db, email=user.email, password=password)
-        return bool(authenticated_user)
+        user = super().update(db, db_obj=db_obj, obj_in=update_data)
+        principal_cache.invalidate(user.id)
+        return user
 
-    def change_password(self, db: Session, *, user: User, new_password: str) -> User:
+    def change_password(
+        self, db: Session, *, user: User, new_password: str, hashed_password: str | None = None
+    ) -> User:
         user_in = UserUpdate(new_password=new_password)
-        return self.update(db, db_obj=user, obj_in=user_in)
+        return self.update(db, db_obj=user, obj_in=user_in, hashed_password=hashed_password)
 
     def _set_attribute(self, db: Session, *, user_id: int, attr: str, value: Any) -> User | None:
         user = self.get(db, user_id)
@@ -60,6 +83,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db.add(user)
         db.commit()
         db.refresh(user)
+        principal_cache.invalidate(user.id)
         return user
 
     def deactivate(self, db: Session, *, user_id: int) -> User | None:
@@ -72,15 +96,44 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
     def authenticate_by_mail(self, db: Session, *, email: str, password: str) -> User | None:
         user = self.get_by_email(db, email=email)
-        if user is None or not verify_password(password, user.hashed_password):
+        if user is None:
             return None
+        verified, new_hash = verify_and_update_password(password, user.hashed_password)
+        if not verified:
+            return None
+        if new_hash:
+            user.hashed_password = new_hash
+            db.add(user)
+            db.commit()
         return user
 
-    def is_activated(self, user: User) -> bool:
+    def is_activated(self, user: User | Principal) -> bool:
         return user.is_activated
 
-    def is_disabled(self, user: User) -> bool:
+    def is_disabled(self, user: User | Principal) -> bool:
         return user.is_disabled
 
-    def is_superuser(self, user: User) -> bool:
+    def is_superuser(self, user: User | Principal) -> bool:
         return user.is_superuser
+
+
+class AsyncCRUDUser(AsyncCRUDBase[User, UserCreate, UserUpdate], UserQueryMixin):
+    model: Type[User]
+
+    async def get_by_email(self, db: AsyncSession, *, email: str) -> User | None:
+        query = self._get_by_email_query(email)
+        result = await db.execute(query)
+        return result.scalar()
+
+    async def authenticate_by_mail(self, db: AsyncSession, *, email: str, password: str) -> User | None:
+        user = await self.get_by_email(db, email=email)
+        if user is None:
+            return None
+        verified, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+        if not verified:
+            return None
+        if new_hash:
+            user.hashed_password = new_hash
+            db.add(user)
+            await db.commit()
+        return user
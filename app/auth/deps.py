@@ -1,6 +1,8 @@
+import asyncio
+import weakref
 from typing import Annotated
 
-from fastapi import BackgroundTasks, Depends
+from fastapi import Depends
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.auth import crud, models, schemas, security
@@ -9,17 +11,32 @@ from app.auth.emails import send_new_user_email, send_password_reset_request_mai
 from app.auth.exceptions import (
     EmailAlreadyTaken,
     InvalidCredentials,
+    InvalidCurrentPassword,
     InvalidToken,
     OpenRegistrationNotAllowed,
+    TooManyLoginAttempts,
     UserDisabled,
     UserNotActivated,
     UserNotFound,
 )
-from app.common.deps import CurrentActiveUser, DBSession, Mailer
+from app.common.deps import AsyncDBSession, CurrentActiveUser, CurrentActiveUserInDB, DBSession
+from app.common.outbox import outbox_email
 from app.common.utils import InstanceInDBValidator
 from app.core.config import settings
 
 user_exists = InstanceInDBValidator[models.User, CRUDUser](crud_service=crud.user, exception=UserNotFound())
+_login_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def get_login_slots() -> asyncio.Semaphore:
+    """
+    Semaphore limiting concurrent logins, created per event loop as a semaphore is bound to the loop first waiting on it
+    """
+    loop = asyncio.get_running_loop()
+    login_slots = _login_slots.get(loop)
+    if login_slots is None:
+        login_slots = _login_slots[loop] = asyncio.Semaphore(settings.LOGIN_CONCURRENCY_LIMIT)
+    return login_slots
 
 
 def validate_unique_email(db: DBSession, email: str) -> None:
@@ -36,6 +53,23 @@ def user_update_unique_email(
     return user_in
 
 
+async def verify_current_password(
+    user: CurrentActiveUserInDB,
+    user_in: Annotated[schemas.UserUpdateWithCurrentPassword, Depends(user_update_unique_email)],
+) -> schemas.UserUpdateWithCurrentPassword:
+    if not await security.verify_password_async(user_in.current_password, user.hashed_password):
+        raise InvalidCurrentPassword
+    return user_in
+
+
+async def hash_new_password(
+    user_in: Annotated[schemas.UserUpdateWithCurrentPassword, Depends(verify_current_password)]
+) -> str | None:
+    if user_in.new_password is None:
+        return None
+    return await security.get_password_hash_async(user_in.new_password)
+
+
 def user_create_unique_email(db: DBSession, user_in: schemas.UserCreateOpen) -> schemas.UserCreateOpen:
     validate_unique_email(db, email=str(user_in.email))
     return user_in
@@ -46,11 +80,19 @@ def open_registration_allowed() -> None:
         raise OpenRegistrationNotAllowed
 
 
+async def hash_registration_password(
+    registration_form: Annotated[schemas.UserCreate, Depends(user_create_unique_email)]
+) -> str:
+    return await security.get_password_hash_async(registration_form.password)
+
+
 def register_user(
-    db: DBSession, registration_form: Annotated[schemas.UserCreate, Depends(user_create_unique_email)]
+    db: DBSession,
+    registration_form: Annotated[schemas.UserCreate, Depends(user_create_unique_email)],
+    hashed_password: Annotated[str, Depends(hash_registration_password)],
 ) -> models.User:
     user_in = schemas.UserCreate(email=registration_form.email, password=registration_form.password)
-    new_user = crud.user.create(db, obj_in=user_in)
+    new_user = crud.user.create(db, obj_in=user_in, hashed_password=hashed_password)
     return new_user
 
 
@@ -63,12 +105,12 @@ def create_verification_token(
 
 
 def register_new_user_and_send_verification_email(
+    db: DBSession,
     user: Annotated[models.User, Depends(register_user)],
     token: Annotated[models.VerificationToken, Depends(create_verification_token)],
-    background_tasks: BackgroundTasks,
-    mailer: Mailer,
 ) -> models.User:
-    background_tasks.add_task(mailer.send, send_new_user_email(email_to=user.email, verification_token=token.value))
+    outbox_email.enqueue(db, message=send_new_user_email(email_to=user.email, verification_token=token.value))
+    db.commit()
     return user
 
 
@@ -80,8 +122,18 @@ def verify_account(db: DBSession, token: str) -> None:
     crud.verification_token.remove(db, id_=token_instance.id)
 
 
-def authenticate_and_authorize_user(db: DBSession, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]) -> str:
-    user = crud.user.authenticate_by_mail(db, email=form_data.username, password=form_data.password)
+async def authenticate_and_authorize_user(
+    db: AsyncDBSession, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
+) -> str:
+    login_slots = get_login_slots()
+    try:
+        await asyncio.wait_for(login_slots.acquire(), timeout=settings.LOGIN_QUEUE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError as exc:
+        raise TooManyLoginAttempts from exc
+    try:
+        user = await crud.async_user.authenticate_by_mail(db, email=form_data.username, password=form_data.password)
+    finally:
+        login_slots.release()
     if not user:
         raise InvalidCredentials
     if not crud.user.is_activated(user):
@@ -93,19 +145,15 @@ def authenticate_and_authorize_user(db: DBSession, form_data: Annotated[OAuth2Pa
     return access_token
 
 
-def process_reset_password_request(
-    db: DBSession,
-    password_reset_request: schemas.PasswordResetRequest,
-    background_tasks: BackgroundTasks,
-    mailer: Mailer,
-) -> None:
+def process_reset_password_request(db: DBSession, password_reset_request: schemas.PasswordResetRequest) -> None:
     user = crud.user.get_by_email(db, email=password_reset_request.email)
     if user is None:
         return
     crud.password_reset_token.invalidate_all(db, user_id=user.id)
     token_in = schemas.PasswordResetTokenCreate(user_id=user.id)
     token = crud.password_reset_token.create(db, obj_in=token_in)
-    background_tasks.add_task(mailer.send, send_password_reset_request_mail(email_to=user.email, token=token.value))
+    outbox_email.enqueue(db, message=send_password_reset_request_mail(email_to=user.email, token=token.value))
+    db.commit()
 
 
 def invalidate_password_reset_token(
@@ -118,10 +166,17 @@ def invalidate_password_reset_token(
     return token
 
 
+async def hash_reset_password(password_reset_form: schemas.PasswordResetForm) -> str:
+    return await security.get_password_hash_async(password_reset_form.new_password)
+
+
 def reset_user_password(
     db: DBSession,
     password_reset_form: schemas.PasswordResetForm,
     token: Annotated[models.PasswordResetToken, Depends(invalidate_password_reset_token)],
+    hashed_password: Annotated[str, Depends(hash_reset_password)],
 ) -> None:
     user = user_exists.by_id(db, id_=token.user_id)
-    crud.user.change_password(db, user=user, new_password=password_reset_form.new_password)
+    crud.user.change_password(
+        db, user=user, new_password=password_reset_form.new_password, hashed_password=hashed_password
+    )
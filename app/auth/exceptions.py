@@ -44,3 +44,12 @@ class NotEnoughPermissions(HTTPException):
 class InvalidToken(HTTPException):
     def __init__(self) -> None:
         super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token")
+
+
+class TooManyLoginAttempts(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, try again later",
+            headers={"Retry-After": "1"},
+        )
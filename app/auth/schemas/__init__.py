@@ -1,10 +1,11 @@
 from .password_reset import PasswordResetForm, PasswordResetRequest, PasswordResetTokenCreate
 from .token import Token, TokenPayload
-from .user import User, UserCreate, UserCreateOpen, UserInDB, UserUpdate, UserUpdateWithCurrentPassword
+from .user import Principal, User, UserCreate, UserCreateOpen, UserInDB, UserUpdate, UserUpdateWithCurrentPassword
 from .verification_token import VerificationTokenCreate
 
 __all__ = [
     "User",
+    "Principal",
     "Token",
     "TokenPayload",
     "UserCreate",
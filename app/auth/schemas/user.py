@@ -55,5 +55,11 @@ class User(UserInDBBase):
     pass
 
 
+class Principal(UserInDBBase):
+    """
+    Authenticated user, as cached between requests
+    """
+
+
 class UserInDB(UserInDBBase):
     hashed_password: str
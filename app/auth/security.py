@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Union
 
@@ -6,7 +8,36 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+PASSWORD_HASHING_SCHEMES = ("bcrypt", "argon2")
+
+
+def create_password_context(  # pylint: disable=R0913
+    scheme: str | None = None,
+    *,
+    bcrypt_rounds: int | None = None,
+    argon2_memory_cost: int | None = None,
+    argon2_time_cost: int | None = None,
+    argon2_parallelism: int | None = None,
+) -> CryptContext:
+    """
+    Hash new passwords with the given scheme and cost, falling back to the settings. Hashes made with another scheme
+    or cost still verify, but are reported as needing an update
+    """
+    scheme = scheme or settings.PASSWORD_HASHING_SCHEME
+    bcrypt_rounds = bcrypt_rounds or settings.PASSWORD_BCRYPT_ROUNDS
+    return CryptContext(
+        schemes=[scheme, *(legacy for legacy in PASSWORD_HASHING_SCHEMES if legacy != scheme)],
+        deprecated="auto",
+        bcrypt__default_rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__memory_cost=argon2_memory_cost or settings.PASSWORD_ARGON2_MEMORY_COST_KIB,
+        argon2__time_cost=argon2_time_cost or settings.PASSWORD_ARGON2_TIME_COST,
+        argon2__parallelism=argon2_parallelism or settings.PASSWORD_ARGON2_PARALLELISM,
+    )
+
+
+pwd_context = create_password_context()
 
 
 def create_access_token(subject: Union[str, Any]) -> str:
@@ -20,5 +51,39 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify the password and return a new hash when the stored one was made with an outdated scheme or cost
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def create_password_executor() -> Executor:
+    """
+    Executor dedicated to password hashing, so that bcrypt cannot occupy the threadpool shared by sync endpoints
+    """
+    if settings.PASSWORD_HASHING_EXECUTOR == "process":
+        return ProcessPoolExecutor(max_workers=settings.PASSWORD_HASHING_MAX_WORKERS)
+    return ThreadPoolExecutor(max_workers=settings.PASSWORD_HASHING_MAX_WORKERS, thread_name_prefix="password-hashing")
+
+
+password_executor = create_password_executor()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, verify_and_update_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, get_password_hash, password)
@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.common import schemas
+from app.common.deps import get_current_active_superuser
+from app.db.pool import get_pool_metrics
+from app.db.session import async_engine, engine
+
+router = APIRouter()
+
+
+@router.get("/db-pool", response_model=list[schemas.PoolMetrics], dependencies=[Depends(get_current_active_superuser)])
+def get_db_pool_metrics() -> Any:
+    """
+    Connection pool usage and checkout wait times of the sync and async engines, available only for superusers
+    """
+    return [
+        {"engine": "sync", **get_pool_metrics(engine)},
+        {"engine": "async", **get_pool_metrics(async_engine.sync_engine)},
+    ]
@@ -0,0 +1,6 @@
+from fastapi import APIRouter
+
+from app.common.api.v1.endpoints import metrics
+
+api_router = APIRouter()
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
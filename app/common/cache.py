@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Iterable, Iterator, Protocol, Type
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.common.etag import etag_matches
+from app.core.config import settings
+
+CACHE_STATUS_HEADER = "X-Cache"
+CACHED_HEADERS = ("etag", "cache-control")
+
+
+class CacheBackend(Protocol):  # pragma: no cover
+    def get(self, key: str) -> bytes | None:
+        ...
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        ...
+
+    def delete_prefix(self, prefix: str) -> None:
+        ...
+
+
+class RedisClient(Protocol):  # pragma: no cover
+    def get(self, name: str) -> Any:
+        ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        ...
+
+    def scan_iter(self, match: str | None = None) -> Iterator:
+        ...
+
+    def delete(self, *names: Any) -> Any:
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU cache with per-entry expiration
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class RedisCacheBackend:
+    """
+    Cache stored in Redis (or any server speaking a compatible subset of its API)
+    """
+
+    def __init__(self, client: RedisClient) -> None:
+        self.client = client
+
+    def get(self, key: str) -> bytes | None:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(key, value, ex=ttl)
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self.client.scan_iter(match=f"{prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class NullCacheBackend:
+    def get(self, key: str) -> bytes | None:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    def delete_prefix(self, prefix: str) -> None:
+        pass
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+    if settings.CACHE_BACKEND == "redis":
+        if settings.CACHE_REDIS_URL is None:
+            raise ValueError("CACHE_REDIS_URL is required by the redis cache backend")
+        import redis  # pylint: disable=import-outside-toplevel
+
+        return RedisCacheBackend(redis.Redis.from_url(settings.CACHE_REDIS_URL))
+    if settings.CACHE_BACKEND == "none":
+        return NullCacheBackend()
+    raise ValueError(f"Unknown cache backend '{settings.CACHE_BACKEND}'")
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend, namespace: str, ttl: int) -> None:
+        """
+        Cache of serialized responses, keyed by request path and normalized query parameters
+
+        :param backend: storage for the cached responses
+        :param namespace: prefix of the cache keys, invalidated as a whole
+        :param ttl: lifetime of cached responses in seconds
+        """
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def make_key(self, request: Request) -> str:
+        params = sorted((key, value) for key, value in parse_qsl(request.url.query) if value)
+        return f"{self.namespace}:{request.url.path}?{urlencode(params)}"
+
+    def get(self, key: str) -> tuple[bytes, dict[str, str]] | None:
+        value = self.backend.get(key)
+        if value is None:
+            return None
+        raw_headers, body = value.split(b"\n", 1)
+        return body, json.loads(raw_headers)
+
+    def set(self, key: str, body: bytes, headers: dict[str, str] | None = None) -> None:
+        value = json.dumps(headers or {}).encode() + b"\n" + body
+        self.backend.set(key, value, ttl=self.ttl)
+
+    def invalidate(self) -> None:
+        self.backend.delete_prefix(f"{self.namespace}:")
+
+
+def cached_route_class(cache: ResponseCache) -> Type[APIRoute]:
+    """
+    Create a route class serving anonymous GET requests from the cache, the backend is called from the threadpool as
+    it may do blocking network calls
+    """
+
+    class CachedRoute(APIRoute):
+        def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            handler = super().get_route_handler()
+
+            async def cached_handler(request: Request) -> Response:
+                if request.method != "GET" or "authorization" in request.headers:
+                    return await handler(request)
+                key = cache.make_key(request)
+                cached = await run_in_threadpool(cache.get, key)
+                if cached is not None:
+                    body, headers = cached
+                    headers[CACHE_STATUS_HEADER] = "HIT"
+                    if "etag" in headers and etag_matches(request, headers["etag"]):
+                        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+                    return Response(body, media_type="application/json", headers=headers)
+                response = await handler(request)
+                if response.status_code == status.HTTP_200_OK:
+                    headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+                    await run_in_threadpool(cache.set, key, response.body, headers=headers)
+                    response.headers[CACHE_STATUS_HEADER] = "MISS"
+                return response
+
+            return cached_handler
+
+    return CachedRoute
+
+
+def invalidate_on_commit(cache: ResponseCache, models: Iterable[Type]) -> None:
+    """
+    Invalidate the cache after every committed transaction which inserted, updated or deleted an instance
+    of any of the given models
+    """
+    tracked = tuple(models)
+    flag = f"invalidate_cache:{cache.namespace}"
+
+    def mark_session(session: Session, *_: Any) -> None:
+        changed = (*session.new, *session.dirty, *session.deleted)
+        if any(isinstance(instance, tracked) for instance in changed):
+            session.info[flag] = True
+
+    def invalidate(session: Session) -> None:
+        if session.info.pop(flag, False):
+            cache.invalidate()
+
+    event.listen(Session, "before_flush", mark_session)
+    event.listen(Session, "after_commit", invalidate)
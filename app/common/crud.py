@@ -1,12 +1,18 @@
+import dataclasses
+import functools
+import inspect
 import secrets
-from typing import Any, Generic, Sequence, Type, TypeVar
+import typing
+from typing import Any, Generic, Iterable, Sequence, Type, TypeVar
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Select, func, inspect as sa_inspect, select  # type: ignore[attr-defined]
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.common.schemas import CountMode
 from app.db.base_class import Base
 
 Model = TypeVar("Model", bound=Base)
@@ -15,6 +21,8 @@ UpdateSchema = TypeVar("UpdateSchema", bound=BaseModel)
 
 
 class CRUDBase(Generic[Model, CreateSchema, UpdateSchema]):
+    model: Type[Model]
+
     def __init__(self, model: Type[Model]):
         """
         CRUD object with default methods to Create, Read, Update and Delete
@@ -65,20 +73,155 @@ class CRUDBase(Generic[Model, CreateSchema, UpdateSchema]):
 class SlugMixin(Generic[Model]):
     model: Type[Model]
 
-    def get_by_slug(self, db: Session, slug: str) -> Model | None:
-        query = select(self.model).where(self.model.slug == slug)
+    def get_by_slug(self, db: Session, slug: str, options: Iterable = ()) -> Model | None:
+        query = select(self.model).where(self.model.slug == slug).options(*options)  # type: ignore[attr-defined]
         result = db.execute(query)
+        return result.unique().scalar()
+
+
+class AsyncCRUDBase(Generic[Model, CreateSchema, UpdateSchema]):
+    model: Type[Model]
+
+    def __init__(self, model: Type[Model]):
+        """
+        CRUD object with default methods to Create, Read, Update and Delete, working with an async session
+
+        :param model: a SQLAlchemy model class
+        """
+        self.model = model
+
+    async def get(self, db: AsyncSession, id_: Any) -> Model | None:
+        query = select(self.model).where(self.model.id == id_)
+        result = await db.execute(query)
         return result.scalar()
 
+    async def get_all(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> Sequence[Model]:
+        query = select(self.model).offset(skip).limit(limit)
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchema) -> Model:
+        obj_in_data = jsonable_encoder(obj_in)
+        db_obj = self.model(**obj_in_data)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update(self, db: AsyncSession, *, db_obj: Model, obj_in: UpdateSchema | dict[str, Any]) -> Model:
+        obj_data = jsonable_encoder(obj_in)
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        for field in obj_data:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id_: int) -> Model | None:
+        obj = await self.get(db, id_=id_)
+        await db.delete(obj)
+        await db.commit()
+        return obj
+
+
+class AsyncSlugMixin(Generic[Model]):
+    model: Type[Model]
+
+    async def get_by_slug(self, db: AsyncSession, slug: str, options: Iterable = ()) -> Model | None:
+        query = select(self.model).where(self.model.slug == slug).options(*options)  # type: ignore[attr-defined]
+        result = await db.execute(query)
+        return result.unique().scalar()
+
 
 def generate_unique_token(db: Session, *, token_model: Type[Model], payload: dict[str, Any]) -> Model:
+    """
+    Flush a token with a unique random value, leaving the commit to the caller
+    """
     while True:
         value = secrets.token_urlsafe(64)
         instance = token_model(**payload, value=value)
+        savepoint = db.begin_nested()
         db.add(instance)
         try:
-            db.commit()
+            savepoint.commit()
             break
         except IntegrityError:
-            db.rollback()
+            savepoint.rollback()
     return instance
+
+
+@dataclasses.dataclass
+class RowCount:
+    value: int | None
+    is_exact: bool = True
+
+
+def count_rows(db: Session, query: Select, *, mode: CountMode = CountMode.EXACT, cap: int = 1000) -> RowCount:
+    """
+    Count rows returned by the query
+
+    :param mode: `exact` counts every row, `capped` stops counting after `cap` rows, `estimated` uses the query
+    planner estimate (PostgreSQL only, exact count elsewhere) and `none` skips counting
+    """
+    if mode == CountMode.NONE:
+        return RowCount(value=None, is_exact=False)
+    if mode == CountMode.ESTIMATED and db.get_bind().dialect.name == "postgresql":
+        return RowCount(value=_get_planner_estimate(db, query), is_exact=False)
+    if mode == CountMode.CAPPED:
+        query = query.limit(cap + 1)
+    count_query = select(func.count()).select_from(query.subquery())  # pylint: disable=not-callable
+    count = db.execute(count_query).scalar_one()
+    if mode == CountMode.CAPPED and count > cap:
+        return RowCount(value=cap, is_exact=False)
+    return RowCount(value=count)
+
+
+def _get_planner_estimate(db: Session, query: Select) -> int:
+    compiled = query.compile(dialect=db.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positiontup is not None:
+        params = tuple(params[name] for name in compiled.positiontup)  # type: ignore[assignment]
+    result = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+    plan = result.scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+@functools.lru_cache(maxsize=None)
+def get_loader_options(model: Type[Base], schema: Type[BaseModel]) -> tuple:
+    """
+    Eager loading options for every relationship of the model included in the response schema
+    (joined load for many-to-one relationships, select IN load for collections)
+    """
+    return tuple(_get_loader_options(model, schema, visited=(schema,)))
+
+
+def _get_loader_options(model: Type[Base], schema: Type[BaseModel], visited: tuple) -> list:
+    relationships = sa_inspect(model).relationships
+    options = []
+    for field_name, field in schema.model_fields.items():
+        relationship = relationships.get(field_name)
+        if relationship is None or relationship.lazy == "dynamic":
+            continue
+        attribute = getattr(model, field_name)
+        loader = selectinload(attribute) if relationship.uselist else joinedload(attribute)
+        nested_schema = _get_nested_schema(field.annotation)
+        if nested_schema is not None and nested_schema not in visited:
+            nested = _get_loader_options(relationship.mapper.class_, nested_schema, visited=(*visited, nested_schema))
+            loader = loader.options(*nested)
+        options.append(loader)
+    return options
+
+
+def _get_nested_schema(annotation: Any) -> Type[BaseModel] | None:
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return annotation
+    for argument in typing.get_args(annotation):
+        nested = _get_nested_schema(argument)
+        if nested is not None:
+            return nested
+    return None
@@ -1,16 +1,18 @@
-from typing import Annotated, Generator
+from typing import Annotated, AsyncGenerator, Generator
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.auth import crud, models, schemas
+from app.auth.cache import principal_cache
 from app.auth.exceptions import InvalidCredentials, NotEnoughPermissions, UserDisabled, UserNotActivated, UserNotFound
 from app.common.emails import MailSender, mailer
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal, SessionLocal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 DEFAULT_PAGE_SIZE = 100
@@ -25,19 +27,28 @@ def get_db() -> Generator:
         db.close()
 
 
-def get_current_user(db: "DBSession", token: Annotated[str, Depends(oauth2_scheme)]) -> models.User:
+async def get_async_db() -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_current_user(db: "DBSession", token: Annotated[str, Depends(oauth2_scheme)]) -> schemas.Principal:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         token_data = schemas.TokenPayload(sub=payload["sub"])
     except (jwt.JWTError, ValidationError) as exc:
         raise InvalidCredentials from exc
-    user = crud.user.get(db, id_=token_data.sub)
-    if not user:
-        raise UserNotFound
-    return user
+    principal = principal_cache.get(token_data.sub, token)
+    if principal is None:
+        user = crud.user.get(db, id_=token_data.sub)
+        if not user:
+            raise UserNotFound
+        principal = schemas.Principal.model_validate(user)
+        principal_cache.set(principal, token)
+    return principal
 
 
-def get_current_active_user(current_user: "CurrentUser") -> models.User:
+def get_current_active_user(current_user: "CurrentUser") -> schemas.Principal:
     if not crud.user.is_activated(current_user):
         raise UserNotActivated
     if crud.user.is_disabled(current_user):
@@ -45,12 +56,19 @@ def get_current_active_user(current_user: "CurrentUser") -> models.User:
     return current_user
 
 
-def get_current_active_superuser(current_user: "CurrentActiveUser") -> models.User:
+def get_current_active_superuser(current_user: "CurrentActiveUser") -> schemas.Principal:
     if not crud.user.is_superuser(current_user):
         raise NotEnoughPermissions
     return current_user
 
 
+def get_current_active_user_in_db(db: "DBSession", current_user: "CurrentActiveUser") -> models.User:
+    user = crud.user.get(db, id_=current_user.id)
+    if not user:
+        raise UserNotFound
+    return user
+
+
 class PaginationParams:
     def __init__(self, skip: int = DEFAULT_PAGE_OFFSET, limit: int = DEFAULT_PAGE_SIZE) -> None:
         self.skip = max(skip, 0)
@@ -58,8 +76,10 @@ class PaginationParams:
 
 
 DBSession = Annotated[Session, Depends(get_db)]
-CurrentUser = Annotated[models.User, Depends(get_current_user)]
-CurrentActiveUser = Annotated[models.User, Depends(get_current_active_user)]
-CurrentActiveSuperUser = Annotated[models.User, Depends(get_current_active_superuser)]
+AsyncDBSession = Annotated[AsyncSession, Depends(get_async_db)]
+CurrentUser = Annotated[schemas.Principal, Depends(get_current_user)]
+CurrentActiveUser = Annotated[schemas.Principal, Depends(get_current_active_user)]
+CurrentActiveSuperUser = Annotated[schemas.Principal, Depends(get_current_active_superuser)]
+CurrentActiveUserInDB = Annotated[models.User, Depends(get_current_active_user_in_db)]
 Pagination = Annotated[PaginationParams, Depends()]
 Mailer = Annotated[MailSender, Depends(mailer)]
@@ -1,9 +1,17 @@
+import asyncio
+import dataclasses
 from contextlib import contextmanager
-from pathlib import Path
-from typing import Any, Generator, Protocol
-
-from emails.template import JinjaTemplate
+from email.message import EmailMessage
+from email.utils import formataddr
+from itertools import islice
+from types import TracebackType
+from typing import Any, Generator, Iterable, Protocol, Type
+
+import aiosmtplib
+from fastapi import Request
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
+from fastapi_mail.errors import ConnectionErrors
+from jinja2 import Environment, FileSystemLoader, Template
 
 from app.core.config import settings
 
@@ -17,6 +25,37 @@ class MailEngine(Protocol):  # pragma: no cover
         ...
 
 
+@dataclasses.dataclass
+class Recipient:
+    email: str
+    context: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class BulkSendReport:
+    sent: int = 0
+    failures: dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+class RateLimiter:
+    """
+    Space out calls evenly, so that at most `rate` of them happen per second
+    """
+
+    def __init__(self, rate: float | None) -> None:
+        self.interval = 1 / rate if rate else 0.0
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        delay = self._next_at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._next_at = max(self._next_at, loop.time()) + self.interval
+
+
 class MailSender:
     def __init__(self, engine: MailEngine) -> None:
         self.engine = engine
@@ -24,15 +63,66 @@ class MailSender:
     async def send(self, message: Any) -> None:
         return await self.engine.send_message(message)
 
+    async def send_many(  # pylint: disable=R0913
+        self,
+        recipients: Iterable[Recipient],
+        *,
+        subject: str,
+        template_name: str,
+        batch_size: int | None = None,
+        rate_limit: float | None = None,
+    ) -> BulkSendReport:
+        """
+        Send the template rendered with each recipient's context through the mail engine. Recipients are consumed and
+        rendered lazily, batch by batch. Failures are reported per recipient instead of aborting the send
+        """
+        report = BulkSendReport()
+        limiter = RateLimiter(rate_limit if rate_limit is not None else settings.EMAIL_RATE_LIMIT_PER_SECOND)
+        remaining = iter(recipients)
+        while batch := list(islice(remaining, batch_size or settings.EMAIL_BATCH_SIZE)):
+            messages = [
+                prepare_email([recipient.email], subject, template_name, recipient.context) for recipient in batch
+            ]
+            for recipient, message in zip(batch, messages):
+                await limiter.wait()
+                try:
+                    await self.engine.send_message(message)
+                except (aiosmtplib.SMTPException, OSError, ConnectionErrors) as exc:
+                    report.failures[recipient.email] = repr(exc)
+                else:
+                    report.sent += 1
+        return report
+
     @contextmanager
     def record_messages(self) -> Generator:
         with self.engine.record_messages() as outbox:
             yield outbox
 
 
-def read_template(template_name: str) -> str:
-    with open(Path(settings.EMAIL_TEMPLATES_DIR) / template_name, encoding="utf-8") as file:
-        return file.read()
+class TemplateRegistry:
+    """
+    Compile every email template once, resolving `{% extends %}` through a shared Jinja environment. With auto reload
+    enabled, templates changed on disk are recompiled on next use
+    """
+
+    def __init__(self, directory: str, *, auto_reload: bool = False) -> None:
+        self.environment = Environment(loader=FileSystemLoader(directory), auto_reload=auto_reload, cache_size=-1)
+        self._inline_templates: dict[str, Template] = {}
+
+    def get(self, template_name: str) -> Template:
+        return self.environment.get_template(template_name)
+
+    def render(self, template_name: str, context: dict[str, Any]) -> str:
+        return self.get(template_name).render(context)
+
+    def render_string(self, source: str, context: dict[str, Any]) -> str:
+        template = self._inline_templates.get(source)
+        if template is None:
+            template = self._inline_templates[source] = self.environment.from_string(source)
+        return template.render(context)
+
+
+email_templates = TemplateRegistry(settings.EMAIL_TEMPLATES_DIR, auto_reload=settings.EMAIL_TEMPLATES_AUTO_RELOAD)
 
 
 def prepare_email(
@@ -47,9 +137,8 @@ def prepare_email(
     }
     if context is not None:
         base_context.update(context)
-    subject = JinjaTemplate(subject).render(**base_context)
-    template = read_template(template_name)
-    body = JinjaTemplate(template).render(**base_context)
+    subject = email_templates.render_string(subject, base_context)
+    body = email_templates.render(template_name, base_context)
     message = MessageSchema(
         recipients=email_to,
         subject=subject,
@@ -72,7 +161,70 @@ def get_mailer_config() -> dict[str, Any]:
     }
 
 
-def mailer() -> MailSender:
+def create_mailer() -> MailSender:
     config = ConnectionConfig(**get_mailer_config())  # type: ignore
-    engine = FastMail(config)
-    return MailSender(engine)
+    return MailSender(FastMail(config))
+
+
+def mailer(request: Request) -> MailSender:
+    """
+    Mail sender created once for the application lifetime in the lifespan handler
+    """
+    return request.app.state.mailer
+
+
+class SMTPConnection:
+    """
+    SMTP connection opened on entering the context and reused for every message sent within it
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        hostname: str | None,
+        port: int | None,
+        *,
+        username: str | None = None,
+        password: str | None = None,
+        use_tls: bool = False,
+        start_tls: bool | None = None,
+    ) -> None:
+        self.client = aiosmtplib.SMTP(
+            hostname=hostname,
+            port=port,
+            username=username,
+            password=password,
+            use_tls=use_tls,
+            start_tls=start_tls,
+        )
+
+    @classmethod
+    def from_settings(cls) -> "SMTPConnection":
+        return cls(
+            settings.SMTP_HOST,
+            settings.SMTP_PORT,
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_TLS,
+            start_tls=settings.SMTP_STARTTLS,
+        )
+
+    async def __aenter__(self) -> "SMTPConnection":
+        await self.client.connect()
+        return self
+
+    async def __aexit__(
+        self, exc_type: Type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self.client.is_connected:
+            try:
+                await self.client.quit()
+            except aiosmtplib.SMTPException:
+                self.client.close()
+
+    async def send(self, recipients: list[str], subject: str, body: str, subtype: str = "html") -> None:
+        message = EmailMessage()
+        message["From"] = formataddr((settings.DEFAULT_FROM_NAME, str(settings.DEFAULT_FROM_EMAIL)))
+        message["To"] = ", ".join(recipients)
+        message["Subject"] = subject
+        message.set_content(body, subtype=subtype)
+        await self.client.send_message(message)
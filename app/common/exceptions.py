@@ -14,3 +14,8 @@ class InvalidFilterType(HTTPException):
 class InvalidFilterField(HTTPException):
     def __init__(self) -> None:
         super().__init__(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid filtering field")
+
+
+class InvalidCursor(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid pagination cursor")
@@ -1,29 +1,64 @@
+import base64
+import binascii
 import dataclasses
+import functools
+import json
 from typing import Any, Callable, Iterator
 
-from pydantic import BaseModel
-from sqlalchemy import func
-from sqlalchemy.orm import class_mapper
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, ValidationError
+from sqlalchemy import and_, exists, func, or_, select, tuple_
+from sqlalchemy.orm import with_expression
 
-from app.common.exceptions import InvalidFilterField, InvalidFilterType, InvalidSortField
+from app.common.exceptions import InvalidCursor, InvalidFilterField, InvalidFilterType, InvalidSortField
+from app.common.search import search_match
 
 _OPERATORS_MAP = {
     "lte": lambda model_value, filter_value: model_value <= filter_value,
     "gte": lambda model_value, filter_value: model_value >= filter_value,
     "icontains": lambda model_value, filter_value: func.lower(model_value).contains(func.lower(filter_value)),
     "exact": lambda model_value, filter_value: model_value == filter_value,
+    "search": search_match,
 }
 
 
+_TIEBREAKER_FIELD = "id"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_type_adapter(python_type: type) -> TypeAdapter:
+    return TypeAdapter(python_type)
+
+
 @dataclasses.dataclass
 class ModelFilters:
     """
-    Class for storing SQL Alchemy filters and relationships to include in JOIN statement if needed
+    Class for storing SQL Alchemy filters and relationships to include in JOIN statement if needed. Joined
+    relationships must be many-to-one, so that the join doesn't duplicate rows
     """
 
     statements: list
     related: list
 
+    def extend(self, other: "ModelFilters") -> None:
+        self.statements.extend(other.statements)
+        self.related.extend(other.related)
+
+
+def _encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error) as exc:
+        raise InvalidCursor from exc
+    if not isinstance(payload, dict) or not isinstance(payload.get("values"), list):
+        raise InvalidCursor
+    return payload
+
 
 def _get_filter_function(filter_type: str) -> Callable:
     filter_function = _OPERATORS_MAP.get(filter_type)
@@ -35,6 +70,8 @@ def _get_filter_function(filter_type: str) -> Callable:
 class BaseFilter(BaseModel):
     class Constants:
         model: Any
+        # lookups specific to the model, in addition to the common ones
+        lookups: dict[str, Callable] = {}
 
     @property
     def filters(self) -> ModelFilters:
@@ -45,24 +82,19 @@ class BaseFilter(BaseModel):
             field_name, *nested, lookup = key.split("__")
             nested_field_name = nested[0] if nested else None
             filter_ = self._get_filter(lookup, field_name, nested_field_name, value)
+            if nested_field_name is not None:
+                relationship = self._get_field_reference(field_name=field_name)
+                if relationship.property.uselist:
+                    filter_ = self._get_collection_filter(relationship, filter_)
+                else:
+                    models_to_join.append(relationship)
             filters.append(filter_)
-            if nested_field_name:
-                to_join = self._get_model_to_join(field_name)
-                models_to_join.append(to_join)
         return ModelFilters(statements=filters, related=models_to_join)
 
     def _get_filter(self, lookup: str, field_name: str, nested_field_name: str | None, filter_value: Any) -> Any:
-        filter_function = _get_filter_function(lookup)
+        filter_function = getattr(self.Constants, "lookups", {}).get(lookup) or _get_filter_function(lookup)
         model_field = self._get_field_reference(field_name, nested_field_name)
-        filter_ = filter_function(model_field, filter_value)
-        is_many_to_many = self._check_if_many_to_many(field_name)
-        if not is_many_to_many:
-            return filter_
-        wrapped_filter = self._get_many_to_many_filter(field_name, filter_)
-        return wrapped_filter
-
-    def _get_model_to_join(self, field_name: str) -> Any:
-        return getattr(self.Constants.model, field_name)
+        return filter_function(model_field, filter_value)
 
     def _get_field_reference(self, field_name: str, nested_field_name: str | None = None) -> Any:
         if nested_field_name is not None:
@@ -79,23 +111,47 @@ class BaseFilter(BaseModel):
             raise InvalidFilterField
         return getattr(relationship.mapper.class_, nested_field_name)
 
-    def _check_if_many_to_many(self, field_name: str) -> bool:
-        mapper = class_mapper(self.Constants.model)
-        field = mapper.get_property(field_name)
-        secondary = getattr(field, "secondary", None)
-        return secondary is not None
-
-    def _get_many_to_many_filter(self, relation_name: str, filter_: Callable) -> Callable:
-        field = self._get_field_reference(field_name=relation_name)
-        return field.any(filter_)
+    def _get_collection_filter(self, relationship: Any, filter_: Any) -> Any:
+        """
+        Correlated EXISTS over the related rows, so that the filtered query needs neither a join nor DISTINCT
+        (many-to-one relationships are joined instead, as they cannot duplicate rows). Through an association table,
+        the related rows are matched once using their own indexes, and the EXISTS only probes the association table
+        """
+        relationship_property = relationship.property
+        if relationship_property.secondary is None:
+            return relationship.any(filter_)
+        ((parent_column, parent_key),) = relationship_property.synchronize_pairs
+        ((related_column, related_key),) = relationship_property.secondary_synchronize_pairs
+        # OFFSET 0 keeps the planner from flattening the subquery into a check of the related rows for every row
+        matching = select(related_column).where(filter_).offset(0)
+        return exists().where(parent_key == parent_column, related_key.in_(matching))
 
 
 class BaseSorter(BaseModel):
     sort_by: str | None = None
+    _expressions: dict[str, Any] = PrivateAttr(default_factory=dict)
 
     class Constants:
         model: Any
         order_by_fields: list[str]
+        # query expression attributes of the model, sortable once annotated
+        annotated_fields: list[str] = []
+
+    def annotate(self, field: str, expression: Any) -> None:
+        """
+        Provide the SQL expression computing an annotated field, e.g. search relevance
+        """
+        self._expressions[field] = expression
+
+    @property
+    def options(self) -> list:
+        """
+        Loader options filling annotated fields of the fetched instances, needed to build cursors
+        """
+        return [
+            with_expression(getattr(self.Constants.model, field), expression)
+            for field, expression in self._expressions.items()
+        ]
 
     @property
     def order_by(self) -> list:
@@ -104,11 +160,61 @@ class BaseSorter(BaseModel):
             return ordering_rules
         sortable_fields = self._get_sortable_fields(self.sort_by)
         for field, descending in sortable_fields:
-            model_field = getattr(self.Constants.model, field)
+            model_field = self._get_column(field)
             rule = model_field.desc() if descending else model_field.asc()
             ordering_rules.append(rule)
         return ordering_rules
 
+    @property
+    def keyset_fields(self) -> list[tuple[str, bool]]:
+        """
+        Sorting fields with the primary key appended as a tiebreaker, so that the ordering is total
+        """
+        fields = list(self._get_sortable_fields(self.sort_by)) if self.sort_by else []
+        if _TIEBREAKER_FIELD not in (field for field, _ in fields):
+            fields.append((_TIEBREAKER_FIELD, False))
+        return fields
+
+    @property
+    def keyset_order_by(self) -> list:
+        ordering_rules = []
+        for field, descending in self.keyset_fields:
+            model_field = self._get_column(field)
+            ordering_rules.append(model_field.desc() if descending else model_field.asc())
+        return ordering_rules
+
+    def get_cursor(self, instance: Any) -> str:
+        values = [getattr(instance, field) for field, _ in self.keyset_fields]
+        return _encode_cursor({"sort_by": self.sort_by or "", "values": values})
+
+    def get_cursor_filter(self, cursor: str) -> Any:
+        """
+        Build a condition matching rows placed after the cursor in the keyset ordering
+        """
+        payload = _decode_cursor(cursor)
+        fields = self.keyset_fields
+        if payload.get("sort_by") != (self.sort_by or "") or len(payload["values"]) != len(fields):
+            raise InvalidCursor
+        columns = [self._get_column(field) for field, _ in fields]
+        values = [self._parse_cursor_value(column, value) for column, value in zip(columns, payload["values"])]
+        directions = {descending for _, descending in fields}
+        if len(directions) == 1:
+            row, cursor_row = tuple_(*columns), tuple_(*values)
+            return row < cursor_row if directions.pop() else row > cursor_row
+        conditions = []
+        equal_prefix: list = []
+        for column, value, (_, descending) in zip(columns, values, fields):
+            comparison = column < value if descending else column > value
+            conditions.append(and_(*equal_prefix, comparison))
+            equal_prefix.append(column == value)
+        return or_(*conditions)
+
+    def _parse_cursor_value(self, column: Any, value: Any) -> Any:
+        try:
+            return _get_type_adapter(column.type.python_type).validate_python(value)
+        except ValidationError as exc:
+            raise InvalidCursor from exc
+
     def _get_sortable_fields(self, fields_raw: str) -> Iterator[tuple[str, bool]]:
         fields_list = fields_raw.split(",")
         for field in fields_list:
@@ -116,4 +222,12 @@ class BaseSorter(BaseModel):
             field_name = field[1:] if descending else field
             if field_name not in self.Constants.order_by_fields:
                 raise InvalidSortField
+            if field_name in getattr(self.Constants, "annotated_fields", ()) and field_name not in self._expressions:
+                raise InvalidSortField
             yield field_name, descending
+
+    def _get_column(self, field: str) -> Any:
+        expression = self._expressions.get(field)
+        if expression is not None:
+            return expression
+        return getattr(self.Constants.model, field)
@@ -0,0 +1,62 @@
+import dataclasses
+import math
+from typing import Any
+
+from sqlalchemy import and_, func, or_
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@dataclasses.dataclass
+class BoundingBox:
+    """
+    Coordinates range containing every point within a radius, longitudes are None when the range covers a pole
+    """
+
+    min_latitude: float
+    max_latitude: float
+    min_longitude: float | None = None
+    max_longitude: float | None = None
+
+    @classmethod
+    def around(cls, latitude: float, longitude: float, radius_km: float) -> "BoundingBox":
+        angular_radius = radius_km / EARTH_RADIUS_KM
+        delta_latitude = math.degrees(angular_radius)
+        box = cls(max(latitude - delta_latitude, -90.0), min(latitude + delta_latitude, 90.0))
+        if box.min_latitude == -90.0 or box.max_latitude == 90.0:
+            return box
+        sine = math.sin(angular_radius) / math.cos(math.radians(latitude))
+        if sine >= 1:
+            return box
+        delta_longitude = math.degrees(math.asin(sine))
+        box.min_longitude, box.max_longitude = longitude - delta_longitude, longitude + delta_longitude
+        return box
+
+    def contains(self, latitude_column: Any, longitude_column: Any) -> Any:
+        condition = latitude_column.between(self.min_latitude, self.max_latitude)
+        if self.min_longitude is None or self.max_longitude is None:
+            return condition
+        if self.min_longitude < -180.0:
+            longitude_condition = or_(
+                longitude_column >= self.min_longitude + 360, longitude_column <= self.max_longitude
+            )
+        elif self.max_longitude > 180.0:
+            longitude_condition = or_(
+                longitude_column >= self.min_longitude, longitude_column <= self.max_longitude - 360
+            )
+        else:
+            longitude_condition = longitude_column.between(self.min_longitude, self.max_longitude)
+        return and_(condition, longitude_condition)
+
+
+def haversine_distance(latitude_column: Any, longitude_column: Any, latitude: float, longitude: float) -> Any:
+    """
+    Great-circle distance in kilometers between the point in the columns and the given one
+    """
+    delta_latitude = func.radians(latitude_column - latitude) / 2
+    delta_longitude = func.radians(longitude_column - longitude) / 2
+    haversine = func.power(func.sin(delta_latitude), 2) + math.cos(math.radians(latitude)) * func.cos(
+        func.radians(latitude_column)
+    ) * func.power(func.sin(delta_longitude), 2)
+    # rounding errors could push the sine above 1 for antipodal points
+    return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(haversine)))
@@ -0,0 +1,106 @@
+import dataclasses
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator
+
+from sqlalchemy import Engine, event  # type: ignore[attr-defined]
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.loggers import logger
+
+_START_TIMES_KEY = "query_start_times"
+
+
+@dataclasses.dataclass
+class QueryStats:
+    count: int = 0
+    total_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+    statements: list[str] = dataclasses.field(default_factory=list)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.statements.append(statement)
+        if self.slowest_statement is None or duration > self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn: Any, *_: Any) -> None:
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *_: Any) -> None:
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement executed through the engine and record it in the stats of the current request
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Generator[QueryStats, None, None]:
+    """
+    Collect stats of the statements executed by instrumented engines within the block
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def format_server_timing(stats: QueryStats) -> str:
+    return (
+        f'db;dur={stats.total_time * 1000:.2f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_time * 1000:.2f}"
+    )
+
+
+class QueryStatsMiddleware:
+    """
+    Report the number of SQL statements, total database time and the slowest statement of every request
+    in the Server-Timing header and the application log
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_server_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", format_server_timing(stats))
+                await send(message)
+
+            await self.app(scope, receive, send_with_server_timing)
+
+        logger.info(
+            f"method={scope['method']} path={scope['path']} queries={stats.count} "
+            f"db_time_ms={stats.total_time * 1000:.2f} slowest_ms={stats.slowest_time * 1000:.2f} "
+            f"slowest_statement={stats.slowest_statement!r}"
+        )
@@ -1,8 +1,64 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Any
 
-from sqlalchemy.orm import mapped_column  # type: ignore[attr-defined]
+from sqlalchemy import JSON, Index, Text, event, text
+from sqlalchemy.orm import Mapped, Session, mapped_column  # type: ignore[attr-defined]
+
+from app.db.base_class import Base
 
 IntPk = Annotated[int, mapped_column(primary_key=True, index=True)]
 UniqueIndexedStr = Annotated[str, mapped_column(unique=True, index=True, nullable=False)]
 BoolFalse = Annotated[bool, mapped_column(default=False)]
 BoolTrue = Annotated[bool, mapped_column(default=True)]
+UpdatedAt = Annotated[
+    datetime,
+    mapped_column(
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        server_default=text("timezone('utc', now())"),
+    ),
+]
+
+
+@event.listens_for(Session, "before_flush")
+def touch_modified_instances(session: Session, *_: Any) -> None:
+    """
+    Bump `updated_at` also when only a collection (e.g. many-to-many relationship) of the instance has changed,
+    in which case no UPDATE of its own row would be emitted
+    """
+    for instance in session.dirty:
+        if hasattr(instance, "updated_at") and session.is_modified(instance):
+            instance.updated_at = datetime.utcnow()
+
+
+class OutboxEmail(Base):
+    """
+    Email waiting to be delivered by the outbox worker, kept after delivery for auditing
+    """
+
+    id: Mapped[IntPk]
+    recipients: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    subject: Mapped[str]
+    body: Mapped[str] = mapped_column(Text)
+    subtype: Mapped[str] = mapped_column(default="html")
+    attempts: Mapped[int] = mapped_column(default=0)
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(nullable=False, default=datetime.utcnow)
+    next_attempt_at: Mapped[datetime] = mapped_column(nullable=False, default=datetime.utcnow)
+    sent_at: Mapped[datetime | None]
+
+    __table_args__ = (Index("ix_outboxemail_pending", "next_attempt_at", postgresql_where=text("sent_at IS NULL")),)
+
+    def __str__(self) -> str:
+        return f"{self.subject} to {', '.join(self.recipients)}"
+
+
+class ImportCheckpoint(Base):
+    """
+    Progress of a streamed data import, committed in the same transaction as every imported batch
+    """
+
+    source: Mapped[str] = mapped_column(primary_key=True)
+    rows: Mapped[int] = mapped_column(default=0)
+    tables: Mapped[list[str]] = mapped_column(JSON, default=list)
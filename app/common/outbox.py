@@ -0,0 +1,140 @@
+import asyncio
+import dataclasses
+from datetime import datetime, timedelta
+from typing import Callable, Sequence
+
+import aiosmtplib
+from fastapi_mail import MessageSchema
+from pydantic import BaseModel
+from sqlalchemy import select  # type: ignore[attr-defined]
+from sqlalchemy.orm import Session
+
+from app.common.crud import CRUDBase
+from app.common.emails import SMTPConnection
+from app.common.models import OutboxEmail
+from app.core.config import settings
+from app.loggers import logger
+
+
+class CRUDOutboxEmail(CRUDBase[OutboxEmail, BaseModel, BaseModel]):
+    def enqueue(self, db: Session, *, message: MessageSchema) -> OutboxEmail:
+        """
+        Add the email to the session, the caller commits it together with the changes the email reports
+        """
+        db_obj = self.model(
+            recipients=[str(recipient) for recipient in message.recipients],
+            subject=message.subject,
+            body=message.body,
+            subtype=message.subtype.value,
+        )
+        db.add(db_obj)
+        return db_obj
+
+    def claim_pending(self, db: Session, *, limit: int) -> Sequence[OutboxEmail]:
+        """
+        Lock a batch of emails due for delivery, skipping the ones already claimed by another worker
+        """
+        query = (
+            select(self.model)
+            .where(
+                self.model.sent_at.is_(None),
+                self.model.attempts < settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+                self.model.next_attempt_at <= datetime.utcnow(),
+            )
+            .order_by(self.model.next_attempt_at, self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = db.execute(query)
+        return result.scalars().all()
+
+    def mark_sent(self, email: OutboxEmail) -> None:
+        email.attempts += 1
+        email.sent_at = datetime.utcnow()
+        email.last_error = None
+
+    def mark_failed(self, email: OutboxEmail, error: Exception) -> None:
+        email.attempts += 1
+        email.last_error = repr(error)
+        backoff = settings.EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS * 2 ** (email.attempts - 1)
+        email.next_attempt_at = datetime.utcnow() + timedelta(seconds=backoff)
+
+    def postpone(self, email: OutboxEmail, error: Exception) -> None:
+        """
+        Retry the email later without using up an attempt, as it was never offered to the SMTP server
+        """
+        email.last_error = repr(error)
+        email.next_attempt_at = datetime.utcnow() + timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS)
+
+
+outbox_email = CRUDOutboxEmail(OutboxEmail)
+
+
+@dataclasses.dataclass
+class DeliveryReport:
+    sent: int = 0
+    failed: int = 0
+    postponed: int = 0
+
+    @property
+    def claimed(self) -> int:
+        return self.sent + self.failed + self.postponed
+
+
+async def deliver_pending_emails(
+    db: Session,
+    *,
+    batch_size: int,
+    connect: Callable[[], SMTPConnection] = SMTPConnection.from_settings,
+) -> DeliveryReport:
+    """
+    Send one batch of due emails over a single SMTP connection. Emails rejected by the server are retried with
+    exponential backoff until they run out of attempts, connection failures only postpone the remaining emails
+    """
+    report = DeliveryReport()
+    emails = list(outbox_email.claim_pending(db, limit=batch_size))
+    try:
+        if emails:
+            async with connect() as connection:
+                while emails:
+                    email = emails[0]
+                    try:
+                        await connection.send(email.recipients, email.subject, email.body, email.subtype)
+                    except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPResponseException) as exc:
+                        logger.warning(f"Sending email {email.id} failed: {exc!r}")
+                        outbox_email.mark_failed(email, exc)
+                        report.failed += 1
+                    else:
+                        outbox_email.mark_sent(email)
+                        report.sent += 1
+                    emails.pop(0)
+    except (aiosmtplib.SMTPException, OSError) as exc:
+        logger.warning(f"SMTP connection failed: {exc!r}")
+        for email in emails:
+            outbox_email.postpone(email, exc)
+            report.postponed += 1
+    db.commit()
+    return report
+
+
+async def run_outbox_worker(
+    session_factory: Callable[[], Session],
+    *,
+    batch_size: int,
+    poll_interval: float,
+    once: bool = False,
+) -> None:
+    """
+    Drain the outbox batch by batch, waiting for new emails once it is empty
+    """
+    while True:
+        with session_factory() as db:
+            report = await deliver_pending_emails(db, batch_size=batch_size)
+        if report.claimed:
+            logger.info(
+                f"Outbox batch delivered ({report.sent} sent, {report.failed} failed, " f"{report.postponed} postponed)"
+            )
+        if report.claimed < batch_size:
+            if once:
+                return
+            await asyncio.sleep(poll_interval)
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel
@@ -13,6 +14,28 @@ class EmptySchema(BaseModel):
     pass
 
 
+class CountMode(str, Enum):
+    EXACT = "exact"
+    CAPPED = "capped"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 class Paginated(BaseModel, Generic[M]):
     items: list[M]
-    total_count: int
+    total_count: int | None
+    is_total_count_exact: bool = True
+    next_cursor: str | None = None
+
+
+class PoolMetrics(BaseModel):
+    engine: str
+    pool_class: str
+    size: int | None = None
+    checked_in: int | None = None
+    in_use: int | None = None
+    overflow: int | None = None
+    checkouts: int | None = None
+    checkout_timeouts: int | None = None
+    checkout_wait_avg_ms: float | None = None
+    checkout_wait_max_ms: float | None = None
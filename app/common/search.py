@@ -0,0 +1,89 @@
+import re
+from typing import Any
+
+from sqlalchemy import Boolean, ColumnClause, Float, Index, case, cast, func, literal_column, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+# dictionary without stemming, there is no built-in one for Polish
+SEARCH_CONFIG = "simple"
+
+
+def search_index(name: str, column_name: str) -> Index:
+    """
+    GIN index over the text search vector of the column, serving `search` lookups on PostgreSQL
+    """
+    return Index(name, text(f"to_tsvector('{SEARCH_CONFIG}', {column_name})"), postgresql_using="gin")
+
+
+def to_prefix_query(term: str) -> str:
+    """
+    Text search query matching documents with words starting with every word of the term
+    """
+    return " & ".join(f"{word}:*" for word in re.findall(r"\w+", term))
+
+
+class _SearchFunction(FunctionElement):  # pylint: disable=W0223
+    inherit_cache = True
+
+    def __init__(self, column: Any, term: str) -> None:
+        super().__init__(column, term, to_prefix_query(term))
+
+
+class SearchMatch(_SearchFunction):  # pylint: disable=W0223
+    type = Boolean()
+    inherit_cache = True
+
+
+class SearchRank(_SearchFunction):  # pylint: disable=W0223
+    type = Float(53)
+    inherit_cache = True
+
+
+def search_match(column: Any, term: str) -> SearchMatch:
+    """
+    Whether the column contains words starting with every word of the term
+    """
+    return SearchMatch(column, term)
+
+
+def search_rank(column: Any, term: str) -> SearchRank:
+    """
+    Relevance of the column for the search term, higher for better matches
+    """
+    return SearchRank(column, term)
+
+
+def _get_vector_and_query(element: _SearchFunction) -> tuple[Any, Any]:
+    column, _, query = element.clauses
+    config: ColumnClause[str] = literal_column(f"'{SEARCH_CONFIG}'")
+    return func.to_tsvector(config, column), func.to_tsquery(config, query)
+
+
+def _contains(element: _SearchFunction) -> Any:
+    column, term, _ = element.clauses
+    return func.lower(column).contains(func.lower(term))
+
+
+@compiles(SearchMatch)
+def _compile_search_match(element: SearchMatch, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return compiler.process(_contains(element).self_group(), **kwargs)
+
+
+@compiles(SearchMatch, "postgresql")
+def _compile_search_match_postgresql(element: SearchMatch, compiler: SQLCompiler, **kwargs: Any) -> str:
+    vector, query = _get_vector_and_query(element)
+    return compiler.process(vector.op("@@")(query), **kwargs)
+
+
+@compiles(SearchRank)
+def _compile_search_rank(element: SearchRank, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return compiler.process(case((_contains(element), 1.0), else_=0.0), **kwargs)
+
+
+@compiles(SearchRank, "postgresql")
+def _compile_search_rank_postgresql(element: SearchRank, compiler: SQLCompiler, **kwargs: Any) -> str:
+    vector, query = _get_vector_and_query(element)
+    # ts_rank returns real, compared with a double precision cursor value ties would never match exactly
+    return compiler.process(cast(func.ts_rank(vector, query), Float(53)), **kwargs)
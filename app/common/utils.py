@@ -1,17 +1,31 @@
-from typing import Annotated, Any, Generic, Sequence, TypeVar, Union
+from typing import Annotated, Any, Generic, Sequence, Type, TypeVar, Union
 
 from fastapi import Path
+from pydantic import BaseModel
 
-from app.common.crud import CRUDBase, Model, SlugMixin
-from app.common.deps import DBSession
+from app.common.crud import AsyncCRUDBase, AsyncSlugMixin, CRUDBase, Model, SlugMixin, get_loader_options
+from app.common.deps import AsyncDBSession, DBSession
+from app.db.base_class import Base
 
 CRUD = TypeVar("CRUD", bound=Union[CRUDBase, SlugMixin])
+AsyncCRUD = TypeVar("AsyncCRUD", bound=Union[AsyncCRUDBase, AsyncSlugMixin])
 
 
 class InstanceInDBValidator(Generic[Model, CRUD]):
-    def __init__(self, crud_service: CRUD, exception: Exception) -> None:
+    def __init__(self, crud_service: CRUD, exception: Exception, schema: Type[BaseModel] | None = None) -> None:
+        """
+        :param schema: response schema whose relationships are eager loaded when retrieving the instance by slug
+        """
         self.crud_service = crud_service
         self.exception = exception
+        self.schema = schema
+
+    @property
+    def loader_options(self) -> tuple:
+        if self.schema is None:
+            return ()
+        model: Type[Base] = self.crud_service.model
+        return get_loader_options(model, self.schema)
 
     def instance_or_404(self, instance: Model | None) -> Model:
         if not instance:
@@ -27,7 +41,7 @@ class InstanceInDBValidator(Generic[Model, CRUD]):
     def by_slug(self, db: DBSession, slug: str) -> Model:
         if not hasattr(self.crud_service, "get_by_slug"):
             raise NotImplementedError("CRUD service does not implement retrieving by slug")
-        instance = self.crud_service.get_by_slug(db, slug=slug)
+        instance = self.crud_service.get_by_slug(db, slug=slug, options=self.loader_options)
         return self.instance_or_404(instance)
 
     def by_token(self, db: DBSession, token: str) -> Model:
@@ -37,5 +51,47 @@ class InstanceInDBValidator(Generic[Model, CRUD]):
         return self.instance_or_404(instance)
 
 
-def paginate(items: Sequence, count: int) -> dict[str, Any]:
-    return {"items": items, "total_count": count}
+class AsyncInstanceInDBValidator(Generic[Model, AsyncCRUD]):
+    def __init__(self, crud_service: AsyncCRUD, exception: Exception, schema: Type[BaseModel] | None = None) -> None:
+        """
+        :param schema: response schema whose relationships are eager loaded when retrieving the instance by slug,
+        required for any relationship included in the response, as async sessions cannot lazy load
+        """
+        self.crud_service = crud_service
+        self.exception = exception
+        self.schema = schema
+
+    @property
+    def loader_options(self) -> tuple:
+        if self.schema is None:
+            return ()
+        model: Type[Base] = self.crud_service.model
+        return get_loader_options(model, self.schema)
+
+    def instance_or_404(self, instance: Model | None) -> Model:
+        if not instance:
+            raise self.exception
+        return instance
+
+    async def by_id(self, db: AsyncDBSession, id_: Annotated[int, Path(default=..., alias="id")]) -> Model:
+        if not hasattr(self.crud_service, "get"):
+            raise NotImplementedError("CRUD service does not implement retrieving by id")
+        instance = await self.crud_service.get(db, id_=id_)
+        return self.instance_or_404(instance)
+
+    async def by_slug(self, db: AsyncDBSession, slug: str) -> Model:
+        if not hasattr(self.crud_service, "get_by_slug"):
+            raise NotImplementedError("CRUD service does not implement retrieving by slug")
+        instance = await self.crud_service.get_by_slug(db, slug=slug, options=self.loader_options)
+        return self.instance_or_404(instance)
+
+
+def paginate(
+    items: Sequence, count: int | None, next_cursor: str | None = None, is_count_exact: bool = True
+) -> dict[str, Any]:
+    return {
+        "items": items,
+        "total_count": count,
+        "is_total_count_exact": is_count_exact,
+        "next_cursor": next_cursor,
+    }
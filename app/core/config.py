@@ -1,6 +1,6 @@
 # pylint: disable=invalid-name,no-self-argument
 import re
-from typing import Callable
+from typing import Callable, Literal
 
 from pydantic import EmailStr, field_validator
 from pydantic_core.core_schema import FieldValidationInfo
@@ -19,6 +19,13 @@ class Settings(BaseSettings):
     ADMIN_PANEL_PATH: str
     SQLALCHEMY_DATABASE_URI: str
     SQLALCHEMY_TEST_DATABASE_URI: str
+    SQLALCHEMY_POOL_SIZE: int = 5
+    SQLALCHEMY_MAX_OVERFLOW: int = 10
+    SQLALCHEMY_POOL_TIMEOUT_SECONDS: float = 30
+    SQLALCHEMY_POOL_RECYCLE_SECONDS: int = 1800
+    SQLALCHEMY_POOL_PRE_PING: bool = True
+    SQLALCHEMY_STATEMENT_TIMEOUT_MS: int | None = None
+    SQLALCHEMY_PGBOUNCER_MODE: bool = False
 
     CORS_ALLOWED_ORIGINS: list[str] = ["http://localhost:3000"]
 
@@ -26,8 +33,28 @@ class Settings(BaseSettings):
     FIRST_SUPERUSER_EMAIL: str
     FIRST_SUPERUSER_PASSWORD: str
 
+    PAGINATION_COUNT_CAP: int = 1000
+
+    QUERY_INSTRUMENTATION_ENABLED: bool = False
+
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    CACHE_REDIS_URL: str | None = None
+    CACHE_MAX_ENTRIES: int = 1024
+    CATALOG_CACHE_TTL_SECONDS: int = 60
+    CATALOG_CACHE_CONTROL: str = "public, max-age=60"
+
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 60
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PASSWORD_HASHING_SCHEME: Literal["bcrypt", "argon2"] = "bcrypt"
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_MEMORY_COST_KIB: int = 65536
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_PARALLELISM: int = 4
+    PASSWORD_HASHING_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASHING_MAX_WORKERS: int = 2
+    LOGIN_CONCURRENCY_LIMIT: int = 8
+    LOGIN_QUEUE_TIMEOUT_SECONDS: float = 5
     JWT_ALGORITHM: str = "HS256"
     PASSWORD_MIN_LENGTH: int = _PASSWORD_MIN_LENGTH
     PASSWORD_RULES: dict[Callable, str] = {
@@ -58,6 +85,13 @@ class Settings(BaseSettings):
 
     EMAILS_ENABLED: bool = True
     EMAIL_TEMPLATES_DIR: str = "/app/app/email_templates/"
+    EMAIL_TEMPLATES_AUTO_RELOAD: bool = False
+    EMAIL_BATCH_SIZE: int = 100
+    EMAIL_RATE_LIMIT_PER_SECOND: float | None = 10
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS: float = 30
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: float = 5
 
     @field_validator("EMAILS_ENABLED")
     def get_emails_enabled(cls, v: bool, info: FieldValidationInfo) -> bool:
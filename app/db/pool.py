@@ -0,0 +1,84 @@
+import dataclasses
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import Engine, event  # type: ignore[attr-defined]
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+
+@dataclasses.dataclass
+class CheckoutStats:
+    count: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.count += 1
+            self.timeouts += timed_out
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+
+class TimedCheckoutMixin:
+    """
+    Measure how long callers wait for a connection to be checked out of the pool
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self.checkout_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.checkout_stats.record(time.perf_counter() - start)
+        return connection
+
+
+class TimedQueuePool(TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_metrics(engine: Engine) -> dict[str, Any]:
+    pool = engine.pool
+    metrics: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            in_use=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    stats = getattr(pool, "checkout_stats", None)
+    if stats is not None:
+        metrics.update(
+            checkouts=stats.count,
+            checkout_timeouts=stats.timeouts,
+            checkout_wait_avg_ms=stats.total_wait / stats.count * 1000 if stats.count else 0.0,
+            checkout_wait_max_ms=stats.max_wait * 1000,
+        )
+    return metrics
+
+
+def set_local_statement_timeout(engine: Engine, timeout_ms: int) -> None:
+    """
+    Apply the statement timeout to every transaction, which unlike connection options is safe behind
+    a transaction pooling PgBouncer
+    """
+
+    @event.listens_for(engine, "begin")
+    def set_statement_timeout(connection: Any) -> None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
@@ -1,7 +1,53 @@
-from sqlalchemy import create_engine
+from typing import Any
+
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.db.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, set_local_statement_timeout
+
+
+def get_engine_options(*, is_async: bool = False) -> dict[str, Any]:
+    """
+    Pool and connection options of the engine
+
+    In PgBouncer mode connections are not pooled by the application, asyncpg prepared statement caches
+    are disabled as prepared statements do not survive transaction pooling and the statement timeout
+    is set per transaction instead of per connection
+    """
+    connect_args: dict[str, Any] = {}
+    if settings.SQLALCHEMY_PGBOUNCER_MODE:
+        if is_async:
+            connect_args.update(statement_cache_size=0, prepared_statement_cache_size=0)
+        return {"poolclass": NullPool, "connect_args": connect_args}
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+    timeout = settings.SQLALCHEMY_STATEMENT_TIMEOUT_MS
+    if timeout is not None and is_async:
+        connect_args["server_settings"] = {"statement_timeout": str(timeout)}
+    elif timeout is not None:
+        connect_args["options"] = f"-c statement_timeout={timeout}"
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.SQLALCHEMY_POOL_SIZE,
+        "max_overflow": settings.SQLALCHEMY_MAX_OVERFLOW,
+        "pool_timeout": settings.SQLALCHEMY_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.SQLALCHEMY_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.SQLALCHEMY_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, **get_engine_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_engine(
+    make_url(settings.SQLALCHEMY_DATABASE_URI).set(drivername="postgresql+asyncpg"),
+    **get_engine_options(is_async=True),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.SQLALCHEMY_PGBOUNCER_MODE and settings.SQLALCHEMY_STATEMENT_TIMEOUT_MS is not None:
+    set_local_statement_timeout(engine, settings.SQLALCHEMY_STATEMENT_TIMEOUT_MS)
+    set_local_statement_timeout(async_engine.sync_engine, settings.SQLALCHEMY_STATEMENT_TIMEOUT_MS)
@@ -2,11 +2,12 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends
 
-from app.common.deps import DBSession
+from app.common.deps import AsyncDBSession, DBSession
 from app.events import crud, schemas
+from app.events.cache import CachedCatalogRoute
 from app.events.deps import event_type_exists
 
-router = APIRouter()
+router = APIRouter(route_class=CachedCatalogRoute)
 
 
 @router.get("/", response_model=list[schemas.EventTypeNode])
@@ -19,7 +20,7 @@ def list_event_types(db: DBSession) -> Any:
 
 
 @router.get("/{slug}", response_model=schemas.EventType)
-def get_event_type_by_slug(event_type: Annotated[schemas.EventType, Depends(event_type_exists.by_slug)]) -> Any:
+async def get_event_type_by_slug(event_type: Annotated[schemas.EventType, Depends(event_type_exists.by_slug)]) -> Any:
     """
     Read event type by slug
     """
@@ -27,11 +28,11 @@ def get_event_type_by_slug(event_type: Annotated[schemas.EventType, Depends(even
 
 
 @router.get("/{slug}/hierarchy", response_model=list[schemas.EventType])
-def get_event_type_hierarchy_by_slug(
-    db: DBSession, event_type: Annotated[schemas.EventType, Depends(event_type_exists.by_slug)]
+async def get_event_type_hierarchy_by_slug(
+    db: AsyncDBSession, event_type: Annotated[schemas.EventType, Depends(event_type_exists.by_slug)]
 ) -> Any:
     """
     Get event type hierarchy from the top node to the given event type
     """
-    event_types = crud.event_type.get_event_type_parent_hierarchy(db, event_type_id=event_type.id)
+    event_types = await crud.async_event_type.get_event_type_parent_hierarchy(db, event_type_id=event_type.id)
     return event_types
@@ -1,47 +1,96 @@
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
-from app.common.deps import DBSession, Pagination
-from app.common.schemas import Paginated
+from app.common.crud import get_loader_options
+from app.common.deps import AsyncDBSession, Pagination
+from app.common.etag import conditional_response, make_etag
+from app.common.schemas import CountMode, Paginated
+from app.common.search import search_rank
 from app.common.utils import paginate
-from app.events import crud, schemas
+from app.core.config import settings
+from app.events import crud, models, schemas
+from app.events.cache import CachedCatalogRoute
 from app.events.deps import event_exists
-from app.events.filters import EventFilters, EventSorter
+from app.events.filters import EventFilters, EventSorter, ProximityFilter
 
-router = APIRouter()
+router = APIRouter(route_class=CachedCatalogRoute)
 
 
 @router.get("/", response_model=Paginated[schemas.EventBrief])
-def list_events(
-    db: DBSession,
+async def list_events(  # pylint: disable=R0913
+    request: Request,
+    response: Response,
+    db: AsyncDBSession,
     pagination: Pagination,
     event_filter: Annotated[EventFilters, Depends()],
     event_sorter: Annotated[EventSorter, Depends()],
+    proximity_filter: Annotated[ProximityFilter, Depends()],
     only_with_available_tickets: bool = False,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> Any:
     """
     List events
+
+    Pass `next_cursor` from the previous response as `cursor` to fetch the next page using keyset pagination
+    (`skip` is ignored then)
+
+    `name__search` matches events with words starting with every searched word in their name, pass
+    `sort_by=-relevance` to get the best matches first
+
+    `lat`, `lon` and `radius_km` limit the events to the ones held within the radius from the point, pass
+    `sort_by=distance` to get the closest ones first
+
+    `count_mode` controls how `total_count` is computed: `exact` (default), `capped` (stops at the configured cap),
+    `estimated` (query planner estimate) or `none` (not computed)
     """
+    if event_filter.name__search:
+        event_sorter.annotate("relevance", search_rank(models.Event.name, event_filter.name__search))
+    if proximity_filter.is_set:
+        event_sorter.annotate("distance", proximity_filter.distance)
     filters = event_filter.filters
-    events = crud.event.get_filtered(
+    filters.extend(proximity_filter.filters)
+    statements = list(filters.statements)
+    skip = pagination.skip
+    if cursor is not None:
+        statements.append(event_sorter.get_cursor_filter(cursor))
+        skip = 0
+    events = await crud.async_event.get_filtered(
         db,
-        filters=filters.statements,
+        filters=statements,
         joins=filters.related,
         only_with_available_tickets=only_with_available_tickets,
-        order_by=event_sorter.order_by,
+        order_by=event_sorter.keyset_order_by,
+        options=(*get_loader_options(models.Event, schemas.EventBrief), *event_sorter.options),
         limit=pagination.limit,
-        skip=pagination.skip,
+        skip=skip,
     )
-    events_count = crud.event.get_filtered_count(
-        db, filters=filters.statements, joins=filters.related, only_with_available_tickets=only_with_available_tickets
+    events_count = await crud.async_event.get_filtered_row_count(
+        db,
+        filters=filters.statements,
+        joins=filters.related,
+        only_with_available_tickets=only_with_available_tickets,
+        mode=count_mode,
+        cap=settings.PAGINATION_COUNT_CAP,
     )
-    return paginate(events, events_count)
+    next_cursor = event_sorter.get_cursor(events[-1]) if events and len(events) == pagination.limit else None
+    etag = make_etag(
+        events_count.value, events_count.is_exact, [crud.event.get_brief_version(event) for event in events]
+    )
+    if not_modified := conditional_response(request, response, etag):
+        return not_modified
+    return paginate(events, events_count.value, next_cursor=next_cursor, is_count_exact=events_count.is_exact)
 
 
 @router.get("/{slug}", response_model=schemas.EventDetails)
-def get_event_by_slug(event: Annotated[schemas.EventDetails, Depends(event_exists.by_slug)]) -> Any:
+async def get_event_by_slug(
+    request: Request, response: Response, event: Annotated[models.Event, Depends(event_exists.by_slug)]
+) -> Any:
     """
     Read event by slug
     """
+    etag = make_etag(crud.event.get_details_version(event))
+    if not_modified := conditional_response(request, response, etag):
+        return not_modified
     return event
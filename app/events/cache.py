@@ -0,0 +1,7 @@
+from app.common.cache import ResponseCache, cached_route_class, create_cache_backend, invalidate_on_commit
+from app.core.config import settings
+from app.events.models import Event, EventType, Location, Organizer, Speaker
+
+catalog_cache = ResponseCache(create_cache_backend(), namespace="catalog", ttl=settings.CATALOG_CACHE_TTL_SECONDS)
+invalidate_on_commit(catalog_cache, models=(Event, EventType, Location, Organizer, Speaker))
+CachedCatalogRoute = cached_route_class(catalog_cache)
@@ -1,10 +1,10 @@
 from pydantic import BaseModel
 
 from app.common.crud import CRUDBase
-from app.events.crud.crud_event import CRUDEvent
-from app.events.crud.crud_event_type import CRUDEventType
-from app.events.crud.crud_location import CRUDLocation
-from app.events.crud.crud_speaker import CRUDSpeaker
+from app.events.crud.crud_event import AsyncCRUDEvent, CRUDEvent
+from app.events.crud.crud_event_type import AsyncCRUDEventType, CRUDEventType
+from app.events.crud.crud_location import AsyncCRUDLocation, CRUDLocation
+from app.events.crud.crud_speaker import AsyncCRUDSpeaker, CRUDSpeaker
 from app.events.models import Event, EventType, Location, Organizer, Speaker
 from app.events.schemas import OrganizerCreate
 
@@ -15,3 +15,8 @@ speaker = CRUDSpeaker(Speaker)
 event_type = CRUDEventType(EventType)
 location = CRUDLocation(Location)
 organizer = CRUDOrganizer(Organizer)
+
+async_event = AsyncCRUDEvent(Event)
+async_speaker = AsyncCRUDSpeaker(Speaker)
+async_event_type = AsyncCRUDEventType(EventType)
+async_location = AsyncCRUDLocation(Location)
@@ -1,17 +1,43 @@
 from datetime import datetime
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, Type
 
-from sqlalchemy import Select, func, select  # type: ignore[attr-defined]
+from sqlalchemy import Select, select  # type: ignore[attr-defined]
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.common.crud import CRUDBase, SlugMixin
-from app.common.schemas import EmptySchema
+from app.common.crud import AsyncCRUDBase, AsyncSlugMixin, CRUDBase, RowCount, SlugMixin, count_rows
+from app.common.schemas import CountMode, EmptySchema
 from app.events.models import Event, Speaker
 from app.events.schemas import EventCreate
-from app.tickets.models import Ticket, TicketCategory
+from app.tickets.models import TicketCategory
 
 
-class CRUDEvent(CRUDBase[Event, EventCreate, EmptySchema], SlugMixin[Event]):
+class EventQueryMixin:
+    model: Type[Event]
+
+    def _get_filter_query(
+        self,
+        only_with_available_tickets: bool | None = False,
+        filters: Iterable | None = None,
+        joins: Iterable | None = None,
+    ) -> Select:
+        query = select(self.model)
+        if only_with_available_tickets:
+            query = query.where(self.model.ticket_categories.any(TicketCategory.quota > TicketCategory.tickets_sold))
+        joined: list = []
+        for join in joins or ():
+            # relationship attributes overload ==, hence the identity check
+            if not any(join is other for other in joined):
+                query = query.join(join)  # type: ignore[assignment]
+                joined.append(join)
+        if filters:
+            query = query.where(*filters)
+        return query
+
+
+class CRUDEvent(CRUDBase[Event, EventCreate, EmptySchema], SlugMixin[Event], EventQueryMixin):
+    model: Type[Event]
+
     def get_filtered(
         self,
         db: Session,
@@ -20,6 +46,7 @@ class CRUDEvent(CRUDBase[Event, EventCreate, EmptySchema], SlugMixin[Event]):
         filters: Iterable | None = None,
         joins: Iterable | None = None,
         order_by: Iterable | None = None,
+        options: Iterable = (),
         skip: int = 0,
         limit: int = 100,
     ) -> Sequence[Event]:
@@ -28,9 +55,9 @@ class CRUDEvent(CRUDBase[Event, EventCreate, EmptySchema], SlugMixin[Event]):
         )
         if order_by:
             query = query.order_by(*order_by)
-        query = query.offset(skip).limit(limit)
+        query = query.options(*options).offset(skip).limit(limit)
         result = db.execute(query)
-        return result.scalars().all()
+        return result.unique().scalars().all()
 
     def get_filtered_count(
         self,
@@ -40,35 +67,43 @@ class CRUDEvent(CRUDBase[Event, EventCreate, EmptySchema], SlugMixin[Event]):
         filters: Iterable | None = None,
         joins: Iterable | None = None,
     ) -> int:
-        base_query = self._get_filter_query(
-            only_with_available_tickets=only_with_available_tickets, filters=filters, joins=joins
+        row_count = self.get_filtered_row_count(
+            db, only_with_available_tickets=only_with_available_tickets, filters=filters, joins=joins
         )
-        count_query = select(func.count()).select_from(base_query.subquery())  # pylint: disable=not-callable
-        result = db.execute(count_query)
-        return result.scalar_one()
+        return row_count.value  # type: ignore[return-value]
 
-    def _get_filter_query(
+    def get_filtered_row_count(  # pylint: disable=R0913
         self,
+        db: Session,
+        *,
         only_with_available_tickets: bool | None = False,
         filters: Iterable | None = None,
         joins: Iterable | None = None,
-    ) -> Select:
-        if only_with_available_tickets:
-            subquery = (
-                select(TicketCategory.event_id)  # type: ignore[attr-defined]
-                .join(Ticket, isouter=True)  # type: ignore[arg-type]
-                .group_by(TicketCategory.id)
-                .having(TicketCategory.quota > func.count(Ticket.id))  # pylint: disable=not-callable
-            )
-            query = select(self.model).where(self.model.id.in_(subquery)).distinct()
-        else:
-            query = select(self.model).distinct()
-        if joins:
-            for join in joins:
-                query = query.join(join)  # type: ignore[assignment]
-        if filters:
-            query = query.where(*filters)
-        return query
+        mode: CountMode = CountMode.EXACT,
+        cap: int = 1000,
+    ) -> RowCount:
+        base_query = self._get_filter_query(
+            only_with_available_tickets=only_with_available_tickets, filters=filters, joins=joins
+        )
+        return count_rows(db, base_query, mode=mode, cap=cap)
+
+    def get_brief_version(self, event: Event) -> tuple:
+        """
+        Version stamps of the data making up the brief representation of the event
+        """
+        return event.id, event.updated_at, event.location.updated_at
+
+    def get_details_version(self, event: Event) -> tuple:
+        """
+        Version stamps of the data making up the detailed representation of the event
+        """
+        speakers = tuple(sorted((speaker.id, speaker.updated_at) for speaker in event.speakers))
+        return (
+            *self.get_brief_version(event),
+            event.organizer.updated_at,
+            event.event_type.updated_at,
+            speakers,
+        )
 
     def speakers(self, event: Event) -> list[Speaker]:
         return event.speakers
@@ -86,3 +121,43 @@ class CRUDEvent(CRUDBase[Event, EventCreate, EmptySchema], SlugMixin[Event]):
 
     def is_expired(self, event: Event) -> bool:
         return datetime.utcnow() > event.held_at
+
+
+class AsyncCRUDEvent(AsyncCRUDBase[Event, EventCreate, EmptySchema], AsyncSlugMixin[Event], EventQueryMixin):
+    model: Type[Event]
+
+    async def get_filtered(
+        self,
+        db: AsyncSession,
+        *,
+        only_with_available_tickets: bool | None = False,
+        filters: Iterable | None = None,
+        joins: Iterable | None = None,
+        order_by: Iterable | None = None,
+        options: Iterable = (),
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[Event]:
+        query = self._get_filter_query(
+            only_with_available_tickets=only_with_available_tickets, filters=filters, joins=joins
+        )
+        if order_by:
+            query = query.order_by(*order_by)
+        query = query.options(*options).offset(skip).limit(limit)
+        result = await db.execute(query)
+        return result.unique().scalars().all()
+
+    async def get_filtered_row_count(  # pylint: disable=R0913
+        self,
+        db: AsyncSession,
+        *,
+        only_with_available_tickets: bool | None = False,
+        filters: Iterable | None = None,
+        joins: Iterable | None = None,
+        mode: CountMode = CountMode.EXACT,
+        cap: int = 1000,
+    ) -> RowCount:
+        base_query = self._get_filter_query(
+            only_with_available_tickets=only_with_available_tickets, filters=filters, joins=joins
+        )
+        return await db.run_sync(count_rows, base_query, mode=mode, cap=cap)
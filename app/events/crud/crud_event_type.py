@@ -1,31 +1,72 @@
-from typing import Sequence
+from collections import defaultdict
+from typing import Sequence, Type
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Select, delete, insert, literal, select  # type: ignore[attr-defined]
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, attributes
 
-from app.common.crud import CRUDBase, SlugMixin
+from app.common.crud import AsyncCRUDBase, AsyncSlugMixin, CRUDBase, SlugMixin
 from app.common.schemas import EmptySchema
-from app.events.models import EventType
+from app.events.models import EventType, EventTypeClosure
 from app.events.schemas import EventTypeCreate
 
 
-class CRUDEventType(CRUDBase[EventType, EventTypeCreate, EmptySchema], SlugMixin[EventType]):
+class EventTypeQueryMixin:
+    model: Type[EventType]
+
+    def _get_parent_hierarchy_query(self, event_type_id: int) -> Select:
+        return (
+            select(*self.model.__table__.columns)
+            .join(EventTypeClosure, EventTypeClosure.ancestor_id == self.model.id)
+            .where(EventTypeClosure.descendant_id == event_type_id)
+            .order_by(EventTypeClosure.depth)
+        )
+
+
+class CRUDEventType(CRUDBase[EventType, EventTypeCreate, EmptySchema], SlugMixin[EventType], EventTypeQueryMixin):
+    model: Type[EventType]
+
     def get_event_type_tree(self, db: Session) -> Sequence[EventType]:
-        query = select(self.model).where(self.model.parent_type_id.is_(None))
-        result = db.execute(query)
-        event_types = result.scalars().all()
-        return event_types
+        """
+        Root event types with the children of every event type filled in from a single query
+        """
+        event_types = db.scalars(select(self.model).order_by(self.model.id)).all()
+        children: dict[int | None, list[EventType]] = defaultdict(list)
+        for event_type in event_types:
+            children[event_type.parent_type_id].append(event_type)
+        for event_type in event_types:
+            attributes.set_committed_value(event_type, "children", children[event_type.id])
+        return children[None]
 
     def get_event_type_parent_hierarchy(self, db: Session, event_type_id: int) -> Sequence:
-        base_query = select(self.model).where(self.model.id == event_type_id).cte(recursive=True)
-        parents = aliased(base_query)
-        event_type_table = aliased(self.model)
-        query = base_query.union_all(
-            select(event_type_table).join(  # type: ignore[arg-type]
-                parents, event_type_table.id == parents.c.parent_type_id  # type: ignore[arg-type]
-            )  # type: ignore[arg-type]
-        )
-        stmt = select(query)  # type: ignore[arg-type]
+        stmt = self._get_parent_hierarchy_query(event_type_id)
         result = db.execute(stmt)
         event_types = result.all()
         return event_types
+
+    def rebuild_closure(self, db: Session) -> None:
+        """
+        Recompute the closure of the event type tree, e.g. after event types were inserted bypassing the ORM
+        """
+        closure = select(
+            self.model.id.label("ancestor_id"), self.model.id.label("descendant_id"), literal(0).label("depth")
+        ).cte("closure", recursive=True)
+        closure = closure.union_all(
+            select(closure.c.ancestor_id, self.model.id, closure.c.depth + 1).join(  # type: ignore[arg-type]
+                self.model, self.model.parent_type_id == closure.c.descendant_id
+            )
+        )
+        db.execute(delete(EventTypeClosure))
+        db.execute(insert(EventTypeClosure).from_select(["ancestor_id", "descendant_id", "depth"], select(closure)))
+
+
+class AsyncCRUDEventType(
+    AsyncCRUDBase[EventType, EventTypeCreate, EmptySchema], AsyncSlugMixin[EventType], EventTypeQueryMixin
+):
+    model: Type[EventType]
+
+    async def get_event_type_parent_hierarchy(self, db: AsyncSession, event_type_id: int) -> Sequence:
+        stmt = self._get_parent_hierarchy_query(event_type_id)
+        result = await db.execute(stmt)
+        event_types = result.all()
+        return event_types
@@ -1,8 +1,14 @@
-from app.common.crud import CRUDBase, SlugMixin
+from typing import Type
+
+from app.common.crud import AsyncCRUDBase, AsyncSlugMixin, CRUDBase, SlugMixin
 from app.common.schemas import EmptySchema
 from app.events.models import Location
 from app.events.schemas import LocationCreate
 
 
 class CRUDLocation(CRUDBase[Location, LocationCreate, EmptySchema], SlugMixin[Location]):
-    pass
+    model: Type[Location]
+
+
+class AsyncCRUDLocation(AsyncCRUDBase[Location, LocationCreate, EmptySchema], AsyncSlugMixin[Location]):
+    model: Type[Location]
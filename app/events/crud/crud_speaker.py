@@ -1,8 +1,14 @@
-from app.common.crud import CRUDBase, SlugMixin
+from typing import Type
+
+from app.common.crud import AsyncCRUDBase, AsyncSlugMixin, CRUDBase, SlugMixin
 from app.common.schemas import EmptySchema
 from app.events.models import Speaker
 from app.events.schemas import SpeakerCreate
 
 
 class CRUDSpeaker(CRUDBase[Speaker, SpeakerCreate, EmptySchema], SlugMixin[Speaker]):
-    pass
+    model: Type[Speaker]
+
+
+class AsyncCRUDSpeaker(AsyncCRUDBase[Speaker, SpeakerCreate, EmptySchema], AsyncSlugMixin[Speaker]):
+    model: Type[Speaker]
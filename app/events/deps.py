@@ -1,14 +1,18 @@
-from app.common.utils import InstanceInDBValidator
-from app.events import crud
-from app.events.crud import CRUDEvent, CRUDEventType, CRUDLocation, CRUDSpeaker
+from app.common.utils import AsyncInstanceInDBValidator
+from app.events import crud, schemas
+from app.events.crud import AsyncCRUDEvent, AsyncCRUDEventType, AsyncCRUDLocation, AsyncCRUDSpeaker
 from app.events.exceptions import EventNotFound, EventTypeNotFound, LocationNotFound, SpeakerNotFound
 from app.events.models import Event, EventType, Location, Speaker
 
-event_exists = InstanceInDBValidator[Event, CRUDEvent](crud_service=crud.event, exception=EventNotFound())
-event_type_exists = InstanceInDBValidator[EventType, CRUDEventType](
-    crud_service=crud.event_type, exception=EventTypeNotFound()
+event_exists = AsyncInstanceInDBValidator[Event, AsyncCRUDEvent](
+    crud_service=crud.async_event, exception=EventNotFound(), schema=schemas.EventDetails
 )
-location_exists = InstanceInDBValidator[Location, CRUDLocation](
-    crud_service=crud.location, exception=LocationNotFound()
+event_type_exists = AsyncInstanceInDBValidator[EventType, AsyncCRUDEventType](
+    crud_service=crud.async_event_type, exception=EventTypeNotFound()
+)
+location_exists = AsyncInstanceInDBValidator[Location, AsyncCRUDLocation](
+    crud_service=crud.async_location, exception=LocationNotFound()
+)
+speaker_exists = AsyncInstanceInDBValidator[Speaker, AsyncCRUDSpeaker](
+    crud_service=crud.async_speaker, exception=SpeakerNotFound()
 )
-speaker_exists = InstanceInDBValidator[Speaker, CRUDSpeaker](crud_service=crud.speaker, exception=SpeakerNotFound())
@@ -19,3 +19,10 @@ class LocationNotFound(HTTPException):
 class SpeakerNotFound(HTTPException):
     def __init__(self) -> None:
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail="Speaker not found")
+
+
+class IncompleteProximityFilter(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="lat, lon and radius_km should be given together"
+        )
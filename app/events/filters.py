@@ -1,26 +1,87 @@
 from datetime import date
+from typing import Annotated, Any
 
-from app.common.filters import BaseFilter, BaseSorter
-from app.events.models import Event
+from fastapi import Query
+from sqlalchemy import select
+
+from app.common.filters import BaseFilter, BaseSorter, ModelFilters
+from app.common.geo import BoundingBox, haversine_distance
+from app.events.exceptions import IncompleteProximityFilter
+from app.events.models import Event, EventTypeClosure, Location
+
+
+def descendant_of(model_value: Any, filter_value: int) -> Any:
+    """
+    Whether the event type is the given one or any of its subcategories, at any depth
+    """
+    descendants = select(EventTypeClosure.descendant_id).where(EventTypeClosure.ancestor_id == filter_value)
+    return model_value.in_(descendants)
 
 
 class EventFilters(BaseFilter):
     name__icontains: str | None = None
+    name__search: str | None = None
     held_at__gte: date | None = None
     held_at__lte: date | None = None
     slug__exact: str | None = None
     is_active__exact: bool | None = None
     event_type_id__exact: int | None = None
+    event_type_id__descendant_of: int | None = None
     location_id__exact: int | None = None
     speakers__id__exact: int | None = None
     location__name__icontains: str | None = None
     location__city__icontains: str | None = None
+    location__name__search: str | None = None
+    location__city__search: str | None = None
+    speakers__name__search: str | None = None
 
     class Constants:
         model = Event
+        lookups = {"descendant_of": descendant_of}
+
+
+class ProximityFilter:
+    """
+    Events held within `radius_km` kilometers from the point
+    """
+
+    def __init__(
+        self,
+        lat: Annotated[float | None, Query(ge=-90, le=90)] = None,
+        lon: Annotated[float | None, Query(ge=-180, le=180)] = None,
+        radius_km: Annotated[float | None, Query(gt=0, le=20000)] = None,
+    ) -> None:
+        self.lat = lat
+        self.lon = lon
+        self.radius_km = radius_km
+
+    @property
+    def is_set(self) -> bool:
+        values = (self.lat, self.lon, self.radius_km)
+        if all(value is None for value in values):
+            return False
+        if any(value is None for value in values):
+            raise IncompleteProximityFilter
+        return True
+
+    @property
+    def distance(self) -> Any:
+        return haversine_distance(Location.latitude, Location.longitude, self.lat, self.lon)  # type: ignore[arg-type]
+
+    @property
+    def filters(self) -> ModelFilters:
+        """
+        Bounding box condition served by the coordinates index, narrowed down by the exact distance
+        """
+        if not self.is_set:
+            return ModelFilters(statements=[], related=[])
+        box = BoundingBox.around(self.lat, self.lon, self.radius_km)  # type: ignore[arg-type]
+        statements = [box.contains(Location.latitude, Location.longitude), self.distance <= self.radius_km]
+        return ModelFilters(statements=statements, related=[Event.location])
 
 
 class EventSorter(BaseSorter):
     class Constants:
         model = Event
-        order_by_fields = ["held_at", "name", "id"]
+        order_by_fields = ["held_at", "name", "id", "relevance", "distance"]
+        annotated_fields = ["relevance", "distance"]
@@ -2,10 +2,27 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 from fastapi_storages.integrations.sqlalchemy import FileType
-from sqlalchemy import Column, ForeignKey, String, Table, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship  # type: ignore[attr-defined]
+from sqlalchemy import (  # type: ignore[attr-defined]
+    Column,
+    Connection,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+    Text,
+    delete,
+    event,
+    insert,
+    inspect,
+    literal,
+    select,
+    text,
+    true,
+)
+from sqlalchemy.orm import Mapped, Mapper, mapped_column, query_expression, relationship  # type: ignore[attr-defined]
 
-from app.common.models import BoolTrue, IntPk, UniqueIndexedStr
+from app.common.models import BoolTrue, IntPk, UniqueIndexedStr, UpdatedAt
+from app.common.search import search_index
 from app.common.storage import img_storage
 from app.db.base_class import Base
 
@@ -34,6 +51,10 @@ class Event(Base):
     created_by_id: Mapped[int] = mapped_column(ForeignKey("user.id"), nullable=False)
     event_type_id: Mapped[int] = mapped_column(ForeignKey("eventtype.id"), nullable=False)
     location_id: Mapped[int] = mapped_column(ForeignKey("location.id"), nullable=False)
+    updated_at: Mapped[UpdatedAt]
+    # search relevance and distance in kilometers, loaded only by queries ordering the events by them
+    relevance: Mapped[Optional[float]] = query_expression()
+    distance: Mapped[Optional[float]] = query_expression()
 
     organizer: Mapped["Organizer"] = relationship("Organizer", back_populates="events")
     created_by: Mapped["User"] = relationship("User")
@@ -42,6 +63,14 @@ class Event(Base):
     speakers: Mapped[list["Speaker"]] = relationship("Speaker", secondary=event_speaker, back_populates="events")
     ticket_categories: Mapped[list["TicketCategory"]] = relationship("TicketCategory", back_populates="event")
 
+    __table_args__ = (
+        search_index("ix_event_name_search", "name"),
+        # the listing filters active events by date, optionally narrowed down to an event type or a location
+        Index("ix_event_active_held_at", "held_at", postgresql_where=text("is_active")),
+        Index("ix_event_event_type_held_at", "event_type_id", "held_at"),
+        Index("ix_event_location_held_at", "location_id", "held_at"),
+    )
+
     def __str__(self) -> str:
         return f"{self.name} ({self.held_at})"
 
@@ -49,6 +78,7 @@ class Event(Base):
 class Organizer(Base):
     id: Mapped[IntPk]
     name: Mapped[str] = mapped_column(String(128), nullable=False, unique=True, index=True)
+    updated_at: Mapped[UpdatedAt]
 
     events: Mapped[list["Event"]] = relationship("Event", back_populates="organizer")
 
@@ -61,6 +91,7 @@ class EventType(Base):
     parent_type_id: Mapped[Optional[int]] = mapped_column(ForeignKey("eventtype.id"))
     name: Mapped[str] = mapped_column(String(80), index=True, nullable=False)
     slug: Mapped[UniqueIndexedStr]
+    updated_at: Mapped[UpdatedAt]
 
     parent: Mapped[Optional["EventType"]] = relationship(
         "EventType", remote_side="EventType.id", back_populates="children"
@@ -74,6 +105,60 @@ class EventType(Base):
         return self.name
 
 
+class EventTypeClosure(Base):
+    """
+    Every pair of an event type and one of its descendants, event types being their own descendants at depth 0.
+    Maintained on ORM writes of event types, inserts bypassing the ORM need to rebuild it
+    """
+
+    ancestor_id: Mapped[int] = mapped_column(ForeignKey("eventtype.id", ondelete="CASCADE"), primary_key=True)
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("eventtype.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    depth: Mapped[int] = mapped_column(nullable=False)
+
+
+@event.listens_for(EventType, "after_insert")
+def add_event_type_to_closure(mapper: Mapper, connection: Connection, target: EventType) -> None:
+    closure: Table = EventTypeClosure.__table__  # type: ignore[assignment]
+    connection.execute(insert(closure).values(ancestor_id=target.id, descendant_id=target.id, depth=0))
+    if target.parent_type_id is not None:
+        ancestors = select(closure.c.ancestor_id, literal(target.id), closure.c.depth + 1).where(
+            closure.c.descendant_id == target.parent_type_id
+        )
+        connection.execute(insert(closure).from_select(["ancestor_id", "descendant_id", "depth"], ancestors))
+
+
+@event.listens_for(EventType, "after_update")
+def move_event_type_in_closure(mapper: Mapper, connection: Connection, target: EventType) -> None:
+    """
+    Detach the subtree of the event type from its former ancestors and attach it under the new parent
+    """
+    if not inspect(target).attrs.parent_type_id.history.has_changes():
+        return
+    closure: Table = EventTypeClosure.__table__  # type: ignore[assignment]
+    descendant_query = select(closure.c.depth).where(
+        closure.c.ancestor_id == target.id, closure.c.descendant_id == target.parent_type_id
+    )
+    if target.parent_type_id is not None and connection.scalar(descendant_query) is not None:
+        raise ValueError(f"Event type {target.id} cannot be moved under its own descendant")
+    # the subtree is aliased, otherwise it would be correlated to the table rows are deleted from
+    subtree_closure = closure.alias("subtree")
+    subtree = select(subtree_closure.c.descendant_id).where(subtree_closure.c.ancestor_id == target.id)
+    connection.execute(
+        delete(closure).where(closure.c.descendant_id.in_(subtree), closure.c.ancestor_id.not_in(subtree))
+    )
+    if target.parent_type_id is None:
+        return
+    ancestors, descendants = closure.alias("ancestors"), closure.alias("descendants")
+    pairs = (
+        select(ancestors.c.ancestor_id, descendants.c.descendant_id, ancestors.c.depth + descendants.c.depth + 1)
+        .select_from(ancestors.join(descendants, true()))
+        .where(ancestors.c.descendant_id == target.parent_type_id, descendants.c.ancestor_id == target.id)
+    )
+    connection.execute(insert(closure).from_select(["ancestor_id", "descendant_id", "depth"], pairs))
+
+
 class Location(Base):
     id: Mapped[IntPk]
     name: Mapped[str] = mapped_column(String(64), index=True, nullable=False)
@@ -81,9 +166,16 @@ class Location(Base):
     slug: Mapped[UniqueIndexedStr]
     longitude: Mapped[float]
     latitude: Mapped[float]
+    updated_at: Mapped[UpdatedAt]
 
     events: Mapped[list["Event"]] = relationship("Event", back_populates="location", lazy="dynamic")
 
+    __table_args__ = (
+        search_index("ix_location_name_search", "name"),
+        search_index("ix_location_city_search", "city"),
+        Index("ix_location_coordinates", "latitude", "longitude"),
+    )
+
     def __str__(self) -> str:
         return f"{self.name}, {self.city}"
 
@@ -94,8 +186,11 @@ class Speaker(Base):
     slug: Mapped[UniqueIndexedStr]
     photo: Mapped[Optional[FileType]] = mapped_column(FileType(storage=img_storage))
     description: Mapped[Optional[str]] = mapped_column(Text)
+    updated_at: Mapped[UpdatedAt]
 
     events: Mapped[list["Event"]] = relationship("Event", secondary=event_speaker, back_populates="speakers")
 
+    __table_args__ = (search_index("ix_speaker_name_search", "name"),)
+
     def __str__(self) -> str:
         return self.name
@@ -1,14 +1,27 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.admin_panel.admin import setup_admin
+from app.common.emails import create_mailer
+from app.common.instrumentation import QueryStatsMiddleware, instrument_engine
 from app.core.config import settings
-from app.db.session import engine
+from app.db.session import async_engine, engine
 from app.router import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator:  # pylint: disable=W0621
+    app.state.mailer = create_mailer()
+    yield
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -18,5 +31,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.QUERY_INSTRUMENTATION_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+    app.add_middleware(QueryStatsMiddleware)
 app.include_router(api_router)
 setup_admin(app, engine)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.auth.api.v1.router import api_router as auth_router
+from app.common.api.v1.router import api_router as common_router
 from app.core.config import settings
 from app.events.api.v1.router import api_router as events_router
 from app.tickets.api.v1.router import api_router as tickets_router
@@ -9,3 +10,4 @@ api_router = APIRouter(prefix=settings.API_V1_STR)
 api_router.include_router(auth_router)
 api_router.include_router(events_router)
 api_router.include_router(tickets_router)
+api_router.include_router(common_router)
@@ -4,6 +4,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.auth import crud, models, schemas
+from app.auth.security import create_password_context, pwd_context
 from app.auth.utils import generate_valid_password
 from app.core.config import settings
 
@@ -39,6 +40,21 @@ class TestLogin:
         assert "access_token" in tokens
         assert tokens["access_token"]
 
+    def test_login_upgrades_outdated_password_hash(
+        self, client: TestClient, db: Session, default_user: models.User
+    ) -> None:
+        default_user.hashed_password = create_password_context("bcrypt", bcrypt_rounds=4).hash(self.password)
+        db.commit()
+        login_data = {
+            "username": default_user.email,
+            "password": self.password,
+        }
+        r = client.post(f"{settings.API_V1_STR}/auth/login", data=login_data)
+        assert r.status_code == status.HTTP_200_OK
+        db.refresh(default_user)
+        assert not pwd_context.needs_update(default_user.hashed_password)
+        assert pwd_context.verify(self.password, default_user.hashed_password)
+
     def test_disabled_user(self, client: TestClient, disabled_user: models.User) -> None:
         login_data = {
             "username": disabled_user.email,
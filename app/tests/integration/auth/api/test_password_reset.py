@@ -1,25 +1,20 @@
 import datetime
-from unittest.mock import MagicMock
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
-from pytest_mock import MockerFixture
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.auth import crud
 from app.auth.models import PasswordResetToken, User
 from app.auth.schemas import PasswordResetTokenCreate
 from app.auth.utils import generate_valid_password
-from app.common.deps import Mailer
+from app.common.models import OutboxEmail
 from app.core.config import settings
 
 
 class TestPasswordReset:
-    @pytest.fixture()
-    def mock_add_task(self, mocker: MockerFixture) -> MagicMock:
-        return mocker.patch("fastapi.BackgroundTasks.add_task")
-
     @pytest.fixture()
     def password_reset_token(self, db: Session, test_user: User) -> PasswordResetToken:
         token_in = PasswordResetTokenCreate(user_id=test_user.id)
@@ -38,22 +33,22 @@ class TestPasswordReset:
         db.refresh(password_reset_token)
         return password_reset_token
 
-    def test_request_password_reset_user_exists(self, client: TestClient, mail_engine: Mailer) -> None:
+    def test_request_password_reset_user_exists(self, client: TestClient, db: Session) -> None:
         payload = {"email": settings.TEST_USER_EMAIL}
-        with mail_engine.record_messages() as outbox:
-            r = client.post(f"{settings.API_V1_STR}/auth/password/reset", json=payload)
-            result = r.json()
-            assert r.status_code == status.HTTP_200_OK
-            assert "message" in result
-            assert len(outbox) == 1
+        r = client.post(f"{settings.API_V1_STR}/auth/password/reset", json=payload)
+        result = r.json()
+        assert r.status_code == status.HTTP_200_OK
+        assert "message" in result
+        emails = db.scalars(select(OutboxEmail)).all()
+        assert [email.recipients for email in emails] == [[settings.TEST_USER_EMAIL]]
 
-    def test_request_password_reset_user_does_not_exist(self, client: TestClient, mock_add_task: MagicMock) -> None:
+    def test_request_password_reset_user_does_not_exist(self, client: TestClient, db: Session) -> None:
         payload = {"email": "invalid_email@example.com"}
         r = client.post(f"{settings.API_V1_STR}/auth/password/reset", json=payload)
         result = r.json()
         assert r.status_code == status.HTTP_200_OK
         assert "message" in result
-        mock_add_task.assert_not_called()
+        assert not db.scalars(select(OutboxEmail)).all()
 
     def test_reset_password(
         self, client: TestClient, password_reset_token: PasswordResetToken, test_user: User
@@ -1,13 +1,14 @@
-from typing import Generator
+from typing import Callable, ContextManager, Generator
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.auth import crud, schemas
 from app.auth.utils import generate_valid_password
-from app.common.deps import Mailer
+from app.common.models import OutboxEmail
 from app.core.config import settings
 from app.tests.integration.test_db_config.initial_data import INITIAL_DATA
 
@@ -45,13 +46,13 @@ class TestUsers:  # pylint: disable=R0904
             raise LookupError("User not found")
         crud.user.deactivate(db, user_id=user.id)
 
-    def test_create_user_open_user_is_not_activated(self, client: TestClient, mail_engine: Mailer) -> None:
+    def test_create_user_open_user_is_not_activated(self, client: TestClient, db: Session) -> None:
         password = generate_valid_password()
         email = "random@email.com"
         payload = {"email": email, "password": password}
-        with mail_engine.record_messages() as outbox:
-            r = client.post(f"{settings.API_V1_STR}/users/", json=payload)
-            assert len(outbox) == 1
+        r = client.post(f"{settings.API_V1_STR}/users/", json=payload)
+        emails = db.scalars(select(OutboxEmail)).all()
+        assert [queued.recipients for queued in emails] == [[email]]
         result = r.json()
         assert r.status_code == status.HTTP_201_CREATED
         assert "email" in result
@@ -129,6 +130,32 @@ class TestUsers:  # pylint: disable=R0904
         r = client.get(f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers)
         assert r.status_code == status.HTTP_403_FORBIDDEN
 
+    def test_read_current_user_is_served_from_principal_cache(
+        self,
+        client: TestClient,
+        normal_user_token_headers: dict[str, str],
+        query_budget: Callable[[int], ContextManager[list[str]]],
+    ) -> None:
+        client.get(f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers)
+
+        with query_budget(0):
+            r = client.get(f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers)
+
+        assert r.status_code == status.HTTP_200_OK
+        assert r.json().get("email") == settings.TEST_USER_EMAIL
+
+    def test_read_current_user_deactivated_after_caching_should_fail(
+        self, client: TestClient, db: Session, normal_user_token_headers: dict[str, str]
+    ) -> None:
+        client.get(f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers)
+        user = crud.user.get_by_email(db, email=settings.TEST_USER_EMAIL)
+        assert user
+
+        crud.user.deactivate(db, user_id=user.id)
+
+        r = client.get(f"{settings.API_V1_STR}/users/me", headers=normal_user_token_headers)
+        assert r.status_code == status.HTTP_403_FORBIDDEN
+
     def test_read_current_user_by_superuser(
         self,
         client: TestClient,
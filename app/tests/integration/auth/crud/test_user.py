@@ -176,14 +176,6 @@ class TestUser:  # pylint: disable=R0904
         crud.user.update(db, db_obj=default_user, obj_in=user_in)
         assert default_user.email == new_email
 
-    def test_check_password(self, db: Session, default_user: models.User) -> None:
-        result = crud.user.check_password(db, user=default_user, password=self.password)
-        assert result
-
-    def test_check_password_with_invalid_password_returns_false(self, db: Session, default_user: models.User) -> None:
-        result = crud.user.check_password(db, user=default_user, password="invalid")
-        assert not result
-
     def test_change_password(self, db: Session, default_user: models.User) -> None:
         new_password = generate_valid_password()
         old_password_hash = default_user.hashed_password
@@ -1,5 +1,6 @@
 import pytest
 from fastapi.encoders import jsonable_encoder
+from pytest_mock import MockerFixture
 from sqlalchemy.orm import Session
 
 from app.auth import crud, models, schemas
@@ -20,6 +21,20 @@ class TestPasswordReset:
         assert isinstance(verification_token, models.VerificationToken)
         assert verification_token.user_id == self.user_id
 
+    def test_generate_token_retries_duplicate_value_keeping_pending_changes(
+        self, db: Session, verification_token: models.VerificationToken, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("app.common.crud.secrets.token_urlsafe", side_effect=[self.value, "unique"])
+        user = crud.user.get(db, id_=self.user_id)
+        assert user is not None
+        user.is_disabled = True
+
+        token = crud.verification_token.create(db, obj_in=schemas.VerificationTokenCreate(user_id=self.user_id))
+
+        assert token.value == "unique"
+        db.expire(user)
+        assert user.is_disabled
+
     def test_get_by_value(self, db: Session, verification_token: models.VerificationToken) -> None:
         token = crud.verification_token.get_by_value(db, value=self.value)
         assert isinstance(token, models.VerificationToken)
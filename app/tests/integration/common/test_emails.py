@@ -0,0 +1,45 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_mail import ConnectionConfig, FastMail
+from sqlalchemy.orm import Session
+
+from app.auth.models import User
+from app.common.emails import MailSender, Recipient, get_mailer_config
+from app.main import app
+from app.tests.integration.utils.smtp import SMTPStub
+from app.tickets import crud
+from app.tickets.models import TicketCategory
+from app.tickets.schemas import TicketCreate
+
+
+@pytest.mark.asyncio
+async def test_send_many_notifies_ticket_holders_in_batches(
+    db: Session, ticket_category: TicketCategory, test_user: User
+) -> None:
+    for i in range(5):
+        ticket_in = TicketCreate(email=f"{i}@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+        crud.ticket.create(db, obj_in=ticket_in)
+    emails = crud.ticket.get_holder_emails(db, event_id=ticket_category.event_id, chunk_size=2)
+    recipients = (Recipient(email, {"token": email}) for email in emails)
+
+    async with SMTPStub(rejected_recipients=("3@example.com",)) as smtp:
+        config = ConnectionConfig(
+            **get_mailer_config() | {"MAIL_SERVER": "127.0.0.1", "MAIL_PORT": smtp.port, "MAIL_STARTTLS": False},
+            USE_CREDENTIALS=False,
+        )
+        sender = MailSender(FastMail(config))
+        with sender.record_messages() as outbox:
+            report = await sender.send_many(
+                recipients, subject="Hello {{ token }}", template_name="auth/new_user.html", batch_size=2, rate_limit=0
+            )
+
+    assert report.sent == 4
+    assert list(report.failures) == ["3@example.com"]
+    assert len(outbox) == 4
+    assert sorted(message["Subject"] for message in smtp.messages) == [f"Hello {i}@example.com" for i in (0, 1, 2, 4)]
+
+
+def test_lifespan_creates_single_mailer() -> None:
+    with TestClient(app):
+        assert isinstance(app.state.mailer, MailSender)
+        assert isinstance(app.state.mailer.engine, FastMail)
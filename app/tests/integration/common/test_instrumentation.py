@@ -0,0 +1,46 @@
+import logging
+from typing import Callable
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.common.instrumentation import QueryStatsMiddleware, instrument_engine
+from app.core.config import settings
+from app.events import models
+from app.main import app
+from app.tests.integration.test_db_config.session import engine
+
+
+@pytest.fixture(name="instrumented_client")
+def get_instrumented_client(client: TestClient) -> TestClient:
+    instrument_engine(engine)
+    return TestClient(QueryStatsMiddleware(app))
+
+
+@pytest.mark.usefixtures("event")
+def test_query_stats_middleware_should_set_server_timing_header(instrumented_client: TestClient) -> None:
+    r = instrumented_client.get(f"{settings.API_V1_STR}/events/")
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="2 queries"' in r.headers["server-timing"]
+    assert "db-slowest;dur=" in r.headers["server-timing"]
+
+
+@pytest.mark.usefixtures("event")
+def test_query_stats_middleware_should_log_request_stats(
+    instrumented_client: TestClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO, logger="app.loggers"):
+        instrumented_client.get(f"{settings.API_V1_STR}/events/?count_mode=none")
+    message = caplog.records[-1].getMessage()
+    assert f"method=GET path={settings.API_V1_STR}/events/ queries=1 " in message
+    assert "slowest_statement='SELECT" in message
+
+
+def test_query_budget_should_fail_when_exceeded(
+    client: TestClient, event: models.Event, query_budget: Callable
+) -> None:
+    with pytest.raises(AssertionError, match="Expected at most 1 queries, 2 executed"):
+        with query_budget(1):
+            client.get(f"{settings.API_V1_STR}/events/{event.slug}")
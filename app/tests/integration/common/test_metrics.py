@@ -0,0 +1,19 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def test_get_db_pool_metrics(client: TestClient, superuser_token_headers: dict[str, str]) -> None:
+    r = client.get(f"{settings.API_V1_STR}/metrics/db-pool", headers=superuser_token_headers)
+    result = r.json()
+    assert r.status_code == status.HTTP_200_OK
+    assert [metrics["engine"] for metrics in result] == ["sync", "async"]
+    assert all(metrics["size"] == settings.SQLALCHEMY_POOL_SIZE for metrics in result)
+
+
+def test_get_db_pool_metrics_as_normal_user_should_fail(
+    client: TestClient, normal_user_token_headers: dict[str, str]
+) -> None:
+    r = client.get(f"{settings.API_V1_STR}/metrics/db-pool", headers=normal_user_token_headers)
+    assert r.status_code == status.HTTP_403_FORBIDDEN
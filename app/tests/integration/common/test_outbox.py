@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi_mail import MessageSchema
+from pytest_mock import MockerFixture
+from sqlalchemy.orm import Session
+
+from app.common.models import OutboxEmail
+from app.common.outbox import deliver_pending_emails, outbox_email
+from app.core.config import settings
+from app.tests.integration.utils.smtp import SMTPStub
+
+
+def enqueue_email(db: Session, recipient: str) -> OutboxEmail:
+    message = MessageSchema(recipients=[recipient], subject="Zażółć gęślą jaźń", body="<p>Body</p>", subtype="html")
+    email = outbox_email.enqueue(db, message=message)
+    db.commit()
+    return email
+
+
+@pytest.mark.asyncio
+async def test_deliver_pending_emails_sends_batch_over_single_connection(db: Session) -> None:
+    emails = [enqueue_email(db, f"{i}@example.com") for i in range(3)]
+
+    async with SMTPStub() as smtp:
+        report = await deliver_pending_emails(db, batch_size=10, connect=smtp.connect)
+
+    assert (report.sent, report.failed) == (3, 0)
+    assert smtp.connections == 1
+    assert [message["To"] for message in smtp.messages] == [f"{i}@example.com" for i in range(3)]
+    assert all(email.sent_at is not None and email.attempts == 1 for email in emails)
+
+
+@pytest.mark.asyncio
+async def test_deliver_pending_emails_respects_batch_size(db: Session) -> None:
+    for i in range(3):
+        enqueue_email(db, f"{i}@example.com")
+
+    async with SMTPStub() as smtp:
+        first = await deliver_pending_emails(db, batch_size=2, connect=smtp.connect)
+        second = await deliver_pending_emails(db, batch_size=2, connect=smtp.connect)
+        third = await deliver_pending_emails(db, batch_size=2, connect=smtp.connect)
+
+    assert (first.sent, second.sent, third.claimed) == (2, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_deliver_pending_emails_schedules_retry_of_rejected_email(db: Session) -> None:
+    rejected = enqueue_email(db, "rejected@example.com")
+    accepted = enqueue_email(db, "accepted@example.com")
+
+    async with SMTPStub(rejected_recipients=("rejected@example.com",)) as smtp:
+        report = await deliver_pending_emails(db, batch_size=10, connect=smtp.connect)
+        retry = await deliver_pending_emails(db, batch_size=10, connect=smtp.connect)
+
+    assert (report.sent, report.failed) == (1, 1)
+    assert accepted.sent_at is not None
+    assert rejected.sent_at is None and rejected.attempts == 1 and rejected.last_error
+    assert rejected.next_attempt_at > datetime.utcnow()
+    assert retry.claimed == 0
+
+
+@pytest.mark.asyncio
+async def test_deliver_pending_emails_with_smtp_server_down(db: Session) -> None:
+    email = enqueue_email(db, "user@example.com")
+    async with SMTPStub() as smtp:
+        connect = smtp.connect
+
+    report = await deliver_pending_emails(db, batch_size=10, connect=connect)
+
+    assert (report.failed, report.postponed) == (0, 1)
+    assert email.sent_at is None and email.attempts == 0 and email.last_error
+    assert email.next_attempt_at > datetime.utcnow()
+
+
+@pytest.mark.asyncio
+async def test_deliver_pending_emails_keeps_attempts_during_smtp_outage(db: Session, mocker: MockerFixture) -> None:
+    mocker.patch.object(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 2)
+    email = enqueue_email(db, "user@example.com")
+    async with SMTPStub() as stopped_smtp:
+        pass
+
+    for _ in range(3):
+        email.next_attempt_at = datetime.utcnow() - timedelta(minutes=1)
+        db.commit()
+        await deliver_pending_emails(db, batch_size=10, connect=stopped_smtp.connect)
+    email.next_attempt_at = datetime.utcnow() - timedelta(minutes=1)
+    db.commit()
+    async with SMTPStub() as smtp:
+        report = await deliver_pending_emails(db, batch_size=10, connect=smtp.connect)
+
+    assert report.sent == 1
+    assert email.sent_at is not None and email.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_deliver_pending_emails_skips_emails_out_of_attempts(db: Session, mocker: MockerFixture) -> None:
+    mocker.patch.object(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 2)
+    email = enqueue_email(db, "user@example.com")
+    email.attempts = 2
+    email.next_attempt_at = datetime.utcnow() - timedelta(minutes=1)
+    db.commit()
+
+    async with SMTPStub() as smtp:
+        report = await deliver_pending_emails(db, batch_size=10, connect=smtp.connect)
+
+    assert report.claimed == 0
+    assert not smtp.messages
@@ -1,24 +1,29 @@
 # pylint: disable=W0621,W0613,E1101
+import functools
 from datetime import datetime, timedelta
-from typing import Generator
+from typing import AsyncGenerator, Callable, ContextManager, Generator
 
 import pytest
 import sqlalchemy
 from fastapi_mail import ConnectionConfig, FastMail
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.session import Session, SessionTransaction
 from starlette.testclient import TestClient
 
 from app.auth import crud, models, schemas
+from app.auth.cache import principal_cache
 from app.auth.utils import generate_valid_password
-from app.common.deps import get_db
+from app.common.deps import get_async_db, get_db
 from app.common.emails import MailSender, get_mailer_config, mailer
 from app.core.config import settings
 from app.db import base
 from app.events import crud as event_crud, models as event_models, schemas as event_schemas
+from app.events.cache import catalog_cache
 from app.main import app
 from app.tests.integration.test_db_config.initial_data import INITIAL_DATA
 from app.tests.integration.test_db_config.session import TestingSessionLocal, engine
 from app.tests.integration.test_db_config.setup_db import init_db
+from app.tests.integration.utils.queries import assert_max_queries
 from app.tests.integration.utils.users import get_normal_user_token_headers, get_superuser_token_headers
 from app.tickets import crud as ticket_crud, models as ticket_models, schemas as ticket_schemas
 
@@ -67,13 +72,29 @@ def client(db: Session) -> Generator:
     def override_get_db() -> Generator:
         yield db
 
+    async def override_get_async_db() -> AsyncGenerator:
+        # async endpoints share the test transaction, psycopg2 calls simply block the event loop
+        yield AsyncSession(sync_session_class=lambda **_: db)  # type: ignore[arg-type]
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     app.dependency_overrides[mailer] = create_test_mailer
+    catalog_cache.invalidate()
+    principal_cache.invalidate()
     yield TestClient(app)
     del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_async_db]
     del app.dependency_overrides[mailer]
 
 
+@pytest.fixture()
+def query_budget() -> Callable[[int], ContextManager[list[str]]]:
+    """
+    Context manager failing the test when the block exceeds the given number of SQL statements
+    """
+    return functools.partial(assert_max_queries, engine)
+
+
 @pytest.fixture()
 def mail_engine() -> MailSender:
     return create_test_mailer()
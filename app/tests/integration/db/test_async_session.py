@@ -0,0 +1,46 @@
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.common.deps import get_async_db
+from app.core.config import settings
+from app.db import session
+from app.db.pool import TimedAsyncAdaptedQueuePool
+from app.main import app
+from app.tests.integration.test_db_config.session import async_engine
+
+
+@pytest.fixture(name="asyncpg_client")
+def get_asyncpg_client(client: TestClient) -> Generator:
+    """
+    Client running async endpoints through get_async_db on the asyncpg engine, outside the test transaction. The
+    client is entered, so that every request shares the event loop the pooled connections belong to
+    """
+    override = app.dependency_overrides.pop(get_async_db)
+    session.AsyncSessionLocal.configure(bind=async_engine)
+    with client:
+        yield client
+        assert client.portal is not None
+        client.portal.call(async_engine.dispose)
+    session.AsyncSessionLocal.configure(bind=session.async_engine)
+    app.dependency_overrides[get_async_db] = override
+
+
+def test_login_through_asyncpg_engine(asyncpg_client: TestClient) -> None:
+    login_data = {"username": settings.TEST_USER_EMAIL, "password": settings.TEST_USER_PASSWORD}
+
+    response = asyncpg_client.post(f"{settings.API_V1_STR}/auth/login", data=login_data)
+
+    assert response.status_code == 200
+    assert response.json()["access_token"]
+    assert isinstance(async_engine.pool, TimedAsyncAdaptedQueuePool)
+    assert async_engine.pool.checkedin() == 1
+
+
+def test_async_lookup_of_missing_instance_through_asyncpg_engine(asyncpg_client: TestClient) -> None:
+    response = asyncpg_client.get(f"{settings.API_V1_STR}/event-types/missing")
+
+    assert response.status_code == 404
+    assert isinstance(async_engine.pool, TimedAsyncAdaptedQueuePool)
+    assert async_engine.pool.checkedin() == 1
@@ -0,0 +1,85 @@
+# pylint: disable=W0613
+from typing import Any, Callable
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.auth.models import User
+from app.events import crud as event_crud
+from app.events.filters import EventFilters
+from app.events.models import Event
+from app.tests.integration.test_db_config.session import engine
+from app.tests.integration.utils.queries import explain, record_queries
+from app.tickets import crud as ticket_crud
+from app.tickets.models import Ticket, TicketCategory
+from app.tickets.schemas import TicketCreate
+
+
+def get_query_plans(db: Session, call: Callable[[], Any]) -> str:
+    """
+    Plans of the statements executed by the call, with sequential scans discouraged so that the planner picks an
+    index whenever one matches, regardless of how few rows the test tables hold
+    """
+    with record_queries(engine) as queries:
+        call()
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    return "\n".join(explain(db.connection(), statement, parameters) for statement, parameters in queries)
+
+
+@pytest.fixture(name="ticket")
+def get_ticket(db: Session, ticket_category: TicketCategory, test_user: User) -> Ticket:
+    ticket_in = TicketCreate(email="email@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+    ticket = ticket_crud.ticket.reserve(db, obj_in=ticket_in)
+    assert ticket is not None
+    return ticket
+
+
+@pytest.mark.parametrize(
+    "filters, index_name",
+    [
+        ({"is_active__exact": True, "held_at__gte": "2020-01-01"}, "ix_event_active_held_at"),
+        ({"event_type_id__exact": 0, "held_at__gte": "2020-01-01"}, "ix_event_event_type_held_at"),
+        ({"location_id__exact": 0, "held_at__lte": "2030-01-01"}, "ix_event_location_held_at"),
+        ({"event_type_id__descendant_of": 0}, "eventtypeclosure_pkey"),
+    ],
+)
+def test_filtered_events_use_index(db: Session, filters: dict[str, Any], index_name: str) -> None:
+    event_filters = EventFilters(**filters).filters
+
+    plans = get_query_plans(
+        db, lambda: event_crud.event.get_filtered(db, filters=event_filters.statements, joins=event_filters.related)
+    )
+
+    assert index_name in plans
+
+
+def test_events_with_available_tickets_use_partial_index(db: Session, ticket_category: TicketCategory) -> None:
+    plans = get_query_plans(db, lambda: event_crud.event.get_filtered(db, only_with_available_tickets=True))
+
+    assert "ix_ticketcategory_available" in plans
+
+
+def test_tickets_by_category_and_user_use_index(db: Session, ticket: Ticket, test_user: User) -> None:
+    plans = get_query_plans(
+        db,
+        lambda: ticket_crud.ticket.get_by_category_and_user(
+            db, user_id=test_user.id, ticket_category_id=ticket.ticket_category_id
+        ),
+    )
+
+    assert "ix_ticket_user_ticket_category" in plans
+
+
+def test_ticket_count_by_category_uses_index(db: Session, ticket: Ticket) -> None:
+    plans = get_query_plans(
+        db, lambda: ticket_crud.ticket.get_count_for_ticket_category(db, ticket_category_id=ticket.ticket_category_id)
+    )
+
+    assert "ix_ticket_ticket_category_id" in plans
+
+
+def test_ticket_categories_by_event_use_index(db: Session, event: Event, ticket_category: TicketCategory) -> None:
+    plans = get_query_plans(db, lambda: ticket_crud.ticket_category.get_all_by_event(db, event_id=event.id))
+
+    assert "ix_ticketcategory_event_id" in plans
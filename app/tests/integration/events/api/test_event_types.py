@@ -1,9 +1,10 @@
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.events import models
+from app.events import crud, models, schemas
 
 
 class TestEventTypes:
@@ -15,6 +16,18 @@ class TestEventTypes:
         assert result[0].get("id") == event_type.id
         assert isinstance(result[0].get("children"), list)
 
+    def test_list_event_types_after_event_type_created(
+        self, client: TestClient, db: Session, event_type: models.EventType
+    ) -> None:
+        client.get(f"{settings.API_V1_STR}/event-types")
+        event_type_in = schemas.EventTypeCreate(name="nested", slug="nested", parent_type_id=event_type.id)
+        nested_event_type = crud.event_type.create(db, obj_in=event_type_in)
+
+        r = client.get(f"{settings.API_V1_STR}/event-types")
+
+        assert r.status_code == status.HTTP_200_OK
+        assert [child["id"] for child in r.json()[0]["children"]] == [nested_event_type.id]
+
     def test_get_event_type_by_slug(self, client: TestClient, event_type: models.EventType) -> None:
         r = client.get(f"{settings.API_V1_STR}/event-types/{event_type.slug}")
         result = r.json()
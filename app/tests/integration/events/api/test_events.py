@@ -1,14 +1,18 @@
 from datetime import datetime
+from typing import Callable, ContextManager
 
 import pytest
 from _pytest.fixtures import FixtureRequest
 from fastapi import status
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 from sqlalchemy.orm import Session
 
 from app.auth import models as auth_models
+from app.common.cache import CACHE_STATUS_HEADER
 from app.core.config import settings
 from app.events import crud, models, schemas
+from app.tickets import models as ticket_models
 
 EVENT_COUNT = 3
 
@@ -112,6 +116,41 @@ class TestEvents:
         assert r.status_code == status.HTTP_200_OK
         assert result["total_count"] == expected_count
 
+    def test_list_events_filtering_by_collection_lists_events_once(
+        self,
+        client: TestClient,
+        db: Session,
+        multiple_events: list[models.Event],
+        query_budget: Callable[[int], ContextManager[list[str]]],
+    ) -> None:
+        speaker_in = schemas.SpeakerCreate(name="Speaker Two", description="Description", slug="speaker-two")
+        crud.event.add_speaker(db, event=multiple_events[0], speaker=crud.speaker.create(db, obj_in=speaker_in))
+
+        with query_budget(10) as statements:
+            r = client.get(f"{settings.API_V1_STR}/events/?speakers__name__search=speaker")
+
+        assert sorted(event["id"] for event in r.json()["items"]) == sorted(event.id for event in multiple_events)
+        assert r.json()["total_count"] == EVENT_COUNT
+        assert not any("DISTINCT" in statement for statement in statements)
+
+    def test_list_events_filtering_by_event_type_descendants(
+        self,
+        client: TestClient,
+        db: Session,
+        multiple_events: list[models.Event],
+        event_type: models.EventType,
+        nested_event_type: models.EventType,
+    ) -> None:
+        multiple_events[0].event_type = nested_event_type
+        db.commit()
+        url = f"{settings.API_V1_STR}/events/?event_type_id__descendant_of="
+
+        assert client.get(f"{url}{event_type.id}").json()["total_count"] == EVENT_COUNT
+        assert [event["id"] for event in client.get(f"{url}{nested_event_type.id}").json()["items"]] == [
+            multiple_events[0].id
+        ]
+        assert client.get(f"{url}999").json()["total_count"] == 0
+
     def test_list_events_sorting_by_wrong_field_should_fail(self, client: TestClient) -> None:
         r = client.get(f"{settings.API_V1_STR}/events/?sort_by=invalid_field")
         assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -130,6 +169,164 @@ class TestEvents:
         assert result["total_count"] == len(multiple_events)
         assert result["items"] == sorted(result["items"], key=lambda event: event["held_at"], reverse=True)
 
+    @pytest.mark.parametrize("sort_by", ["", "id", "-held_at", "name,-id", "-name,held_at"])
+    def test_list_events_cursor_pagination(
+        self, client: TestClient, multiple_events: list[models.Event], sort_by: str
+    ) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/?limit={EVENT_COUNT}&sort_by={sort_by}")
+        expected_ids = [event["id"] for event in r.json()["items"]]
+        seen_ids = []
+        cursor = None
+        for _ in range(len(multiple_events)):
+            url = f"{settings.API_V1_STR}/events/?limit=1&sort_by={sort_by}"
+            r = client.get(url if cursor is None else f"{url}&cursor={cursor}")
+            result = r.json()
+            assert r.status_code == status.HTTP_200_OK
+            assert result["total_count"] == EVENT_COUNT
+            seen_ids += [event["id"] for event in result["items"]]
+            cursor = result["next_cursor"]
+        r = client.get(f"{settings.API_V1_STR}/events/?limit=1&sort_by={sort_by}&cursor={cursor}")
+        assert r.json()["items"] == []
+        assert r.json()["next_cursor"] is None
+        assert seen_ids == expected_ids
+
+    @pytest.fixture(name="named_events")
+    def create_named_events(self, multiple_events: list[models.Event], db: Session) -> list[models.Event]:
+        names = ["Konferencja Python", "Python dla Pythonistów", "Koncert rockowy"]
+        for event, name in zip(multiple_events, names):
+            event.name = name
+        db.commit()
+        return multiple_events
+
+    @pytest.mark.parametrize(
+        "filter_,expected_names",
+        [
+            ("name__search=PYTH", {"Konferencja Python", "Python dla Pythonistów"}),
+            ("name__search=pythonist%C3%B3w", {"Python dla Pythonistów"}),
+            ("name__search=konf%20pyth", {"Konferencja Python"}),
+            ("name__search=jazz", set()),
+            ("speakers__name__search=speak", {"Konferencja Python", "Python dla Pythonistów", "Koncert rockowy"}),
+        ],
+    )
+    @pytest.mark.usefixtures("named_events")
+    def test_list_events_search(self, client: TestClient, filter_: str, expected_names: set[str]) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/?{filter_}")
+        assert r.status_code == status.HTTP_200_OK
+        assert {event["name"] for event in r.json()["items"]} == expected_names
+
+    @pytest.mark.usefixtures("named_events")
+    def test_list_events_search_sorted_by_relevance(self, client: TestClient) -> None:
+        url = f"{settings.API_V1_STR}/events/?name__search=pyth&sort_by=-relevance&limit=1"
+        names = []
+        cursor = None
+        for _ in range(2):
+            r = client.get(url if cursor is None else f"{url}&cursor={cursor}")
+            assert r.status_code == status.HTTP_200_OK
+            names += [event["name"] for event in r.json()["items"]]
+            cursor = r.json()["next_cursor"]
+        assert names == ["Python dla Pythonistów", "Konferencja Python"]
+
+    @pytest.mark.parametrize("sort_by", ["-relevance", "relevance"])
+    def test_list_events_search_sorted_by_relevance_with_ties(
+        self, client: TestClient, db: Session, event: models.Event, multiple_events: list[models.Event], sort_by: str
+    ) -> None:
+        events = [event, *multiple_events]
+        for tied_event in events:
+            tied_event.name = "Python meetup"
+        db.commit()
+        url = f"{settings.API_V1_STR}/events/?name__search=pyth&sort_by={sort_by}&limit=1"
+        seen_ids = []
+        cursor = None
+        for _ in range(len(events)):
+            r = client.get(url if cursor is None else f"{url}&cursor={cursor}")
+            assert r.status_code == status.HTTP_200_OK
+            seen_ids += [tied_event["id"] for tied_event in r.json()["items"]]
+            cursor = r.json()["next_cursor"]
+        assert sorted(seen_ids) == sorted(tied_event.id for tied_event in events)
+        assert client.get(f"{url}&cursor={cursor}").json()["items"] == []
+
+    def test_list_events_sorting_by_relevance_without_search_should_fail(self, client: TestClient) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/?sort_by=-relevance")
+        assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.fixture(name="located_events")
+    def create_located_events(self, multiple_events: list[models.Event], db: Session) -> list[models.Event]:
+        coordinates = [("Sopot", 54.4416, 18.5601), ("Warszawa", 52.2297, 21.0122), ("Gdańsk", 54.3520, 18.6466)]
+        for event, (city, latitude, longitude) in zip(multiple_events, coordinates):
+            location_in = schemas.LocationCreate(
+                name=city, city=city, slug=city.lower(), latitude=latitude, longitude=longitude
+            )
+            event.location = crud.location.create(db, obj_in=location_in)
+        db.commit()
+        return multiple_events
+
+    @pytest.mark.parametrize(
+        "radius_km, expected_cities",
+        [(1, ["Gdańsk"]), (20, ["Gdańsk", "Sopot"]), (300, ["Gdańsk", "Sopot", "Warszawa"])],
+    )
+    @pytest.mark.usefixtures("located_events")
+    def test_list_events_near_point_sorted_by_distance(
+        self, client: TestClient, radius_km: float, expected_cities: list[str]
+    ) -> None:
+        url = f"{settings.API_V1_STR}/events/?lat=54.35&lon=18.65&radius_km={radius_km}&sort_by=distance&limit=1"
+        cities = []
+        cursor = None
+        for _ in expected_cities:
+            r = client.get(url if cursor is None else f"{url}&cursor={cursor}")
+            assert r.status_code == status.HTTP_200_OK
+            assert r.json()["total_count"] == len(expected_cities)
+            cities += [event["location"]["city"] for event in r.json()["items"]]
+            cursor = r.json()["next_cursor"]
+        assert cities == expected_cities
+
+    @pytest.mark.usefixtures("located_events")
+    def test_list_events_near_point_filtered_by_location_and_speakers(self, client: TestClient) -> None:
+        filter_ = "location__city__icontains=o&speakers__name__search=speak&lat=54.35&lon=18.65&radius_km=20"
+        r = client.get(f"{settings.API_V1_STR}/events/?{filter_}&sort_by=distance")
+        assert r.status_code == status.HTTP_200_OK
+        assert [event["location"]["city"] for event in r.json()["items"]] == ["Sopot"]
+        assert r.json()["total_count"] == 1
+
+    @pytest.mark.parametrize("filter_", ["lat=54.35&lon=18.65", "lat=91&lon=18.65&radius_km=5", "sort_by=distance"])
+    def test_list_events_near_point_with_invalid_parameters_should_fail(self, client: TestClient, filter_: str) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/?{filter_}")
+        assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_list_events_with_invalid_cursor_should_fail(self, client: TestClient) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/?cursor=invalid")
+        assert r.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.parametrize(
+        "count_mode, expected_count, expected_exact",
+        [("exact", EVENT_COUNT, True), ("capped", EVENT_COUNT, True), ("none", None, False)],
+    )
+    @pytest.mark.usefixtures("multiple_events")
+    def test_list_events_count_mode(
+        self, client: TestClient, count_mode: str, expected_count: int | None, expected_exact: bool
+    ) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/?count_mode={count_mode}")
+        result = r.json()
+        assert r.status_code == status.HTTP_200_OK
+        assert len(result["items"]) == EVENT_COUNT
+        assert result["total_count"] == expected_count
+        assert result["is_total_count_exact"] == expected_exact
+
+    @pytest.mark.usefixtures("multiple_events")
+    def test_list_events_count_mode_capped_above_cap(self, client: TestClient, mocker: MockerFixture) -> None:
+        mocker.patch.object(settings, "PAGINATION_COUNT_CAP", EVENT_COUNT - 1)
+        r = client.get(f"{settings.API_V1_STR}/events/?count_mode=capped")
+        result = r.json()
+        assert result["total_count"] == EVENT_COUNT - 1
+        assert result["is_total_count_exact"] is False
+
+    @pytest.mark.usefixtures("multiple_events")
+    def test_list_events_count_mode_estimated(self, client: TestClient) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/?count_mode=estimated&name__icontains=event")
+        result = r.json()
+        assert r.status_code == status.HTTP_200_OK
+        assert isinstance(result["total_count"], int)
+        assert result["is_total_count_exact"] is False
+
     def test_list_events_filter_by_valid_event_type_id(
         self, client: TestClient, multiple_events: list[models.Event]
     ) -> None:
@@ -158,12 +355,87 @@ class TestEvents:
         assert result["total_count"] == 1
         assert result["items"][0].get("id") == event.id
 
+    def test_list_events_only_with_available_tickets_skips_sold_out(
+        self, db: Session, client: TestClient, ticket_category: ticket_models.TicketCategory
+    ) -> None:
+        ticket_category.tickets_sold = ticket_category.quota
+        db.commit()
+        r = client.get(f"{settings.API_V1_STR}/events/?only_with_available_tickets=true")
+        result = r.json()
+        assert r.status_code == status.HTTP_200_OK
+        assert result["total_count"] == 0
+
+    def test_list_events_is_cached_until_event_changes(
+        self, db: Session, client: TestClient, event: models.Event
+    ) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/")
+        assert r.headers[CACHE_STATUS_HEADER] == "MISS"
+        r = client.get(f"{settings.API_V1_STR}/events/")
+        assert r.headers[CACHE_STATUS_HEADER] == "HIT"
+        assert r.json()["items"][0].get("name") == event.name
+
+        event.name = "Renamed"
+        db.commit()
+        r = client.get(f"{settings.API_V1_STR}/events/")
+        assert r.headers[CACHE_STATUS_HEADER] == "MISS"
+        assert r.json()["items"][0].get("name") == "Renamed"
+
     def test_get_event_by_slug(self, client: TestClient, event: models.Event) -> None:
         r = client.get(f"{settings.API_V1_STR}/events/{event.slug}")
         result = r.json()
         assert r.status_code == status.HTTP_200_OK
         assert result.get("slug") == event.slug
 
+    def test_get_event_by_slug_not_modified(self, client: TestClient, event: models.Event) -> None:
+        r = client.get(f"{settings.API_V1_STR}/events/{event.slug}")
+        etag = r.headers["etag"]
+        r = client.get(f"{settings.API_V1_STR}/events/{event.slug}", headers={"If-None-Match": etag})
+        assert r.status_code == status.HTTP_304_NOT_MODIFIED
+        assert r.headers["etag"] == etag
+        assert r.headers["cache-control"] == settings.CATALOG_CACHE_CONTROL
+
+    def test_get_event_by_slug_etag_changes_with_related_data(
+        self, db: Session, client: TestClient, event: models.Event, speaker: models.Speaker
+    ) -> None:
+        etag = client.get(f"{settings.API_V1_STR}/events/{event.slug}").headers["etag"]
+        crud.event.add_speaker(db, event=event, speaker=speaker)
+        r = client.get(f"{settings.API_V1_STR}/events/{event.slug}", headers={"If-None-Match": etag})
+        assert r.status_code == status.HTTP_200_OK
+        assert r.headers["etag"] != etag
+        assert len(r.json()["speakers"]) == 1
+
+    def test_list_events_not_modified(self, db: Session, client: TestClient, event: models.Event) -> None:
+        etag = client.get(f"{settings.API_V1_STR}/events/").headers["etag"]
+        r = client.get(f"{settings.API_V1_STR}/events/", headers={"If-None-Match": etag})
+        assert r.status_code == status.HTTP_304_NOT_MODIFIED
+
+        event.location.name = "Renamed"
+        db.commit()
+        r = client.get(f"{settings.API_V1_STR}/events/", headers={"If-None-Match": etag})
+        assert r.status_code == status.HTTP_200_OK
+
+    def test_list_events_query_count(
+        self, db: Session, client: TestClient, multiple_events: list[models.Event], query_budget: Callable
+    ) -> None:
+        db.expunge_all()
+        with query_budget(2):
+            r = client.get(f"{settings.API_V1_STR}/events/")
+        assert len(r.json()["items"]) == len(multiple_events)
+
+    def test_get_event_by_slug_query_count(
+        self, db: Session, client: TestClient, multiple_events: list[models.Event], query_budget: Callable
+    ) -> None:
+        event = multiple_events[0]
+        other_speaker = crud.speaker.create(
+            db, obj_in=schemas.SpeakerCreate(name="Other", description="Description", slug="other-speaker")
+        )
+        crud.event.add_speaker(db, event=event, speaker=other_speaker)
+        slug = event.slug
+        db.expunge_all()
+        with query_budget(2):
+            r = client.get(f"{settings.API_V1_STR}/events/{slug}")
+        assert len(r.json()["speakers"]) == 2
+
     def test_get_event_by_wrong_slug_should_fail(self, client: TestClient) -> None:
         event_slug = "wrong-slug"
         r = client.get(f"{settings.API_V1_STR}/events/{event_slug}")
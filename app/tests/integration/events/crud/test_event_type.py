@@ -1,3 +1,7 @@
+from typing import Callable, ContextManager
+
+import pytest
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.events import crud, models, schemas
@@ -29,6 +33,72 @@ class TestEventType:
         assert event_type_tree
         assert event_type_tree[0].children[0].id == event_type2.id
 
+    def test_get_category_tree_in_single_query(
+        self,
+        db: Session,
+        event_type: models.EventType,
+        nested_event_type: models.EventType,
+        query_budget: Callable[[int], ContextManager[list[str]]],
+    ) -> None:
+        db.expire_all()
+        with query_budget(1):
+            event_type_tree = crud.event_type.get_event_type_tree(db)
+            root = next(node for node in event_type_tree if node.id == event_type.id)
+            assert [child.id for child in root.children] == [nested_event_type.id]
+            assert root.children[0].children == []
+
+    def get_closure(self, db: Session) -> set[tuple[int, int, int]]:
+        query = select(
+            models.EventTypeClosure.ancestor_id, models.EventTypeClosure.descendant_id, models.EventTypeClosure.depth
+        )
+        return {tuple(row) for row in db.execute(query)}  # type: ignore[misc]
+
+    def test_closure_maintained_on_create(
+        self, db: Session, event_type: models.EventType, nested_event_type: models.EventType
+    ) -> None:
+        event_type_in = schemas.EventTypeCreate(name=self.name, slug=self.slug, parent_type_id=nested_event_type.id)
+        leaf = crud.event_type.create(db, obj_in=event_type_in)
+
+        assert {row for row in self.get_closure(db) if row[1] == leaf.id} == {
+            (leaf.id, leaf.id, 0),
+            (nested_event_type.id, leaf.id, 1),
+            (event_type.id, leaf.id, 2),
+        }
+
+    def test_closure_maintained_on_move(
+        self, db: Session, event_type: models.EventType, nested_event_type: models.EventType
+    ) -> None:
+        event_type_in = schemas.EventTypeCreate(name=self.name, slug=self.slug, parent_type_id=nested_event_type.id)
+        leaf = crud.event_type.create(db, obj_in=event_type_in)
+        other_root = crud.event_type.create(db, obj_in=schemas.EventTypeCreate(name="other", slug="other"))
+
+        nested_event_type.parent = other_root
+        db.commit()
+        maintained = self.get_closure(db)
+        crud.event_type.rebuild_closure(db)
+
+        assert (other_root.id, leaf.id, 2) in maintained
+        assert not {row for row in maintained if row[0] == event_type.id and row[1] != event_type.id}
+        assert maintained == self.get_closure(db)
+
+    def test_renaming_does_not_touch_closure(
+        self,
+        db: Session,
+        nested_event_type: models.EventType,
+        query_budget: Callable[[int], ContextManager[list[str]]],
+    ) -> None:
+        nested_event_type.name = "renamed"
+        with query_budget(1):
+            db.flush()
+
+    def test_moving_under_own_descendant_should_fail(
+        self, db: Session, event_type: models.EventType, nested_event_type: models.EventType
+    ) -> None:
+        event_type.parent_type_id = nested_event_type.id
+        with pytest.raises(ValueError):
+            db.commit()
+        db.rollback()
+
     def test_get_parent_hierarchy(
         self, db: Session, event_type: models.EventType, nested_event_type: models.EventType
     ) -> None:
@@ -0,0 +1,186 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import delete, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.auth.models import User
+from app.common.models import ImportCheckpoint
+from app.events.models import Event, EventType, EventTypeClosure, Location, Organizer, Speaker
+from app.tickets import crud
+from app.tickets.models import TicketCategory
+from app.tickets.schemas import TicketCreate
+from cli import EXPORT_GROUPS, DBDataExporter, DBDataImporter, iter_json_rows, iter_ndjson_rows, iter_row_chunks
+
+
+def write_example_data(tmp_path: Path, user_id: int) -> str:
+    data = [
+        {
+            "model": "Event",
+            "data": [
+                {
+                    "id": 1,
+                    "name": "Konferencja",
+                    "slug": "konferencja",
+                    "held_at": "2030-05-01T18:00:00",
+                    "organizer_id": 1,
+                    "created_by_id": user_id,
+                    "event_type_id": 2,
+                    "location_id": 1,
+                }
+            ],
+        },
+        {"model": "event_speaker", "data": [{"event_id": 1, "speaker_id": 1}]},
+        {"model": "Speaker", "data": [{"id": 1, "name": "Jan", "slug": "jan"}]},
+        {
+            "model": "EventType",
+            "data": [
+                {"id": 1, "parent_type_id": None, "name": "IT", "slug": "it"},
+                {"id": 2, "parent_type_id": 1, "name": "Python", "slug": "python"},
+            ],
+        },
+        {"model": "Organizer", "data": [{"id": 1, "name": "Organizator"}]},
+        {
+            "model": "Location",
+            "data": [
+                {
+                    "id": 1,
+                    "name": "Ergo Arena",
+                    "city": "Gdańsk",
+                    "slug": "ergo-arena",
+                    "longitude": 18.58,
+                    "latitude": 54.43,
+                }
+            ],
+        },
+    ]
+    file_path = tmp_path / "data.json"
+    file_path.write_text(json.dumps(data), encoding="utf-8")
+    return str(file_path)
+
+
+def test_populate_db_bulk_inserts_tables_in_dependency_order(db: Session, test_user: User, tmp_path: Path) -> None:
+    file_path = write_example_data(tmp_path, test_user.id)
+
+    DBDataImporter(db).from_json(file_path, bulk=True, chunk_size=1)
+    organizer = Organizer(name="Inny organizator")
+    db.add(organizer)
+    db.flush()
+
+    event, event_type, location = db.get(Event, 1), db.get(EventType, 2), db.get(Location, 1)
+    assert organizer.id == 2
+    assert event is not None and event.speakers[0].name == "Jan"
+    assert event_type is not None and event_type.parent_type_id == 1
+    assert location is not None and location.city == "Gdańsk"
+    closure = select(EventTypeClosure.ancestor_id, EventTypeClosure.descendant_id, EventTypeClosure.depth)
+    assert set(db.execute(closure).tuples()) == {(1, 1, 0), (1, 2, 1), (2, 2, 0)}
+
+
+def test_iter_row_chunks_splits_on_size_and_columns() -> None:
+    rows = [{"a": 1}, {"a": 2}, {"a": 3}, {"a": 4, "b": 1}, {"a": 5, "b": 2}]
+
+    assert list(iter_row_chunks(rows, 2)) == [[{"a": 1}, {"a": 2}], [{"a": 3}], rows[3:]]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_json_rows_streams_entries(chunk_size: int) -> None:
+    content = '[{"model": "A", "data": [{"id": 1, "n": 12345}, {"id": 2, "s": "ł ]},"}]}, {"model": "B", "data": []}]'
+
+    rows = list(iter_json_rows(io.StringIO(content), chunk_size=chunk_size))
+
+    assert rows == [("A", {"id": 1, "n": 12345}), ("A", {"id": 2, "s": "ł ]},"})]
+
+
+@pytest.mark.parametrize("content", ['{"model": "A"}', '[{"data": [], "model": "A"}]', '[{"model": "A"} {}]'])
+def test_iter_json_rows_with_invalid_content_should_raise_error(content: str) -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_rows(io.StringIO(content)))
+
+
+def test_iter_ndjson_rows_skips_blank_lines() -> None:
+    content = '{"model": "A", "data": {"id": 1}}\n\n{"model": "B", "data": {"id": 2}}\n'
+
+    assert list(iter_ndjson_rows(io.StringIO(content))) == [("A", {"id": 1}), ("B", {"id": 2})]
+
+
+def test_populate_db_stream_resumes_from_checkpoint(db: Session, test_user: User, tmp_path: Path) -> None:
+    file_path = tmp_path / "data.ndjson"
+    rows = [
+        {"model": "Organizer", "data": {"id": 1, "name": "Organizator"}},
+        {"model": "EventType", "data": {"id": 1, "parent_type_id": None, "name": "IT", "slug": "it"}},
+        {"model": "EventType", "data": {"id": 2, "parent_type_id": 1, "name": "Python", "slug": "python"}},
+        {"model": "EventType", "data": {"id": 3, "parent_type_id": 1, "name": "Rust", "slug": "rust"}},
+    ]
+    file_path.write_text("\n".join(json.dumps(row) for row in rows), encoding="utf-8")
+    checkpoint = ImportCheckpoint(source=str(file_path), rows=2, tables=["organizer", "eventtype"])
+    db.add_all([Organizer(id=1, name="Organizator"), EventType(id=1, name="IT", slug="it"), checkpoint])
+    db.flush()
+
+    DBDataImporter(db).from_stream(str(file_path), batch_size=1)
+    organizer = Organizer(name="Inny organizator")
+    db.add(organizer)
+    db.flush()
+
+    assert [event_type.slug for event_type in db.query(EventType).order_by(EventType.id)] == ["it", "python", "rust"]
+    assert organizer.id == 2
+    assert db.get(ImportCheckpoint, str(file_path)) is None
+
+
+def test_populate_db_stream_checkpoint_covers_only_committed_batches(db: Session, tmp_path: Path) -> None:
+    file_path = tmp_path / "data.ndjson"
+    rows = [
+        {"model": "Organizer", "data": {"id": 1, "name": "Organizator"}},
+        {"model": "Organizer", "data": {"id": 1, "name": "Organizator"}},
+    ]
+    file_path.write_text("\n".join(json.dumps(row) for row in rows), encoding="utf-8")
+
+    with pytest.raises(IntegrityError):
+        DBDataImporter(db).from_stream(str(file_path), batch_size=1)
+    db.rollback()
+
+    checkpoint = db.get(ImportCheckpoint, str(file_path))
+    assert checkpoint is not None
+    assert (checkpoint.rows, checkpoint.tables) == (1, ["organizer"])
+
+
+@pytest.mark.parametrize("output_format", ["ndjson", "json"])
+def test_exported_events_and_tickets_can_be_imported_back(
+    db: Session,
+    ticket_category: TicketCategory,
+    speaker: Speaker,
+    test_user: User,
+    tmp_path: Path,
+    output_format: str,
+) -> None:
+    event = ticket_category.event
+    event.speakers.append(speaker)
+    ticket_in = TicketCreate(email="holder@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+    crud.ticket.create(db, obj_in=ticket_in)
+    db.execute(text("UPDATE event SET poster_vertical = 'event-1.webp'"))
+    db.commit()
+    exporter = DBDataExporter(db)
+    model_names = EXPORT_GROUPS["events"] + EXPORT_GROUPS["tickets"]
+    tables = [table for _, table in exporter.iter_tables(model_names)]
+    snapshot = {table.name: list(exporter.iter_rows(table, chunk_size=1)) for table in tables}
+    file_path = tmp_path / f"data.{output_format}"
+
+    with open(file_path, "w", encoding="utf-8") as file:
+        getattr(exporter, f"to_{output_format}")(file, model_names, chunk_size=1)
+    for table in reversed(tables):
+        db.execute(delete(table))
+    DBDataImporter(db).from_stream(str(file_path), batch_size=2)
+
+    assert [table.name for table in tables][-2:] == ["ticketcategory", "ticket"]
+    assert {table.name: list(exporter.iter_rows(table, chunk_size=1)) for table in tables} == snapshot
+    assert db.execute(select(Event.poster_vertical).where(Event.id == event.id)).scalar_one().name == "event-1.webp"
+
+
+def test_export_to_csv_writes_file_per_table(db: Session, speaker: Speaker, tmp_path: Path) -> None:
+    DBDataExporter(db).to_csv(str(tmp_path), ["Speaker"])
+
+    lines = (tmp_path / "speaker.csv").read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "id,name,slug,photo,description,updated_at"
+    assert lines[1].startswith(f"{speaker.id},Speaker,speaker,,Description,")
@@ -1,7 +1,14 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.session import get_engine_options
 
 engine = create_engine(settings.SQLALCHEMY_TEST_DATABASE_URI)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+async_engine = create_async_engine(
+    make_url(settings.SQLALCHEMY_TEST_DATABASE_URI).set(drivername="postgresql+asyncpg"),
+    **get_engine_options(is_async=True),
+)
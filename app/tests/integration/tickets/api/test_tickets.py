@@ -1,5 +1,5 @@
 import datetime
-from typing import Any
+from typing import Any, Callable
 
 import pytest
 from fastapi import status
@@ -56,6 +56,27 @@ class TestTickets:  # pylint: disable=R0904
         assert r.status_code == status.HTTP_200_OK
         assert len(result) == len(user_tickets)
 
+    @pytest.mark.parametrize("with_event_id", [False, True])
+    def test_get_tickets_by_user_query_count(  # pylint: disable=R0913
+        self,
+        db: Session,
+        client: TestClient,
+        event: Event,
+        user_tickets: list[Ticket],
+        normal_user_token_headers: dict[str, str],
+        query_budget: Callable,
+        with_event_id: bool,
+    ) -> None:
+        url = (
+            f"{settings.API_V1_STR}/tickets/?event_id={event.id}"
+            if with_event_id
+            else f"{settings.API_V1_STR}/tickets/"
+        )
+        db.expunge_all()
+        with query_budget(2):
+            r = client.get(url, headers=normal_user_token_headers)
+        assert len(r.json()) == len(user_tickets)
+
     @pytest.mark.usefixtures("user_tickets")
     def test_get_tickets_by_user_and_event_with_invalid_event_id(
         self,
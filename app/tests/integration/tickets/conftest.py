@@ -11,7 +11,9 @@ from app.tickets.schemas import TicketCategoryCreate, TicketCreate
 @pytest.fixture(name="ticket")
 def get_ticket(db: Session, ticket_category: TicketCategory, test_user: User) -> Ticket:
     ticket_in = TicketCreate(email="email@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
-    return crud.ticket.create(db, obj_in=ticket_in)
+    ticket = crud.ticket.reserve(db, obj_in=ticket_in)
+    assert ticket is not None
+    return ticket
 
 
 @pytest.fixture(name="ticket_categories")
@@ -29,6 +31,7 @@ def get_user_tickets(db: Session, ticket_categories: list[TicketCategory], test_
     tickets = []
     for category in ticket_categories:
         ticket_in = TicketCreate(email="email@example.com", user_id=test_user.id, ticket_category_id=category.id)
-        ticket = crud.ticket.create(db, obj_in=ticket_in)
+        ticket = crud.ticket.reserve(db, obj_in=ticket_in)
+        assert ticket is not None
         tickets.append(ticket)
     return tickets
@@ -31,6 +31,45 @@ class TestTicket:
         assert ticket.ticket_category_id == ticket_in.ticket_category_id
         assert ticket.user_id == ticket_in.user_id
 
+    def test_reserve(self, db: Session, test_user: User, ticket_category: TicketCategory) -> None:
+        ticket_in = TicketCreate(email="email@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+        ticket = crud.ticket.reserve(db, obj_in=ticket_in)
+        db.refresh(ticket_category)
+        assert isinstance(ticket, Ticket)
+        assert ticket_category.tickets_sold == 1
+
+    def test_reserve_if_no_tickets_left(self, db: Session, test_user: User, ticket_category: TicketCategory) -> None:
+        ticket_category.tickets_sold = ticket_category.quota
+        db.commit()
+        ticket_in = TicketCreate(email="email@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+        ticket = crud.ticket.reserve(db, obj_in=ticket_in)
+        db.refresh(ticket_category)
+        assert ticket is None
+        assert ticket_category.tickets_sold == ticket_category.quota
+        assert crud.ticket.get_count_for_ticket_category(db, ticket_category_id=ticket_category.id) == 0
+
+    def test_reserve_if_no_tickets_left_keeps_pending_changes(
+        self, db: Session, test_user: User, ticket_category: TicketCategory, ticket_category_second: TicketCategory
+    ) -> None:
+        ticket_category.tickets_sold = ticket_category.quota
+        db.commit()
+        ticket_category_second.name = "renamed"
+        ticket_in = TicketCreate(email="email@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+        ticket = crud.ticket.reserve(db, obj_in=ticket_in)
+        db.commit()
+        db.refresh(ticket_category_second)
+        assert ticket is None
+        assert ticket_category_second.name == "renamed"
+
+    def test_remove_releases_seat(self, db: Session, test_user: User, ticket_category: TicketCategory) -> None:
+        ticket_in = TicketCreate(email="email@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+        ticket = crud.ticket.reserve(db, obj_in=ticket_in)
+        assert ticket is not None
+        crud.ticket.remove(db, id_=ticket.id)
+        db.refresh(ticket_category)
+        assert ticket_category.tickets_sold == 0
+        assert crud.ticket.get(db, id_=ticket.id) is None
+
     def test_get_by_token(self, db: Session, ticket: Ticket) -> None:
         ticket_by_token = crud.ticket.get_by_token(db, token=ticket.token)
         assert ticket_by_token == ticket
@@ -70,3 +109,13 @@ class TestTicket:
         assert len(tickets) == 2
         assert ticket in tickets
         assert ticket_second in tickets
+
+    def test_get_holder_emails(
+        self, db: Session, ticket_category: TicketCategory, ticket: Ticket, ticket_second: Ticket, test_user: User
+    ) -> None:
+        ticket_in = TicketCreate(email="other@example.com", user_id=test_user.id, ticket_category_id=ticket_category.id)
+        crud.ticket.create(db, obj_in=ticket_in)
+
+        emails = crud.ticket.get_holder_emails(db, event_id=ticket_category.event_id, chunk_size=1)
+
+        assert sorted(emails) == sorted({ticket.email, ticket_second.email, "other@example.com"})
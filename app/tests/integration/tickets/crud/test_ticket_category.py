@@ -36,3 +36,12 @@ class TestTicketCategory:
         tickets_quota = category[0].quota
         tickets_left = category[1]
         assert tickets_left == tickets_quota - 1
+
+    @pytest.mark.usefixtures("ticket")
+    def test_reconcile_tickets_sold(self, db: Session, ticket_category: TicketCategory) -> None:
+        ticket_category.tickets_sold = 50
+        db.commit()
+        corrected = crud.ticket_category.reconcile_tickets_sold(db)
+        db.refresh(ticket_category)
+        assert corrected == 1
+        assert ticket_category.tickets_sold == 1
@@ -0,0 +1,75 @@
+# pylint: disable=W0621
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Generator
+
+import pytest
+from sqlalchemy import delete, select
+
+from app.auth.models import User
+from app.core.config import settings
+from app.events.models import Event, EventType, Location, Organizer
+from app.tests.integration.test_db_config.session import TestingSessionLocal
+from app.tickets import crud
+from app.tickets.models import Ticket, TicketCategory
+from app.tickets.schemas import TicketCreate
+
+QUOTA = 10
+BUYERS = 50
+
+
+@pytest.fixture()
+def committed_category() -> Generator:
+    """
+    Ticket category committed to the database, so that it is visible to sessions opened by other threads
+    """
+    session = TestingSessionLocal()
+    user = session.execute(select(User).where(User.email == settings.TEST_USER_EMAIL)).scalar_one()
+    location = Location(name="Location", city="City", slug="concurrency-location", latitude=50.0, longitude=18.0)
+    organizer = Organizer(name="Concurrency organizer")
+    event_type = EventType(name="Concurrency", slug="concurrency-event-type")
+    event = Event(
+        name="Concurrency event",
+        slug="concurrency-event",
+        held_at=datetime.now() + timedelta(days=30),
+        location=location,
+        organizer=organizer,
+        event_type=event_type,
+        created_by_id=user.id,
+    )
+    category = TicketCategory(name="category", quota=QUOTA, event=event)
+    session.add(category)
+    session.commit()
+
+    yield category.id, user.id
+
+    session.execute(delete(Ticket).where(Ticket.ticket_category_id == category.id))
+    for instance in (category, event, location, organizer, event_type):
+        session.delete(instance)
+    session.commit()
+    session.close()
+
+
+def reserve_in_new_session(ticket_category_id: int, user_id: int) -> bool:
+    session = TestingSessionLocal()
+    try:
+        ticket_in = TicketCreate(email="email@example.com", user_id=user_id, ticket_category_id=ticket_category_id)
+        return crud.ticket.reserve(session, obj_in=ticket_in) is not None
+    finally:
+        session.close()
+
+
+def test_concurrent_reservations_do_not_exceed_quota(committed_category: tuple[int, int]) -> None:
+    ticket_category_id, user_id = committed_category
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [executor.submit(reserve_in_new_session, ticket_category_id, user_id) for _ in range(BUYERS)]
+        results = [future.result() for future in futures]
+
+    session = TestingSessionLocal()
+    tickets_count = crud.ticket.get_count_for_ticket_category(session, ticket_category_id=ticket_category_id)
+    category = crud.ticket_category.get(session, id_=ticket_category_id)
+    session.close()
+
+    assert sum(results) == QUOTA
+    assert tickets_count == QUOTA
+    assert category is not None and category.tickets_sold == QUOTA
@@ -0,0 +1,53 @@
+from contextlib import contextmanager
+from typing import Any, Generator
+
+from sqlalchemy import Connection, Engine, event  # type: ignore[attr-defined]
+
+
+@contextmanager
+def assert_max_queries(engine: Engine, budget: int) -> Generator[list[str], None, None]:
+    """
+    Fail when the block executes more SQL statements through the engine than its budget, leaving out
+    the savepoints the test session wraps every commit in
+    """
+    statements: list[str] = []
+
+    def record_statement(*args: Any) -> None:
+        statement = args[2]
+        if "SAVEPOINT" not in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+    executed = "\n".join(statements)
+    assert len(statements) <= budget, f"Expected at most {budget} queries, {len(statements)} executed:\n{executed}"
+
+
+@contextmanager
+def record_queries(engine: Engine) -> Generator[list[tuple[str, Any]], None, None]:
+    """
+    Collect the SQL statements executed through the engine within the block, together with their parameters
+    """
+    queries: list[tuple[str, Any]] = []
+
+    def record_statement(*args: Any) -> None:
+        statement, parameters = args[2], args[3]
+        if "SAVEPOINT" not in statement:
+            queries.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+
+def explain(connection: Connection, statement: str, parameters: Any) -> str:
+    """
+    Plan PostgreSQL would execute the statement with, in the text format
+    """
+    result = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(row[0] for row in result)
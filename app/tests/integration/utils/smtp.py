@@ -0,0 +1,68 @@
+import asyncio
+from email import message_from_bytes
+from email.message import Message
+from types import TracebackType
+from typing import Type
+
+from app.common.emails import SMTPConnection
+
+
+class SMTPStub:
+    """
+    Minimal SMTP server on localhost collecting the received messages, rejecting the given recipients
+    """
+
+    def __init__(self, rejected_recipients: tuple[str, ...] = ()) -> None:
+        self.rejected_recipients = rejected_recipients
+        self.messages: list[Message] = []
+        self.connections = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> "SMTPStub":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(
+        self, exc_type: Type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def connect(self) -> SMTPConnection:
+        return SMTPConnection("127.0.0.1", self.port, start_tls=False)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        writer.write(b"220 localhost SMTP stub\r\n")
+        while line := await reader.readline():
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                reply = "250 localhost"
+            elif command.startswith("MAIL FROM"):
+                reply = "250 OK"
+            elif command.startswith("RCPT TO"):
+                recipient = command.split(":", 1)[1].strip(" <>").lower()
+                if recipient in self.rejected_recipients:
+                    reply = "550 Mailbox unavailable"
+                else:
+                    reply = "250 OK"
+            elif command == "DATA":
+                writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                data = b""
+                while (chunk := await reader.readline()) != b".\r\n":
+                    data += chunk
+                self.messages.append(message_from_bytes(data))
+                reply = "250 OK"
+            elif command in ("RSET", "NOOP"):
+                reply = "250 OK"
+            elif command == "QUIT":
+                writer.write(b"221 Bye\r\n")
+                break
+            else:
+                reply = "502 Command not implemented"
+            writer.write(f"{reply}\r\n".encode())
+            await writer.drain()
+        writer.close()
@@ -6,7 +6,7 @@ from fastapi.responses import RedirectResponse
 from pytest_mock import MockerFixture
 from sqladmin import ModelView
 
-from app.admin_panel.views import EventView
+from app.admin_panel.views import EventView, UserView
 from app.admin_panel.views.registry import register_view
 
 
@@ -72,3 +72,14 @@ async def test_event_change_status_updates_models_with_given_pk(
 
     calls = [call(mock_request, pk=key, data={"is_active": is_active}) for key in pks.split(",")]
     mock_update_model.assert_has_calls(calls)
+
+
+@pytest.mark.asyncio
+async def test_user_after_model_change_invalidates_cached_principal(mocker: MockerFixture) -> None:
+    mock_invalidate = mocker.patch("app.admin_panel.views.auth.principal_cache.invalidate")
+    user = Mock(id=99)
+
+    # called the way sqladmin calls it after saving the form
+    await UserView().after_model_change({}, user, False)
+
+    mock_invalidate.assert_called_once_with(99)
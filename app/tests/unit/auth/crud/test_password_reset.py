@@ -10,12 +10,16 @@ from app.auth.schemas import PasswordResetTokenCreate
 
 
 def test_create_should_rollback_on_integrity_error(mock_db: Mock) -> None:
-    mock_db.commit.side_effect = [IntegrityError("IntegrityError raised", orig=BaseException(), params=None), None]
+    mock_db.begin_nested.return_value.commit.side_effect = [
+        IntegrityError("IntegrityError raised", orig=BaseException(), params=None),
+        None,
+    ]
     obj_in = PasswordResetTokenCreate(user_id=1)
 
     crud.password_reset_token.create(mock_db, obj_in=obj_in)
 
-    mock_db.rollback.assert_called_once()
+    mock_db.begin_nested.return_value.rollback.assert_called_once()
+    mock_db.commit.assert_not_called()
 
 
 def test_create_contains_user_id(mock_db: Mock) -> None:
@@ -1,5 +1,5 @@
 from typing import Any, Callable
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest_mock import MockerFixture
@@ -16,6 +16,16 @@ def test_create_hashes_password(mock_db: Mock) -> None:
     assert result.hashed_password != password
 
 
+def test_create_uses_given_password_hash(mock_db: Mock, mocker: MockerFixture) -> None:
+    mock_get_password_hash = mocker.patch("app.auth.crud.crud_user.get_password_hash")
+    obj_in = schemas.UserCreate(email="email@example.com", password="Test1234!")
+
+    result = crud.user.create(mock_db, obj_in=obj_in, hashed_password="hash")
+
+    assert result.hashed_password == "hash"
+    mock_get_password_hash.assert_not_called()
+
+
 def test_update_saves_lowercase_email(mock_db: Mock) -> None:
     email = "EMAIL@example.com"
     obj_in = schemas.UserUpdate(email=email)
@@ -76,29 +86,61 @@ def test_authenticate_by_mail(
     assert_function: Callable[[Any], bool],
 ) -> None:
     mocker.patch.object(crud.user, "get_by_email", return_value=user)
-    mocker.patch("app.auth.crud.crud_user.verify_password", return_value=password_valid)
+    mocker.patch("app.auth.crud.crud_user.verify_and_update_password", return_value=(password_valid, None))
     result = crud.user.authenticate_by_mail(mock_db, email="email", password="password")
 
     assert assert_function(result)
 
 
+@pytest.mark.parametrize("new_hash", ["new-hash", None])
+def test_authenticate_by_mail_rehashes_outdated_password(
+    mock_db: Mock, mocker: MockerFixture, new_hash: str | None
+) -> None:
+    user = Mock(hashed_password="old-hash")
+    mocker.patch.object(crud.user, "get_by_email", return_value=user)
+    mocker.patch("app.auth.crud.crud_user.verify_and_update_password", return_value=(True, new_hash))
+
+    crud.user.authenticate_by_mail(mock_db, email="email", password="password")
+
+    assert user.hashed_password == (new_hash or "old-hash")
+    assert mock_db.commit.called == bool(new_hash)
+
+
+@pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "password_valid",
+    "user,password_valid,assert_function",
     [
-        True,
-        False,
+        (Mock(), True, lambda x: x is not None),
+        (None, True, lambda x: x is None),
+        (Mock(), False, lambda x: x is None),
     ],
 )
-def test_check_password(
-    mock_db: Mock,
+async def test_async_authenticate_by_mail(
+    mock_async_db: AsyncMock,
     mocker: MockerFixture,
+    user: Mock | None,
     password_valid: bool,
+    assert_function: Callable[[Any], bool],
 ) -> None:
-    user = Mock()
-    mocker.patch.object(crud.user, "authenticate_by_mail", return_value=user if password_valid else None)
-    result = crud.user.check_password(mock_db, user=user, password="password")
+    mocker.patch.object(crud.async_user, "get_by_email", return_value=user)
+    mocker.patch("app.auth.crud.crud_user.verify_and_update_password_async", return_value=(password_valid, None))
+    result = await crud.async_user.authenticate_by_mail(mock_async_db, email="email", password="password")
+
+    assert assert_function(result)
+
+
+@pytest.mark.asyncio
+async def test_async_authenticate_by_mail_rehashes_outdated_password(
+    mock_async_db: AsyncMock, mocker: MockerFixture
+) -> None:
+    user = Mock(hashed_password="old-hash")
+    mocker.patch.object(crud.async_user, "get_by_email", return_value=user)
+    mocker.patch("app.auth.crud.crud_user.verify_and_update_password_async", return_value=(True, "new-hash"))
+
+    await crud.async_user.authenticate_by_mail(mock_async_db, email="email", password="password")
 
-    assert result == password_valid
+    assert user.hashed_password == "new-hash"
+    mock_async_db.commit.assert_awaited_once()
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+
+from app.auth.cache import PrincipalCache
+from app.auth.schemas import Principal
+from app.common.cache import MemoryCacheBackend
+
+
+def create_principal(id_: int) -> Principal:
+    return Principal(
+        id=id_,
+        email=f"user{id_}@example.com",
+        is_activated=True,
+        is_disabled=False,
+        is_superuser=False,
+        joined_at=datetime(2023, 1, 1),
+    )
+
+
+@pytest.fixture(name="principal_cache")
+def get_principal_cache() -> PrincipalCache:
+    return PrincipalCache(MemoryCacheBackend(), ttl=60)
+
+
+def test_principal_cache_get_and_set(principal_cache: PrincipalCache) -> None:
+    principal = create_principal(1)
+
+    principal_cache.set(principal, "token")
+
+    assert principal_cache.get(1, "token") == principal
+    assert principal_cache.get("1", "token") == principal
+    assert principal_cache.get(1, "other-token") is None
+
+
+def test_principal_cache_key_does_not_contain_raw_token(principal_cache: PrincipalCache) -> None:
+    token = "secret-access-token"
+
+    key = principal_cache.make_key(1, token)
+
+    assert key.startswith("principal:1:")
+    assert token not in key
+
+
+def test_principal_cache_invalidate_user(principal_cache: PrincipalCache) -> None:
+    principal_cache.set(create_principal(1), "token")
+    principal_cache.set(create_principal(1), "other-token")
+    principal_cache.set(create_principal(11), "token")
+
+    principal_cache.invalidate(1)
+
+    assert principal_cache.get(1, "token") is None
+    assert principal_cache.get(1, "other-token") is None
+    assert principal_cache.get(11, "token") is not None
+
+
+def test_principal_cache_invalidate_all(principal_cache: PrincipalCache) -> None:
+    principal_cache.set(create_principal(1), "token")
+    principal_cache.set(create_principal(2), "token")
+
+    principal_cache.invalidate()
+
+    assert principal_cache.get(1, "token") is None
+    assert principal_cache.get(2, "token") is None
+
+
+def test_principal_cache_disabled_with_non_positive_ttl() -> None:
+    principal_cache = PrincipalCache(MemoryCacheBackend(), ttl=0)
+
+    principal_cache.set(create_principal(1), "token")
+
+    assert principal_cache.get(1, "token") is None
@@ -1,7 +1,8 @@
 # pylint: disable=R0913
+import asyncio
 from contextlib import contextmanager
 from typing import Generator, Type
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest_mock import MockerFixture
@@ -10,6 +11,10 @@ from app.auth import crud
 from app.auth.deps import (
     authenticate_and_authorize_user,
     create_verification_token,
+    get_login_slots,
+    hash_new_password,
+    hash_registration_password,
+    hash_reset_password,
     invalidate_password_reset_token,
     open_registration_allowed,
     process_reset_password_request,
@@ -21,12 +26,15 @@ from app.auth.deps import (
     user_update_unique_email,
     validate_unique_email,
     verify_account,
+    verify_current_password,
 )
 from app.auth.exceptions import (
     EmailAlreadyTaken,
     InvalidCredentials,
+    InvalidCurrentPassword,
     InvalidToken,
     OpenRegistrationNotAllowed,
+    TooManyLoginAttempts,
     UserDisabled,
     UserNotActivated,
 )
@@ -58,14 +66,10 @@ def get_mock_current_user() -> Mock:
     return Mock(id=1)
 
 
-@pytest.fixture(name="mock_background_tasks")
-def get_mock_background_tasks() -> Mock:
-    return Mock()
-
-
-@pytest.fixture(name="mock_mailer")
-def get_mock_mailer() -> Mock:
-    return Mock()
+@pytest.fixture(name="mock_outbox_email")
+def get_mock_outbox_email(mocker: MockerFixture) -> Mock:
+    mocked = mocker.patch("app.auth.deps.outbox_email")
+    return mocked
 
 
 @pytest.fixture(name="mock_validate_email")
@@ -192,9 +196,18 @@ def test_open_registration_allowed_when_disallowed() -> None:
 
 def test_register_user_creates_user(mock_db: Mock, mock_crud_user: Mock) -> None:
     form = UserCreate(email="email@example.com", password=generate_valid_password())
-    register_user(mock_db, registration_form=form)
+    register_user(mock_db, registration_form=form, hashed_password="hash")
 
     mock_crud_user.create.assert_called_once()
+    assert mock_crud_user.create.call_args.kwargs["hashed_password"] == "hash"
+
+
+@pytest.mark.asyncio
+async def test_hash_registration_password_uses_password_executor(mocker: MockerFixture) -> None:
+    mock_hash = mocker.patch("app.auth.deps.security.get_password_hash_async", return_value="hash")
+
+    assert await hash_registration_password(registration_form=Mock(password="password")) == "hash"
+    mock_hash.assert_awaited_once_with("password")
 
 
 def test_create_verification_token(mock_db: Mock, mock_crud_verification_token: Mock) -> None:
@@ -205,27 +218,24 @@ def test_create_verification_token(mock_db: Mock, mock_crud_verification_token:
     mock_crud_verification_token.create.assert_called_once()
 
 
-def test_register_new_user_and_send_verification_email_returns_user(mocker: MockerFixture) -> None:
+@pytest.mark.usefixtures("mock_outbox_email")
+def test_register_new_user_and_send_verification_email_returns_user(mock_db: Mock, mocker: MockerFixture) -> None:
     user_mock = Mock()
-    mock = Mock()
     mocker.patch("app.auth.deps.send_new_user_email")
-    result = register_new_user_and_send_verification_email(
-        user=user_mock, token=mock, background_tasks=mock, mailer=mock
-    )
+    result = register_new_user_and_send_verification_email(mock_db, user=user_mock, token=Mock())
 
     assert result == user_mock
 
 
 def test_register_new_user_and_send_verification_email_sends_email(
-    mock_background_tasks: Mock, mock_mailer: Mock, mocker: MockerFixture
+    mock_db: Mock, mock_outbox_email: Mock, mocker: MockerFixture
 ) -> None:
     mock = Mock()
     mock_send_email = mocker.patch("app.auth.deps.send_new_user_email")
-    register_new_user_and_send_verification_email(
-        user=mock, token=mock, background_tasks=mock_background_tasks, mailer=mock_mailer
-    )
+    register_new_user_and_send_verification_email(mock_db, user=mock, token=mock)
 
-    mock_background_tasks.add_task.assert_called_once_with(mock_mailer.send, mock_send_email())
+    mock_outbox_email.enqueue.assert_called_once_with(mock_db, message=mock_send_email())
+    mock_db.commit.assert_called_once()
 
 
 def verify_account_if_token_does_not_exist_should_raise_error(mock_db: Mock) -> None:
@@ -261,27 +271,88 @@ def verify_account_should_remove_verification_token(mock_db: Mock, mock_crud_ver
         (Mock(is_activated=True, is_disabled=False), None),
     ],
 )
-def test_authenticate_and_authorize_user(
-    mock_db: Mock, user: Mock | None, exc: Type[Exception] | None, mocker: MockerFixture
+@pytest.mark.asyncio
+async def test_authenticate_and_authorize_user(
+    mock_async_db: AsyncMock, user: Mock | None, exc: Type[Exception] | None, mocker: MockerFixture
 ) -> None:
-    mocker.patch.object(crud.user, "authenticate_by_mail", return_value=user)
+    mocker.patch.object(crud.async_user, "authenticate_by_mail", return_value=user)
     if exc is not None:
         with pytest.raises(exc):
-            authenticate_and_authorize_user(mock_db, form_data=Mock())
+            await authenticate_and_authorize_user(mock_async_db, form_data=Mock())
     else:
-        token = authenticate_and_authorize_user(mock_db, form_data=Mock())
+        token = await authenticate_and_authorize_user(mock_async_db, form_data=Mock())
         assert isinstance(token, str)
 
 
+def test_get_login_slots_creates_semaphore_per_event_loop() -> None:
+    async def get_login_slots_twice() -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        return get_login_slots(), get_login_slots()
+
+    first, first_again = asyncio.run(get_login_slots_twice())
+    second, _ = asyncio.run(get_login_slots_twice())
+
+    assert first is first_again
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_authenticate_and_authorize_user_releases_login_slot(
+    mock_async_db: AsyncMock, mocker: MockerFixture
+) -> None:
+    login_slots = asyncio.Semaphore(1)
+    mocker.patch("app.auth.deps.get_login_slots", return_value=login_slots)
+    mocker.patch.object(crud.async_user, "authenticate_by_mail", return_value=None)
+
+    with pytest.raises(InvalidCredentials):
+        await authenticate_and_authorize_user(mock_async_db, form_data=Mock())
+
+    assert not login_slots.locked()
+
+
+@pytest.mark.asyncio
+async def test_authenticate_and_authorize_user_without_free_login_slot_should_fail(
+    mock_async_db: AsyncMock, mocker: MockerFixture
+) -> None:
+    login_slots = asyncio.Semaphore(1)
+    await login_slots.acquire()
+    mocker.patch("app.auth.deps.get_login_slots", return_value=login_slots)
+    mocker.patch.object(settings, "LOGIN_QUEUE_TIMEOUT_SECONDS", 0.01)
+    mock_authenticate = mocker.patch.object(crud.async_user, "authenticate_by_mail")
+
+    with pytest.raises(TooManyLoginAttempts):
+        await authenticate_and_authorize_user(mock_async_db, form_data=Mock())
+
+    mock_authenticate.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("verified,exc", [(True, None), (False, InvalidCurrentPassword)])
+async def test_verify_current_password(verified: bool, exc: Type[Exception] | None, mocker: MockerFixture) -> None:
+    mocker.patch("app.auth.deps.security.verify_password_async", return_value=verified)
+    user_in = Mock(current_password="password")
+    if exc is not None:
+        with pytest.raises(exc):
+            await verify_current_password(Mock(), user_in=user_in)
+    else:
+        assert await verify_current_password(Mock(), user_in=user_in) == user_in
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("new_password,expected", [("password", "hash"), (None, None)])
+async def test_hash_new_password(new_password: str | None, expected: str | None, mocker: MockerFixture) -> None:
+    mocker.patch("app.auth.deps.security.get_password_hash_async", return_value="hash")
+
+    assert await hash_new_password(user_in=Mock(new_password=new_password)) == expected
+
+
 def test_process_reset_password_request_token_should_not_be_created_if_no_user_with_given_email(
-    mock_db: Mock, mock_crud_user: Mock, mock_crud_password_reset: Mock, mock_background_tasks: Mock, mock_mailer: Mock
+    mock_db: Mock, mock_crud_user: Mock, mock_crud_password_reset: Mock, mock_outbox_email: Mock
 ) -> None:
     mock_crud_user.get_by_email.return_value = None
-    process_reset_password_request(
-        mock_db, password_reset_request=Mock(), background_tasks=mock_background_tasks, mailer=mock_mailer
-    )
+    process_reset_password_request(mock_db, password_reset_request=Mock())
 
     mock_crud_password_reset.create.assert_not_called()
+    mock_outbox_email.enqueue.assert_not_called()
 
 
 @pytest.mark.usefixtures("mock_send_password_reset_request_mail")
@@ -289,14 +360,11 @@ def test_process_reset_password_request_should_invalidate_all_other_reset_tokens
     mock_db: Mock,
     mock_crud_user: Mock,
     mock_crud_password_reset: Mock,
-    mock_background_tasks: Mock,
-    mock_mailer: Mock,
+    mock_outbox_email: Mock,
     mock_current_user: Mock,
 ) -> None:
     mock_crud_user.get_by_email.return_value = mock_current_user
-    process_reset_password_request(
-        mock_db, password_reset_request=Mock(), background_tasks=mock_background_tasks, mailer=mock_mailer
-    )
+    process_reset_password_request(mock_db, password_reset_request=Mock())
 
     mock_crud_password_reset.invalidate_all.assert_called_once()
 
@@ -306,14 +374,11 @@ def test_process_reset_password_request_should_create_password_reset_token(
     mock_db: Mock,
     mock_crud_user: Mock,
     mock_crud_password_reset: Mock,
-    mock_background_tasks: Mock,
-    mock_mailer: Mock,
+    mock_outbox_email: Mock,
     mock_current_user: Mock,
 ) -> None:
     mock_crud_user.get_by_email.return_value = mock_current_user
-    process_reset_password_request(
-        mock_db, password_reset_request=Mock(), background_tasks=mock_background_tasks, mailer=mock_mailer
-    )
+    process_reset_password_request(mock_db, password_reset_request=Mock())
 
     mock_crud_password_reset.create.assert_called_once()
 
@@ -322,18 +387,16 @@ def test_process_reset_password_request_should_create_password_reset_token(
 def test_process_reset_password_request_should_send_email(
     mock_db: Mock,
     mock_crud_user: Mock,
-    mock_background_tasks: Mock,
-    mock_mailer: Mock,
+    mock_outbox_email: Mock,
     mock_current_user: Mock,
     mocker: MockerFixture,
 ) -> None:
     mock_crud_user.get_by_email.return_value = mock_current_user
     mock_send_email = mocker.patch("app.auth.deps.send_password_reset_request_mail")
-    process_reset_password_request(
-        mock_db, password_reset_request=Mock(), background_tasks=mock_background_tasks, mailer=mock_mailer
-    )
+    process_reset_password_request(mock_db, password_reset_request=Mock())
 
-    mock_background_tasks.add_task.assert_called_once_with(mock_mailer.send, mock_send_email())
+    mock_outbox_email.enqueue.assert_called_once_with(mock_db, message=mock_send_email())
+    mock_db.commit.assert_called_once()
 
 
 @pytest.mark.parametrize(
@@ -366,7 +429,16 @@ def test_invalidate_password_reset_token(
 
 
 def test_reset_user_password(mock_db: Mock, mock_crud_user: Mock, mocker: MockerFixture) -> None:
-    reset_user_password(mock_db, password_reset_form=Mock(), token=Mock())
+    reset_user_password(mock_db, password_reset_form=Mock(), token=Mock(), hashed_password="hash")
     mocker.patch.object(user_exists, "by_id")
 
     mock_crud_user.change_password.assert_called_once()
+    assert mock_crud_user.change_password.call_args.kwargs["hashed_password"] == "hash"
+
+
+@pytest.mark.asyncio
+async def test_hash_reset_password_uses_password_executor(mocker: MockerFixture) -> None:
+    mock_hash = mocker.patch("app.auth.deps.security.get_password_hash_async", return_value="hash")
+
+    assert await hash_reset_password(password_reset_form=Mock(new_password="password")) == "hash"
+    mock_hash.assert_awaited_once_with("password")
@@ -1,11 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from threading import current_thread
 from typing import Generator
 from unittest.mock import Mock
 
 import pytest
 from pytest_mock import MockerFixture
 
-from app.auth.security import create_access_token, get_password_hash, pwd_context, verify_password
+from app.auth.security import (
+    create_access_token,
+    create_password_context,
+    get_password_hash,
+    get_password_hash_async,
+    pwd_context,
+    verify_and_update_password,
+    verify_password,
+    verify_password_async,
+)
 from app.core.config import settings
 
 
@@ -48,6 +59,68 @@ def test_verify_password(mock_verify_password: Mock, verified: bool) -> None:
     assert verify_password("pass", "pass") == verified
 
 
+@pytest.mark.parametrize("scheme,prefix", [("bcrypt", "$2b$04$"), ("argon2", "$argon2id$v=19$m=1024,t=1,p=1$")])
+def test_create_password_context_hashes_with_configured_scheme_and_cost(scheme: str, prefix: str) -> None:
+    context = create_password_context(
+        scheme, bcrypt_rounds=4, argon2_memory_cost=1024, argon2_time_cost=1, argon2_parallelism=1
+    )
+
+    assert context.hash("Test1234!").startswith(prefix)
+
+
+@pytest.mark.parametrize(
+    "old_options,new_options",
+    [
+        ({"scheme": "bcrypt", "bcrypt_rounds": 4}, {"scheme": "bcrypt", "bcrypt_rounds": 5}),
+        ({"scheme": "bcrypt", "bcrypt_rounds": 5}, {"scheme": "bcrypt", "bcrypt_rounds": 4}),
+        ({"scheme": "bcrypt", "bcrypt_rounds": 4}, {"scheme": "argon2", "argon2_memory_cost": 1024}),
+        ({"scheme": "argon2", "argon2_time_cost": 1}, {"scheme": "argon2", "argon2_time_cost": 2}),
+    ],
+)
+def test_verify_and_update_password_rehashes_outdated_hash(
+    old_options: dict, new_options: dict, mocker: MockerFixture
+) -> None:
+    password = "Test1234!"
+    old_hash = create_password_context(**old_options).hash(password)
+    new_context = create_password_context(**new_options)
+    mocker.patch("app.auth.security.pwd_context", new_context)
+
+    verified, new_hash = verify_and_update_password(password, old_hash)
+
+    assert verified
+    assert new_hash is not None and not new_context.needs_update(new_hash)
+
+
+def test_verify_and_update_password_keeps_current_hash(mocker: MockerFixture) -> None:
+    context = create_password_context("bcrypt", bcrypt_rounds=4)
+    mocker.patch("app.auth.security.pwd_context", context)
+
+    assert verify_and_update_password("Test1234!", context.hash("Test1234!")) == (True, None)
+    assert verify_and_update_password("wrong", context.hash("Test1234!")) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_get_password_hash_async_can_be_verified() -> None:
+    password = "Test1234!"
+    hashed = await get_password_hash_async(password)
+
+    assert await verify_password_async(password, hashed)
+    assert not await verify_password_async("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_verify_password_async_runs_in_password_executor(mocker: MockerFixture) -> None:
+    executor = ThreadPoolExecutor(max_workers=1)
+    mocker.patch("app.auth.security.password_executor", executor)
+    thread_names = []
+    mocker.patch.object(pwd_context, "verify", side_effect=lambda *_: thread_names.append(current_thread().name))
+
+    await verify_password_async("pass", "pass")
+
+    assert thread_names and thread_names[0] != current_thread().name
+    executor.shutdown()
+
+
 def test_create_access_token_returns_token(mock_jwt_encode: Mock) -> None:
     expected_token = "expected"
     mock_jwt_encode.return_value = expected_token
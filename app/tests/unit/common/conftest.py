@@ -1,8 +1,10 @@
+from typing import Type
+
 import pytest
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.common.crud import CRUDBase, SlugMixin
+from app.common.crud import AsyncCRUDBase, AsyncSlugMixin, CRUDBase, SlugMixin
 
 
 class Model:
@@ -22,10 +24,23 @@ class UpdateSchema(BaseModel):
 
 
 class SampleCRUD(CRUDBase[Model, CreateSchema, UpdateSchema], SlugMixin[Model]):  # type: ignore[type-var]
+    model: Type[Model]
+
     def get_by_token(self, db: Session, token: str) -> Model | None:
         pass
 
 
+class SampleAsyncCRUD(
+    AsyncCRUDBase[Model, CreateSchema, UpdateSchema], AsyncSlugMixin[Model]  # type: ignore[type-var]
+):
+    model: Type[Model]
+
+
 @pytest.fixture(name="mock_crud", scope="session")
 def get_mock_crud() -> SampleCRUD:
     return SampleCRUD(Model)
+
+
+@pytest.fixture(name="mock_async_crud", scope="session")
+def get_mock_async_crud() -> SampleAsyncCRUD:
+    return SampleAsyncCRUD(Model)
@@ -0,0 +1,122 @@
+from typing import Any, Iterator
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.common import cache
+from app.common.cache import MemoryCacheBackend, NullCacheBackend, RedisCacheBackend, ResponseCache
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    def get(self, name: str) -> bytes | None:
+        return self.data.get(name)
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> None:
+        self.data[name] = value
+
+    def scan_iter(self, match: str | None = None) -> Iterator:
+        prefix = (match or "*").rstrip("*")
+        return iter([key for key in self.data if key.startswith(prefix)])
+
+    def delete(self, *names: Any) -> None:
+        for name in names:
+            self.data.pop(name, None)
+
+
+@pytest.fixture(name="mock_request")
+def get_mock_request() -> Mock:
+    request = Mock()
+    request.url.path = "/api/v1/events/"
+    return request
+
+
+def test_memory_backend_evicts_least_recently_used_entry() -> None:
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    backend.get("a")
+    backend.set("c", b"3", ttl=60)
+
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+
+def test_memory_backend_entry_expires(mocker: MockerFixture) -> None:
+    mock_time = mocker.patch.object(cache.time, "monotonic", return_value=100.0)
+    backend = MemoryCacheBackend()
+    backend.set("key", b"value", ttl=10)
+    mock_time.return_value = 111.0
+
+    assert backend.get("key") is None
+
+
+@pytest.mark.parametrize("backend", [MemoryCacheBackend(), RedisCacheBackend(FakeRedis())])
+def test_backend_delete_prefix(backend: cache.CacheBackend) -> None:
+    backend.set("catalog:a", b"1", ttl=60)
+    backend.set("other:a", b"2", ttl=60)
+    backend.delete_prefix("catalog:")
+
+    assert backend.get("catalog:a") is None
+    assert backend.get("other:a") == b"2"
+
+
+def test_null_backend_stores_nothing() -> None:
+    backend = NullCacheBackend()
+    backend.set("key", b"value", ttl=60)
+
+    assert backend.get("key") is None
+
+
+def test_create_cache_backend_with_unknown_backend_should_raise_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(cache.settings, "CACHE_BACKEND", "unknown")
+
+    with pytest.raises(ValueError):
+        cache.create_cache_backend()
+
+
+def test_create_cache_backend_with_redis_backend(mocker: MockerFixture) -> None:
+    mocker.patch.object(cache.settings, "CACHE_BACKEND", "redis")
+    mocker.patch.object(cache.settings, "CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+    backend = cache.create_cache_backend()
+
+    assert isinstance(backend, RedisCacheBackend)
+
+
+def test_create_cache_backend_with_redis_backend_without_url_should_raise_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(cache.settings, "CACHE_BACKEND", "redis")
+    mocker.patch.object(cache.settings, "CACHE_REDIS_URL", None)
+
+    with pytest.raises(ValueError):
+        cache.create_cache_backend()
+
+
+def test_response_cache_key_ignores_query_params_order_and_empty_values(mock_request: Mock) -> None:
+    response_cache = ResponseCache(MemoryCacheBackend(), namespace="catalog", ttl=60)
+    mock_request.url.query = "sort_by=name&limit=10&name__icontains="
+    key = response_cache.make_key(mock_request)
+    mock_request.url.query = "limit=10&sort_by=name"
+
+    assert response_cache.make_key(mock_request) == key
+    assert key.startswith("catalog:/api/v1/events/")
+
+
+def test_response_cache_invalidate_removes_namespace_entries() -> None:
+    backend = MemoryCacheBackend()
+    response_cache = ResponseCache(backend, namespace="catalog", ttl=60)
+    response_cache.set("catalog:/events/", b"[]")
+    response_cache.invalidate()
+
+    assert response_cache.get("catalog:/events/") is None
+
+
+def test_response_cache_stores_headers_with_body() -> None:
+    response_cache = ResponseCache(MemoryCacheBackend(), namespace="catalog", ttl=60)
+    response_cache.set("catalog:/events/", b'{"items":\n[]}', headers={"etag": 'W/"abc"'})
+
+    assert response_cache.get("catalog:/events/") == (b'{"items":\n[]}', {"etag": 'W/"abc"'})
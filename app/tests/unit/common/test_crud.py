@@ -1,11 +1,12 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy.exc import IntegrityError
 
-from app.common.crud import generate_unique_token
-from app.tests.unit.common.conftest import CreateSchema, Model, SampleCRUD, UpdateSchema
+from app.common.crud import count_rows, generate_unique_token
+from app.common.schemas import CountMode
+from app.tests.unit.common.conftest import CreateSchema, Model, SampleAsyncCRUD, SampleCRUD, UpdateSchema
 
 
 @pytest.fixture(name="mock_select")
@@ -95,7 +96,104 @@ def test_get_by_slug(mock_db: Mock, mock_crud: SampleCRUD, mock_select: Mock) ->
 
 
 def test_generate_unique_token_should_rollback_on_integrity_error(mock_db: Mock) -> None:
-    mock_db.commit.side_effect = [IntegrityError("IntegrityError raised", orig=BaseException(), params=None), None]
+    mock_db.begin_nested.return_value.commit.side_effect = [
+        IntegrityError("IntegrityError raised", orig=BaseException(), params=None),
+        None,
+    ]
     generate_unique_token(mock_db, token_model=Mock, payload={})
 
-    mock_db.rollback.assert_called_once()
+    mock_db.begin_nested.return_value.rollback.assert_called_once()
+    mock_db.commit.assert_not_called()
+
+
+def test_count_rows_with_none_mode_should_not_query_db(mock_db: Mock) -> None:
+    result = count_rows(mock_db, Mock(), mode=CountMode.NONE)
+
+    assert result.value is None
+    assert not result.is_exact
+    mock_db.execute.assert_not_called()
+
+
+@pytest.mark.parametrize("rows, expected_value, expected_exact", [(5, 5, True), (11, 10, False)])
+def test_count_rows_capped(
+    mock_db: Mock, mock_select: Mock, rows: int, expected_value: int, expected_exact: bool
+) -> None:
+    query = Mock()
+    mock_db.execute.return_value.scalar_one.return_value = rows
+
+    result = count_rows(mock_db, query, mode=CountMode.CAPPED, cap=10)
+
+    query.limit.assert_called_once_with(11)
+    assert result.value == expected_value
+    assert result.is_exact == expected_exact
+
+
+def test_count_rows_estimated_falls_back_to_exact_count_outside_postgres(mock_db: Mock, mock_select: Mock) -> None:
+    mock_db.get_bind.return_value.dialect.name = "sqlite"
+    mock_db.execute.return_value.scalar_one.return_value = 3
+
+    result = count_rows(mock_db, Mock(), mode=CountMode.ESTIMATED)
+
+    assert result.value == 3
+    assert result.is_exact
+
+
+@pytest.mark.asyncio
+async def test_async_get(mock_async_db: AsyncMock, mock_async_crud: SampleAsyncCRUD, mock_select: Mock) -> None:
+    await mock_async_crud.get(mock_async_db, id_=1)
+
+    mock_select.assert_called_with(mock_async_crud.model)
+    mock_async_db.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_get_all_with_skip_and_limit(
+    mock_async_db: AsyncMock, mock_async_crud: SampleAsyncCRUD, mock_select: Mock
+) -> None:
+    await mock_async_crud.get_all(mock_async_db, skip=1, limit=2)
+
+    mock_select.return_value.offset.assert_called_once_with(1)
+    mock_select.return_value.offset.return_value.limit.assert_called_once_with(2)
+
+
+@pytest.mark.asyncio
+async def test_async_create(mock_async_db: AsyncMock, mock_async_crud: SampleAsyncCRUD) -> None:
+    result = await mock_async_crud.create(mock_async_db, obj_in=CreateSchema())
+
+    assert isinstance(result, Model)
+    mock_async_db.add.assert_called_once_with(result)
+    mock_async_db.commit.assert_awaited_once()
+    mock_async_db.refresh.assert_awaited_once_with(result)
+
+
+@pytest.mark.asyncio
+async def test_async_update(mock_async_db: AsyncMock, mock_async_crud: SampleAsyncCRUD) -> None:
+    db_obj = Model()
+
+    result = await mock_async_crud.update(mock_async_db, db_obj=db_obj, obj_in={"key": "value"})
+
+    assert result == db_obj
+    assert db_obj.key == "value"  # type: ignore[attr-defined]
+    mock_async_db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_remove(mock_async_db: AsyncMock, mock_async_crud: SampleAsyncCRUD, mocker: MockerFixture) -> None:
+    instance = Model()
+    mock_get = mocker.patch.object(mock_async_crud, attribute="get", return_value=instance)
+
+    result = await mock_async_crud.remove(mock_async_db, id_=1)
+
+    assert result == instance
+    mock_get.assert_awaited_once_with(mock_async_db, id_=1)
+    mock_async_db.delete.assert_awaited_once_with(instance)
+
+
+@pytest.mark.asyncio
+async def test_async_get_by_slug(mock_async_db: AsyncMock, mock_async_crud: SampleAsyncCRUD, mock_select: Mock) -> None:
+    options = (Mock(),)
+
+    await mock_async_crud.get_by_slug(mock_async_db, slug="slug", options=options)
+
+    mock_select.assert_called_once_with(mock_async_crud.model)
+    mock_select.return_value.where.return_value.options.assert_called_once_with(*options)
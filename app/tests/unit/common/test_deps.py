@@ -1,3 +1,5 @@
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -6,6 +8,9 @@ from jose import jwt
 from pytest_mock import MockerFixture
 from sqlalchemy.orm import Session
 
+from app.auth.cache import PrincipalCache
+from app.auth.schemas import Principal
+from app.common.cache import MemoryCacheBackend
 from app.common.deps import (
     DEFAULT_PAGE_OFFSET,
     DEFAULT_PAGE_SIZE,
@@ -31,6 +36,25 @@ def get_mock_crud_user(mocker: MockerFixture) -> MockCrudUser:
     return mocks
 
 
+@pytest.fixture(name="principal_cache", autouse=True)
+def get_principal_cache(mocker: MockerFixture) -> PrincipalCache:
+    cache = PrincipalCache(MemoryCacheBackend(), ttl=60)
+    mocker.patch("app.common.deps.principal_cache", cache)
+    return cache
+
+
+@pytest.fixture(name="db_user")
+def get_db_user() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1,
+        email="user@example.com",
+        is_activated=True,
+        is_disabled=False,
+        is_superuser=False,
+        joined_at=datetime(2023, 1, 1),
+    )
+
+
 @pytest.fixture(name="mock_current_user")
 def get_mock_current_user() -> Mock:
     return Mock()
@@ -68,16 +92,44 @@ def test_pagination_params_default_values() -> None:
     assert pagination.limit == DEFAULT_PAGE_SIZE
 
 
-def test_get_current_user_valid_token(mock_db: Mock, mock_crud_user: MockCrudUser) -> None:
+def test_get_current_user_valid_token(mock_db: Mock, mock_crud_user: MockCrudUser, db_user: SimpleNamespace) -> None:
     token = "valid-token"
-    token_payload = {"sub": "user_id"}
+    token_payload = {"sub": "1"}
+    mock_crud_user["get"].return_value = db_user
 
     with patch("app.common.deps.jwt.decode", return_value=token_payload) as mock_decode:
         user = get_current_user(mock_db, token)
 
         mock_decode.assert_called_once_with(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         mock_crud_user["get"].assert_called_once_with(mock_db, id_=token_payload["sub"])
-        assert user == mock_crud_user["get"].return_value
+        assert user == Principal.model_validate(db_user)
+
+
+def test_get_current_user_should_use_cached_principal(
+    mock_db: Mock, mock_crud_user: MockCrudUser, db_user: SimpleNamespace, principal_cache: PrincipalCache
+) -> None:
+    mock_crud_user["get"].return_value = db_user
+
+    with patch("app.common.deps.jwt.decode", return_value={"sub": "1"}):
+        first = get_current_user(mock_db, "token")
+        second = get_current_user(mock_db, "token")
+        principal_cache.invalidate(db_user.id)
+        third = get_current_user(mock_db, "token")
+
+    assert first == second == third
+    assert mock_crud_user["get"].call_count == 2
+
+
+def test_get_current_user_should_not_share_cached_principal_between_tokens(
+    mock_db: Mock, mock_crud_user: MockCrudUser, db_user: SimpleNamespace
+) -> None:
+    mock_crud_user["get"].return_value = db_user
+
+    with patch("app.common.deps.jwt.decode", return_value={"sub": "1"}):
+        get_current_user(mock_db, "token")
+        get_current_user(mock_db, "other-token")
+
+    assert mock_crud_user["get"].call_count == 2
 
 
 def test_get_current_user_invalid_token_should_fail(mock_db: Mock) -> None:
@@ -1,9 +1,27 @@
+import asyncio
+import os
+import time
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
+import aiosmtplib
 import pytest
+from fastapi_mail import FastMail
+from jinja2 import Template, TemplateNotFound
 from pytest_mock import MockerFixture
 
-from app.common.emails import MailSender, get_mailer_config, mailer, prepare_email, read_template
+from app.common.emails import (
+    MailSender,
+    RateLimiter,
+    Recipient,
+    SMTPConnection,
+    TemplateRegistry,
+    create_mailer,
+    email_templates,
+    get_mailer_config,
+    mailer,
+    prepare_email,
+)
 
 EMAIL_TEMPLATE_NAME = "base.html"
 
@@ -13,10 +31,14 @@ def get_mock_mail_engine() -> Mock:
     return Mock()
 
 
-def test_mailer() -> None:
-    mail_sender = mailer()
-    assert mail_sender is not None
-    assert hasattr(mail_sender, "engine")
+def test_create_mailer() -> None:
+    mail_sender = create_mailer()
+    assert isinstance(mail_sender.engine, FastMail)
+
+
+def test_mailer_returns_application_mailer() -> None:
+    request = Mock()
+    assert mailer(request) is request.app.state.mailer
 
 
 @pytest.mark.asyncio
@@ -39,16 +61,58 @@ def test_mail_sender_record_messages(mock_mail_engine: Mock, mocker: MockerFixtu
         assert result == outbox
 
 
-def test_read_template() -> None:
-    template_name = EMAIL_TEMPLATE_NAME
-    template = read_template(template_name)
-    assert isinstance(template, str)
+def test_template_registry_get() -> None:
+    template = email_templates.get(EMAIL_TEMPLATE_NAME)
+    assert isinstance(template, Template)
 
 
-def test_read_template_with_incorrect_template_name_should_raise_error() -> None:
+def test_template_registry_get_with_incorrect_template_name_should_raise_error() -> None:
     template_name = "non-existing-template"
-    with pytest.raises(FileNotFoundError):
-        read_template(template_name)
+    with pytest.raises(TemplateNotFound):
+        email_templates.get(template_name)
+
+
+def test_template_registry_compiles_template_once(tmp_path: Path, mocker: MockerFixture) -> None:
+    (tmp_path / "mail.html").write_text("Hello {{ name }}")
+    registry = TemplateRegistry(str(tmp_path))
+    spy_compile = mocker.spy(registry.environment, "compile")
+
+    rendered = [registry.render("mail.html", {"name": name}) for name in ("Ann", "Bob")]
+
+    assert rendered == ["Hello Ann", "Hello Bob"]
+    assert spy_compile.call_count == 1
+
+
+def test_template_registry_resolves_inheritance(tmp_path: Path) -> None:
+    (tmp_path / "base.html").write_text("<p>{% block content %}{% endblock %}</p>")
+    (tmp_path / "child.html").write_text('{% extends "base.html" %}{% block content %}{{ name }}{% endblock %}')
+    registry = TemplateRegistry(str(tmp_path))
+
+    assert registry.render("child.html", {"name": "Ann"}) == "<p>Ann</p>"
+
+
+@pytest.mark.parametrize("auto_reload,expected", [(True, "New"), (False, "Old")])
+def test_template_registry_auto_reload(tmp_path: Path, auto_reload: bool, expected: str) -> None:
+    template_path = tmp_path / "mail.html"
+    template_path.write_text("Old")
+    registry = TemplateRegistry(str(tmp_path), auto_reload=auto_reload)
+    registry.render("mail.html", {})
+
+    template_path.write_text("New")
+    os.utime(template_path, (time.time() + 10, time.time() + 10))
+
+    assert registry.render("mail.html", {}) == expected
+
+
+def test_template_registry_render_string_compiles_source_once(mocker: MockerFixture) -> None:
+    registry = TemplateRegistry("")
+    spy_compile = mocker.spy(registry.environment, "compile")
+
+    registry.render_string("Hello {{ name }}", {"name": "Ann"})
+    result = registry.render_string("Hello {{ name }}", {"name": "Bob"})
+
+    assert result == "Hello Bob"
+    assert spy_compile.call_count == 1
 
 
 def test_prepare_email_mail_should_have_correct_attributes() -> None:
@@ -63,3 +127,87 @@ def test_prepare_email_mail_should_have_correct_attributes() -> None:
 def test_get_mailer_config_should_return_prefixed_keys() -> None:
     config = get_mailer_config()
     assert all(key.startswith("MAIL") for key in config)
+
+
+@pytest.mark.asyncio
+async def test_smtp_connection_send_builds_message() -> None:
+    connection = SMTPConnection("localhost", 25)
+    connection.client = AsyncMock()
+
+    await connection.send(["random@example.com"], "subject", "<p>body</p>")
+
+    message = connection.client.send_message.await_args.args[0]
+    assert message["To"] == "random@example.com"
+    assert message["Subject"] == "subject"
+    assert message.get_content_type() == "text/html"
+
+
+@pytest.mark.asyncio
+async def test_smtp_connection_is_reused_within_context() -> None:
+    connection = SMTPConnection("localhost", 25)
+    connection.client = AsyncMock(is_connected=True)
+
+    async with connection:
+        await connection.send(["first@example.com"], "subject", "body")
+        await connection.send(["second@example.com"], "subject", "body")
+
+    connection.client.connect.assert_awaited_once()
+    connection.client.quit.assert_awaited_once()
+    assert connection.client.send_message.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_out_calls() -> None:
+    limiter = RateLimiter(rate=100)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    for _ in range(5):
+        await limiter.wait()
+
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_without_rate_does_not_wait(mocker: MockerFixture) -> None:
+    mock_sleep = mocker.patch("app.common.emails.asyncio.sleep")
+    limiter = RateLimiter(rate=None)
+
+    for _ in range(5):
+        await limiter.wait()
+
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_many_sends_through_engine_in_batches(mocker: MockerFixture) -> None:
+    mock_prepare_email = mocker.patch("app.common.emails.prepare_email")
+    mock_prepare_email.side_effect = lambda email_to, *_: Mock(recipients=email_to)
+    engine = Mock(send_message=AsyncMock())
+    mail_sender = MailSender(engine)
+    recipients = (Recipient(f"{i}@example.com") for i in range(5))
+
+    report = await mail_sender.send_many(
+        recipients, subject="subject", template_name=EMAIL_TEMPLATE_NAME, batch_size=2, rate_limit=0
+    )
+
+    assert report.sent == 5
+    assert [call.args[0].recipients for call in engine.send_message.await_args_list] == [
+        [f"{i}@example.com"] for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_many_reports_failed_recipients(mocker: MockerFixture) -> None:
+    mocker.patch("app.common.emails.prepare_email")
+    engine = Mock(send_message=AsyncMock())
+    engine.send_message.side_effect = [None, aiosmtplib.SMTPServerDisconnected("disconnected"), None]
+    mail_sender = MailSender(engine)
+    recipients = [Recipient(f"{i}@example.com") for i in range(3)]
+
+    report = await mail_sender.send_many(
+        recipients, subject="subject", template_name=EMAIL_TEMPLATE_NAME, batch_size=3, rate_limit=0
+    )
+
+    assert report.sent == 2
+    assert list(report.failures) == ["1@example.com"]
@@ -0,0 +1,56 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Response, status
+
+from app.common.etag import conditional_response, etag_matches, make_etag
+
+
+@pytest.fixture(name="mock_request")
+def get_mock_request() -> Mock:
+    request = Mock()
+    request.headers = {}
+    return request
+
+
+def test_make_etag_depends_on_parts() -> None:
+    assert make_etag(1, "a") == make_etag(1, "a")
+    assert make_etag(1, "a") != make_etag(1, "b")
+    assert make_etag(1).startswith('W/"')
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('W/"other"', False),
+        ('W/"tag"', True),
+        ('"tag"', True),
+        ('W/"other", W/"tag"', True),
+        ("*", True),
+    ],
+)
+def test_etag_matches(mock_request: Mock, header: str | None, expected: bool) -> None:
+    if header is not None:
+        mock_request.headers = {"if-none-match": header}
+
+    assert etag_matches(mock_request, 'W/"tag"') == expected
+
+
+def test_conditional_response_sets_validation_headers(mock_request: Mock) -> None:
+    response = Response()
+
+    result = conditional_response(mock_request, response, 'W/"tag"')
+
+    assert result is None
+    assert response.headers["etag"] == 'W/"tag"'
+    assert "cache-control" in response.headers
+
+
+def test_conditional_response_returns_not_modified_if_etag_matches(mock_request: Mock) -> None:
+    mock_request.headers = {"if-none-match": 'W/"tag"'}
+
+    result = conditional_response(mock_request, Response(), 'W/"tag"')
+
+    assert result is not None
+    assert result.status_code == status.HTTP_304_NOT_MODIFIED
@@ -1,11 +1,11 @@
 # mypy: disable-error-code="attr-defined, misc, assignment, method-assign"
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
-from pytest_mock import MockerFixture
 
-from app.common.exceptions import InvalidFilterField, InvalidFilterType, InvalidSortField
-from app.common.filters import BaseFilter, BaseSorter
+from app.common.exceptions import InvalidCursor, InvalidFilterField, InvalidFilterType, InvalidSortField
+from app.common.filters import BaseFilter, BaseSorter, _get_type_adapter
 
 
 @pytest.fixture(name="mock_model")
@@ -33,10 +33,7 @@ def get_sorter_instance(mock_model: Mock) -> BaseSorter:
     return BaseSorter()
 
 
-def test_filters(filter_instance: BaseFilter, mocker: MockerFixture) -> None:
-    mock_class_mapper = Mock()
-    mock_class_mapper.get_property.secondary.return_value = None
-    mocker.patch("app.common.filters.class_mapper", return_value=mock_class_mapper)
+def test_filters(filter_instance: BaseFilter) -> None:
     filter_instance.model_dump.return_value = {"field__icontains": "", "other__exact": ""}
 
     result = filter_instance.filters
@@ -44,6 +41,28 @@ def test_filters(filter_instance: BaseFilter, mocker: MockerFixture) -> None:
     assert len(result.statements) == 2
 
 
+def test_many_to_one_relationship_filters_join_the_relationship(filter_instance: BaseFilter, mock_model: Mock) -> None:
+    filter_instance.model_dump.return_value = {"relation__field__exact": "value"}
+    mock_model.relation.property.uselist = False
+
+    result = filter_instance.filters
+
+    assert len(result.statements) == 1
+    assert result.related == [mock_model.relation]
+    mock_model.relation.has.assert_not_called()
+
+
+def test_one_to_many_relationship_filters_use_exists(filter_instance: BaseFilter, mock_model: Mock) -> None:
+    filter_instance.model_dump.return_value = {"relation__field__exact": "value"}
+    mock_model.relation.property.uselist = True
+    mock_model.relation.property.secondary = None
+
+    result = filter_instance.filters
+
+    assert result.statements == [mock_model.relation.any.return_value]
+    assert not result.related
+
+
 def test_filters_with_invalid_filter_type_should_raise_error(filter_instance: BaseFilter) -> None:
     filter_instance.model_dump.return_value = {"field__incorrect": ""}
 
@@ -83,3 +102,63 @@ def test_order_by_with_no_ordering_specified(sorter_instance: BaseSorter) -> Non
     result = sorter_instance.order_by
 
     assert len(result) == 0
+
+
+@pytest.mark.parametrize(
+    "sort_by, expected",
+    [
+        (None, [("id", False)]),
+        ("-name", [("name", True), ("id", False)]),
+        ("name,-id", [("name", False), ("id", True)]),
+    ],
+)
+def test_keyset_fields_have_id_tiebreaker(
+    sorter_instance: BaseSorter, sort_by: str | None, expected: list[tuple[str, bool]]
+) -> None:
+    sorter_instance.Constants.order_by_fields = ["name", "id"]
+    sorter_instance.sort_by = sort_by
+
+    assert sorter_instance.keyset_fields == expected
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm90LWpzb24=", "WzEsIDJd"])
+def test_get_cursor_filter_with_malformed_cursor_should_raise_error(sorter_instance: BaseSorter, cursor: str) -> None:
+    sorter_instance.sort_by = None
+
+    with pytest.raises(InvalidCursor):
+        sorter_instance.get_cursor_filter(cursor)
+
+
+def test_get_cursor_filter_with_cursor_from_different_ordering_should_raise_error(sorter_instance: BaseSorter) -> None:
+    sorter_instance.Constants.order_by_fields = ["name", "id"]
+    sorter_instance.sort_by = "name"
+    cursor = sorter_instance.get_cursor(SimpleNamespace(id=1, name="name"))
+    sorter_instance.sort_by = "-name"
+
+    with pytest.raises(InvalidCursor):
+        sorter_instance.get_cursor_filter(cursor)
+
+
+def test_cursor_value_type_adapter_is_built_once_per_type() -> None:
+    assert _get_type_adapter(int) is _get_type_adapter(int)
+    assert _get_type_adapter(int) is not _get_type_adapter(str)
+
+
+def test_order_by_annotated_field(sorter_instance: BaseSorter) -> None:
+    sorter_instance.Constants.order_by_fields = ["relevance"]
+    sorter_instance.Constants.annotated_fields = ["relevance"]
+    sorter_instance.sort_by = "-relevance"
+    expression = Mock()
+
+    sorter_instance.annotate("relevance", expression)
+
+    assert sorter_instance.order_by == [expression.desc.return_value]
+
+
+def test_order_by_annotated_field_without_expression_should_raise_error(sorter_instance: BaseSorter) -> None:
+    sorter_instance.Constants.order_by_fields = ["relevance"]
+    sorter_instance.Constants.annotated_fields = ["relevance"]
+    sorter_instance.sort_by = "relevance"
+
+    with pytest.raises(InvalidSortField):
+        _ = sorter_instance.order_by
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+from app.common.geo import BoundingBox
+
+
+def test_bounding_box_around_point() -> None:
+    box = BoundingBox.around(54.35, 18.65, 111.19)
+
+    assert box.min_latitude == pytest.approx(53.35, abs=0.01)
+    assert box.max_latitude == pytest.approx(55.35, abs=0.01)
+    assert box.min_longitude == pytest.approx(16.93, abs=0.01)
+    assert box.max_longitude == pytest.approx(20.37, abs=0.01)
+
+
+def test_bounding_box_covering_pole_has_no_longitude_range() -> None:
+    box = BoundingBox.around(89.5, 18.65, 100)
+
+    assert (box.max_latitude, box.min_longitude, box.max_longitude) == (90.0, None, None)
+
+
+@pytest.mark.parametrize(
+    "longitude, expected",
+    [
+        (179.9, "latitude BETWEEN %(latitude_1)s AND %(latitude_2)s AND (longitude >= %(longitude_1)s OR "),
+        (-179.9, "latitude BETWEEN %(latitude_1)s AND %(latitude_2)s AND (longitude >= %(longitude_1)s OR "),
+        (0.0, "latitude BETWEEN %(latitude_1)s AND %(latitude_2)s AND longitude BETWEEN "),
+    ],
+)
+def test_bounding_box_condition_wraps_around_antimeridian(longitude: float, expected: str) -> None:
+    condition = BoundingBox.around(0.0, longitude, 50).contains(column("latitude"), column("longitude"))
+
+    assert str(condition.compile(dialect=postgresql.dialect())).startswith(expected)
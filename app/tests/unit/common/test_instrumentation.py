@@ -0,0 +1,49 @@
+from typing import Generator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text  # type: ignore[attr-defined]
+
+from app.common.instrumentation import QueryStats, format_server_timing, instrument_engine, track_queries
+
+
+@pytest.fixture(name="engine")
+def get_engine() -> Generator[Engine, None, None]:
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_query_stats_should_track_slowest_statement() -> None:
+    stats = QueryStats()
+    stats.record("SELECT 1", 0.002)
+    stats.record("SELECT 2", 0.005)
+    stats.record("SELECT 3", 0.001)
+    assert stats.count == 3
+    assert stats.total_time == pytest.approx(0.008)
+    assert stats.slowest_time == 0.005
+    assert stats.slowest_statement == "SELECT 2"
+
+
+def test_format_server_timing() -> None:
+    stats = QueryStats()
+    stats.record("SELECT 1", 0.0125)
+    assert format_server_timing(stats) == 'db;dur=12.50;desc="1 queries", db-slowest;dur=12.50'
+
+
+def test_track_queries_should_record_statements_executed_within_block(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            connection.execute(text("SELECT 2"))
+            connection.execute(text("SELECT 3"))
+        connection.execute(text("SELECT 4"))
+    assert stats.statements == ["SELECT 2", "SELECT 3"]
+    assert stats.total_time > 0
+
+
+def test_instrument_engine_should_be_idempotent(engine: Engine) -> None:
+    instrument_engine(engine)
+    with engine.connect() as connection, track_queries() as stats:
+        connection.execute(text("SELECT 1"))
+    assert stats.count == 1
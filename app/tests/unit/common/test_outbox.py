@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.common.models import OutboxEmail
+from app.common.outbox import DeliveryReport, outbox_email, run_outbox_worker
+from app.core.config import settings
+
+
+@pytest.mark.parametrize("attempts,backoff", [(0, 1), (1, 2), (3, 8)])
+def test_mark_failed_backs_off_exponentially(attempts: int, backoff: int, mocker: MockerFixture) -> None:
+    mocker.patch.object(settings, "EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS", 60)
+    email = OutboxEmail(attempts=attempts)
+
+    outbox_email.mark_failed(email, ValueError("error"))
+
+    assert email.attempts == attempts + 1
+    assert email.last_error == "ValueError('error')"
+    expected = datetime.utcnow() + timedelta(minutes=backoff)
+    assert abs(email.next_attempt_at - expected) < timedelta(seconds=5)
+
+
+def test_postpone_keeps_attempts(mocker: MockerFixture) -> None:
+    mocker.patch.object(settings, "EMAIL_OUTBOX_RETRY_BACKOFF_SECONDS", 60)
+    email = OutboxEmail(attempts=1)
+
+    outbox_email.postpone(email, OSError("error"))
+
+    assert email.attempts == 1
+    assert email.last_error == "OSError('error')"
+    expected = datetime.utcnow() + timedelta(minutes=1)
+    assert abs(email.next_attempt_at - expected) < timedelta(seconds=5)
+
+
+def test_mark_sent_clears_last_error() -> None:
+    email = OutboxEmail(attempts=1, last_error="error")
+
+    outbox_email.mark_sent(email)
+
+    assert email.attempts == 2
+    assert email.sent_at is not None
+    assert email.last_error is None
+
+
+@pytest.mark.asyncio
+async def test_run_outbox_worker_once_stops_when_outbox_is_drained(mocker: MockerFixture) -> None:
+    mock_deliver = mocker.patch(
+        "app.common.outbox.deliver_pending_emails",
+        side_effect=[DeliveryReport(sent=2), DeliveryReport(sent=1)],
+    )
+    mock_sleep = mocker.patch("app.common.outbox.asyncio.sleep")
+
+    await run_outbox_worker(MagicMock(), batch_size=2, poll_interval=1, once=True)
+
+    assert mock_deliver.await_count == 2
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_outbox_worker_waits_for_new_emails(mocker: MockerFixture) -> None:
+    mocker.patch("app.common.outbox.deliver_pending_emails", return_value=DeliveryReport())
+    mock_sleep = mocker.patch("app.common.outbox.asyncio.sleep", side_effect=[None, StopAsyncIteration])
+
+    with pytest.raises(StopAsyncIteration):
+        await run_outbox_worker(Mock(return_value=MagicMock()), batch_size=2, poll_interval=5)
+
+    mock_sleep.assert_awaited_with(5)
@@ -0,0 +1,37 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.dialects import postgresql
+
+from app.common.search import search_match, search_rank, to_prefix_query
+
+metadata = MetaData()
+document = Table("document", metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+
+@pytest.mark.parametrize(
+    "term, expected",
+    [("Python", "Python:*"), ("konf, pyth!", "konf:* & pyth:*"), ("Zażółć", "Zażółć:*"), ("'&|", "")],
+)
+def test_to_prefix_query(term: str, expected: str) -> None:
+    assert to_prefix_query(term) == expected
+
+
+def test_search_compiles_to_full_text_search_on_postgresql() -> None:
+    query = select(search_rank(document.c.name, "pyth")).where(search_match(document.c.name, "pyth"))
+
+    compiled = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "ts_rank(to_tsvector('simple', document.name), to_tsquery('simple', %(param_1)s))" in compiled
+    assert "to_tsvector('simple', document.name) @@ to_tsquery('simple', %(param_2)s)" in compiled
+
+
+def test_search_falls_back_to_substring_match_on_other_databases() -> None:
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.execute(insert(document), [{"id": 1, "name": "Konferencja Python"}, {"id": 2, "name": "Jazz"}])
+        query = select(document.c.id, search_rank(document.c.name, "PYTHON")).where(
+            search_match(document.c.name, "PYTHON")
+        )
+
+        assert connection.execute(query).all() == [(1, 1.0)]
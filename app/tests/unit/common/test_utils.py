@@ -1,10 +1,10 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pytest_mock import MockerFixture
 
-from app.common.utils import InstanceInDBValidator
-from app.tests.unit.common.conftest import Model, SampleCRUD
+from app.common.utils import AsyncInstanceInDBValidator, InstanceInDBValidator
+from app.tests.unit.common.conftest import Model, SampleAsyncCRUD, SampleCRUD
 
 
 class CustomException(Exception):
@@ -70,7 +70,7 @@ def test_by_slug_should_call_crud_method(
 
     mock_instance_validator.by_slug(mock_db, slug=instance_slug)
 
-    mock_get.assert_called_once_with(mock_db, slug=instance_slug)
+    mock_get.assert_called_once_with(mock_db, slug=instance_slug, options=())
 
 
 def test_by_slug_should_fail_if_crud_service_does_not_have_get_by_slug_method(
@@ -140,3 +140,55 @@ def test_by_token_without_instance_should_raise_exception(
 
     with pytest.raises(CustomException):
         mock_instance_validator.by_token(mock_db, token="token")
+
+
+@pytest.fixture(name="mock_async_instance_validator", scope="session")
+def get_mock_async_instance_validator(mock_async_crud: SampleAsyncCRUD) -> AsyncInstanceInDBValidator:
+    return AsyncInstanceInDBValidator[Model, SampleAsyncCRUD](  # type: ignore[type-var]
+        mock_async_crud, CustomException  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_by_id_with_instance(
+    mock_async_instance_validator: AsyncInstanceInDBValidator,
+    mock_async_db: AsyncMock,
+    mock_async_crud: SampleAsyncCRUD,
+    mocker: MockerFixture,
+) -> None:
+    instance = Model()
+    mock_get = mocker.patch.object(mock_async_crud, attribute="get", return_value=instance)
+
+    result = await mock_async_instance_validator.by_id(mock_async_db, id_=1)
+
+    assert result == instance
+    mock_get.assert_awaited_once_with(mock_async_db, id_=1)
+
+
+@pytest.mark.asyncio
+async def test_async_by_slug_with_instance(
+    mock_async_instance_validator: AsyncInstanceInDBValidator,
+    mock_async_db: AsyncMock,
+    mock_async_crud: SampleAsyncCRUD,
+    mocker: MockerFixture,
+) -> None:
+    instance = Model()
+    mock_get = mocker.patch.object(mock_async_crud, attribute="get_by_slug", return_value=instance)
+
+    result = await mock_async_instance_validator.by_slug(mock_async_db, slug="slug")
+
+    assert result == instance
+    mock_get.assert_awaited_once_with(mock_async_db, slug="slug", options=())
+
+
+@pytest.mark.asyncio
+async def test_async_by_slug_without_instance_should_raise_exception(
+    mock_async_instance_validator: AsyncInstanceInDBValidator,
+    mock_async_db: AsyncMock,
+    mock_async_crud: SampleAsyncCRUD,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch.object(mock_async_crud, attribute="get_by_slug", return_value=None)
+
+    with pytest.raises(CustomException):
+        await mock_async_instance_validator.by_slug(mock_async_db, slug="slug")
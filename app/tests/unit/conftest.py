@@ -1,6 +1,7 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.auth.models import User
@@ -12,6 +13,14 @@ def mock_db() -> Mock:
     return Mock(spec=Session)
 
 
+@pytest.fixture()
+def mock_async_db() -> AsyncMock:
+    db = AsyncMock(spec=AsyncSession)
+    db.execute.return_value = Mock()
+    db.add = Mock()
+    return db
+
+
 @pytest.fixture(name="user_instance")
 def get_user_instance() -> User:
     user = create_user_instance()
@@ -2,10 +2,16 @@ from unittest.mock import Mock
 
 import pytest
 from pytest_mock import MockerFixture
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Mapped, mapped_column  # type: ignore[attr-defined]
+from sqlalchemy.pool import NullPool
 
+from app.core.config import settings
 from app.db.base_class import Base
 from app.db.init_db import init_db
+from app.db.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, get_pool_metrics
+from app.db.session import get_engine_options
 
 
 @pytest.fixture(name="mock_create")
@@ -34,3 +40,68 @@ def test_base_class_creates_table_name_automatically() -> None:
         id: Mapped[int] = mapped_column(primary_key=True)
 
     assert Model.__tablename__ == "model"
+
+
+def test_get_engine_options_should_configure_pool(mocker: MockerFixture) -> None:
+    mocker.patch.multiple(settings, SQLALCHEMY_POOL_SIZE=3, SQLALCHEMY_MAX_OVERFLOW=1, SQLALCHEMY_PGBOUNCER_MODE=False)
+
+    options = get_engine_options()
+
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 1
+    assert get_engine_options(is_async=True)["poolclass"] is TimedAsyncAdaptedQueuePool
+
+
+@pytest.mark.parametrize(
+    "is_async, expected_connect_args",
+    [
+        (False, {"options": "-c statement_timeout=500"}),
+        (True, {"server_settings": {"statement_timeout": "500"}}),
+    ],
+)
+def test_get_engine_options_should_set_statement_timeout(
+    mocker: MockerFixture, is_async: bool, expected_connect_args: dict
+) -> None:
+    mocker.patch.multiple(settings, SQLALCHEMY_STATEMENT_TIMEOUT_MS=500, SQLALCHEMY_PGBOUNCER_MODE=False)
+
+    assert get_engine_options(is_async=is_async)["connect_args"] == expected_connect_args
+
+
+@pytest.mark.parametrize(
+    "is_async, expected_connect_args",
+    [(False, {}), (True, {"statement_cache_size": 0, "prepared_statement_cache_size": 0})],
+)
+def test_get_engine_options_in_pgbouncer_mode_should_not_pool_connections(
+    mocker: MockerFixture, is_async: bool, expected_connect_args: dict
+) -> None:
+    mocker.patch.multiple(settings, SQLALCHEMY_STATEMENT_TIMEOUT_MS=500, SQLALCHEMY_PGBOUNCER_MODE=True)
+
+    options = get_engine_options(is_async=is_async)
+
+    assert options == {"poolclass": NullPool, "connect_args": expected_connect_args}
+
+
+def test_timed_queue_pool_should_record_checkouts_and_timeouts() -> None:
+    engine = create_engine("sqlite://", poolclass=TimedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.01)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        metrics = get_pool_metrics(engine)
+
+    assert metrics["pool_class"] == "TimedQueuePool"
+    assert metrics["size"] == 1
+    assert metrics["in_use"] == 1
+    assert metrics["overflow"] == 0
+    assert metrics["checkouts"] == 2
+    assert metrics["checkout_timeouts"] == 1
+    assert metrics["checkout_wait_max_ms"] >= 10
+    engine.dispose()
+
+
+def test_get_pool_metrics_without_pooling() -> None:
+    engine = create_engine("sqlite://", poolclass=NullPool)
+
+    assert get_pool_metrics(engine) == {"pool_class": "NullPool"}
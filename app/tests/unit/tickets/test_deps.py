@@ -84,10 +84,7 @@ def test_validate_ticket_payload_should_return_payload(
     assert result == ticket_payload
 
 
-@pytest.mark.parametrize(
-    "tickets_quota, tickets_reserved, exception",
-    [(2, 2, NoMoreTicketsLeft), (2, 1, None)],
-)
+@pytest.mark.parametrize("seat_claimed, exception", [(False, NoMoreTicketsLeft), (True, None)])
 def test_reserve_ticket_if_available(  # pylint: disable=R0913
     mock_db: Mock,
     mock_user: Mock,
@@ -95,16 +92,12 @@ def test_reserve_ticket_if_available(  # pylint: disable=R0913
     mock_crud: Mock,
     mock_ticket: Mock,
     mock_category: Mock,
-    mocker: MockerFixture,
-    tickets_quota: int,
-    tickets_reserved: int,
+    seat_claimed: bool,
     exception: Type[Exception] | None,
 ) -> None:
     mock_user.id = 1
-    mock_category.quota = tickets_quota
-    mocker.patch.object(crud.ticket_category, "get", return_value=mock_category)
-    mock_crud.get_count_for_ticket_category.return_value = tickets_reserved
-    mock_crud.create.return_value = mock_ticket
+    mock_category.id = ticket_payload.ticket_category_id
+    mock_crud.reserve.return_value = mock_ticket if seat_claimed else None
 
     if exception:
         with pytest.raises(exception):
@@ -114,6 +107,7 @@ def test_reserve_ticket_if_available(  # pylint: disable=R0913
             mock_db, ticket_data=ticket_payload, user=mock_user, category=mock_category
         )
         assert ticket == mock_ticket
+    mock_crud.get_count_for_ticket_category.assert_not_called()
 
 
 @pytest.mark.parametrize(
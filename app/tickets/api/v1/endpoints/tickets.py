@@ -2,6 +2,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, status
 
+from app.common.crud import get_loader_options
 from app.common.deps import CurrentActiveUser, DBSession, Pagination, get_current_active_user
 from app.tickets import crud, schemas
 from app.tickets.deps import reserve_ticket_if_available, ticket_belongs_to_user, ticket_exists
@@ -28,11 +29,14 @@ def get_tickets_by_user(
     db: DBSession, user: CurrentActiveUser, pagination: Pagination, event_id: int | None = None
 ) -> Any:
     """Get all tickets reserved by current user"""
+    options = get_loader_options(Ticket, schemas.TicketWithEvent)
     if event_id is not None:
         return crud.ticket.get_by_event_and_user(
-            db, user_id=user.id, event_id=event_id, limit=pagination.limit, skip=pagination.skip
+            db, user_id=user.id, event_id=event_id, options=options, limit=pagination.limit, skip=pagination.skip
         )
-    tickets = crud.ticket.get_all_by_user(db, user_id=user.id, limit=pagination.limit, skip=pagination.skip)
+    tickets = crud.ticket.get_all_by_user(
+        db, user_id=user.id, options=options, limit=pagination.limit, skip=pagination.skip
+    )
     return tickets
 
 
@@ -1,8 +1,8 @@
 import secrets
-from typing import Sequence
+from typing import Iterable, Iterator, Sequence, Type
 
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 from app.common.crud import CRUDBase
@@ -11,6 +11,8 @@ from app.tickets.schemas.ticket import TicketCreate
 
 
 class CRUDTicket(CRUDBase[Ticket, TicketCreate, BaseModel]):
+    model: Type[Ticket]
+
     def get_by_token(self, db: Session, token: str) -> Ticket | None:
         query = (
             select(self.model)
@@ -21,17 +23,12 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, BaseModel]):
         result = db.execute(query)
         return result.scalar()
 
-    def get_all_by_user(self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100) -> Sequence[Ticket]:
-        query = (
-            select(self.model)
-            .where(self.model.user_id == user_id)
-            .offset(skip)
-            .limit(limit)
-            .join(self.model.ticket_category)
-            .join(TicketCategory.event)
-        )
+    def get_all_by_user(
+        self, db: Session, *, user_id: int, options: Iterable = (), skip: int = 0, limit: int = 100
+    ) -> Sequence[Ticket]:
+        query = select(self.model).where(self.model.user_id == user_id).options(*options).offset(skip).limit(limit)
         result = db.execute(query)
-        return result.scalars().all()
+        return result.unique().scalars().all()
 
     def get_by_category_and_user(self, db: Session, *, user_id: int, ticket_category_id: int) -> Sequence[Ticket]:
         event_query = select(TicketCategory.event_id).where(TicketCategory.id == ticket_category_id)
@@ -44,8 +41,8 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, BaseModel]):
         result = db.execute(query)
         return result.scalars().all()
 
-    def get_by_event_and_user(
-        self, db: Session, *, user_id: int, event_id: int, skip: int = 0, limit: int = 100
+    def get_by_event_and_user(  # pylint: disable=R0913
+        self, db: Session, *, user_id: int, event_id: int, options: Iterable = (), skip: int = 0, limit: int = 100
     ) -> Sequence[Ticket]:
         ticket_categories_query = select(TicketCategory.id).where(TicketCategory.event_id == event_id)
         query = (
@@ -54,11 +51,12 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, BaseModel]):
                 .where(self.model.ticket_category_id.in_(ticket_categories_query))
                 .where(self.model.user_id == user_id)
             )
+            .options(*options)
             .offset(skip)
             .limit(limit)
         )
         result = db.execute(query)
-        return result.scalars().all()
+        return result.unique().scalars().all()
 
     def create(self, db: Session, *, obj_in: TicketCreate) -> Ticket:
         while True:
@@ -72,6 +70,57 @@ class CRUDTicket(CRUDBase[Ticket, TicketCreate, BaseModel]):
         db.refresh(ticket)
         return ticket
 
+    def reserve(self, db: Session, *, obj_in: TicketCreate) -> Ticket | None:
+        """
+        Claim a seat in the ticket category and create the ticket within a single transaction.
+        Returns None if there are no tickets left in the category
+        """
+        if not self._claim_seat(db, ticket_category_id=obj_in.ticket_category_id):
+            return None
+        return self.create(db, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id_: int) -> Ticket | None:
+        ticket = self.get(db, id_=id_)
+        if ticket is None:
+            return None
+        self._release_seat(db, ticket_category_id=ticket.ticket_category_id)
+        db.delete(ticket)
+        db.commit()
+        return ticket
+
+    def _claim_seat(self, db: Session, *, ticket_category_id: int) -> bool:
+        query = (
+            update(TicketCategory)
+            .where(TicketCategory.id == ticket_category_id)
+            .where(TicketCategory.tickets_sold < TicketCategory.quota)
+            .values(tickets_sold=TicketCategory.tickets_sold + 1)
+            .returning(TicketCategory.id)
+        )
+        result = db.execute(query)
+        return result.scalar() is not None
+
+    def _release_seat(self, db: Session, *, ticket_category_id: int) -> None:
+        query = (
+            update(TicketCategory)
+            .where(TicketCategory.id == ticket_category_id)
+            .where(TicketCategory.tickets_sold > 0)
+            .values(tickets_sold=TicketCategory.tickets_sold - 1)
+        )
+        db.execute(query)
+
+    def get_holder_emails(self, db: Session, *, event_id: int, chunk_size: int = 1000) -> Iterator[str]:
+        """
+        Stream distinct emails of the event's ticket holders through a server-side cursor
+        """
+        query = (
+            select(self.model.email)
+            .distinct()
+            .join(self.model.ticket_category)
+            .where(TicketCategory.event_id == event_id)
+            .execution_options(yield_per=chunk_size)
+        )
+        return iter(db.scalars(query))
+
     def get_count_for_ticket_category(self, db: Session, *, ticket_category_id: int) -> int:
         query = select(func.count(self.model.id)).where(  # pylint: disable=not-callable
             self.model.ticket_category_id == ticket_category_id
@@ -1,7 +1,7 @@
-from typing import Sequence
+from typing import Sequence, Tuple, cast
 
 from pydantic import BaseModel
-from sqlalchemy import Row, func, select  # type: ignore[attr-defined]
+from sqlalchemy import CursorResult, Row, func, select, update  # type: ignore[attr-defined]
 from sqlalchemy.orm import Session
 
 from app.common.crud import CRUDBase
@@ -12,17 +12,34 @@ from app.tickets.schemas import TicketCategoryCreate
 class CRUDTicketCategory(CRUDBase[TicketCategory, TicketCategoryCreate, BaseModel]):
     def get_all_by_event(
         self, db: Session, *, event_id: int, skip: int = 0, limit: int = 100
-    ) -> Sequence[Row[TicketCategory, int]]:
+    ) -> Sequence[Row[Tuple[TicketCategory, int]]]:
         query = (
             select(  # type: ignore[attr-defined]
                 self.model,
-                (self.model.quota - func.count(Ticket.id)).label("tickets_left"),  # pylint: disable=not-callable
+                (self.model.quota - self.model.tickets_sold).label("tickets_left"),
             )
-            .outerjoin(Ticket, self.model.id == Ticket.ticket_category_id)  # type: ignore[arg-type]
             .where(self.model.event_id == event_id)
-            .group_by(self.model.id)
             .offset(skip)
             .limit(limit)
         )
         result = db.execute(query)
         return result.all()
+
+    def reconcile_tickets_sold(self, db: Session) -> int:
+        """
+        Recompute sold tickets counters from the ticket table, returns the number of corrected categories
+        """
+        tickets_count = (
+            select(func.count(Ticket.id))  # pylint: disable=not-callable
+            .where(Ticket.ticket_category_id == self.model.id)
+            .scalar_subquery()
+        )
+        query = (
+            update(self.model)
+            .where(self.model.tickets_sold != tickets_count)
+            .values(tickets_sold=tickets_count)
+            .execution_options(synchronize_session=False)
+        )
+        result = cast(CursorResult, db.execute(query))
+        db.commit()
+        return result.rowcount
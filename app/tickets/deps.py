@@ -55,9 +55,8 @@ def reserve_ticket_if_available(
     ticket_data: Annotated[schemas.TicketCreateBody, Depends(validate_ticket_payload)],
     user: CurrentActiveUser,
 ) -> Ticket:
-    ticket_in = schemas.TicketCreate(**ticket_data.model_dump(), user_id=user.id)
-    ticket_count_for_category = crud.ticket.get_count_for_ticket_category(db, ticket_category_id=category.id)
-    if ticket_count_for_category >= category.quota:
+    ticket_in = schemas.TicketCreate(email=ticket_data.email, ticket_category_id=category.id, user_id=user.id)
+    ticket = crud.ticket.reserve(db, obj_in=ticket_in)
+    if ticket is None:
         raise NoMoreTicketsLeft
-    ticket = crud.ticket.create(db, obj_in=ticket_in)
     return ticket
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship  # type: ignore[attr-defined]
 
 from app.common.models import IntPk
@@ -18,11 +18,13 @@ class Ticket(Base):
     token: Mapped[str] = mapped_column(unique=True, nullable=False)
     created_at: Mapped[datetime] = mapped_column(nullable=False, default=datetime.utcnow)
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), nullable=False)
-    ticket_category_id: Mapped[int] = mapped_column(ForeignKey("ticketcategory.id"), nullable=False)
+    ticket_category_id: Mapped[int] = mapped_column(ForeignKey("ticketcategory.id"), index=True, nullable=False)
 
     user: Mapped["User"] = relationship("User", back_populates="tickets", lazy="joined")
     ticket_category: Mapped["TicketCategory"] = relationship("TicketCategory", back_populates="tickets")
 
+    __table_args__ = (Index("ix_ticket_user_ticket_category", "user_id", "ticket_category_id"),)
+
     def __str__(self) -> str:
         return f"{self.id} {self.user}"
 
@@ -31,10 +33,14 @@ class TicketCategory(Base):
     id: Mapped[IntPk]
     name: Mapped[str] = mapped_column(nullable=False)
     quota: Mapped[int] = mapped_column(nullable=False)
-    event_id: Mapped[int] = mapped_column(ForeignKey("event.id"), nullable=False)
+    tickets_sold: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
+    event_id: Mapped[int] = mapped_column(ForeignKey("event.id"), index=True, nullable=False)
 
     tickets: Mapped[list["Ticket"]] = relationship("Ticket", back_populates="ticket_category")
     event: Mapped["Event"] = relationship(Event, back_populates="ticket_categories")
 
+    # events with tickets left, looked up when listing only the events still selling
+    __table_args__ = (Index("ix_ticketcategory_available", "event_id", postgresql_where=text("quota > tickets_sold")),)
+
     def __str__(self) -> str:
         return f"{self.name} ({self.quota} pcs)"
@@ -0,0 +1,77 @@
+"""
+Compare an events listing page filtered by related rows when the relations are joined and the rows deduplicated with
+DISTINCT (before) and when collections are filtered with correlated EXISTS subqueries, joining only many-to-one
+relations (after)
+
+Usage: python -m benchmarks.filter_exists --events 100000
+"""
+from functools import partial
+from typing import Any
+
+import click
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.common.crud import count_rows
+from app.common.search import search_match
+from app.events import crud
+from app.events.filters import EventFilters, EventSorter
+from app.events.models import Event, Location, Speaker
+from benchmarks.utils import benchmark_session, measure, seed_events, seed_speakers
+
+CASES: dict[str, tuple[dict[str, Any], list, list]] = {
+    "location": (
+        {"location__city__icontains": "city 13"},
+        [Event.location],
+        [func.lower(Location.city).contains("city 13")],
+    ),
+    "speakers": (
+        {"speakers__name__search": "speaker 1"},
+        [Event.speakers],
+        [search_match(Speaker.name, "speaker 1")],
+    ),
+    "both": (
+        {"location__city__icontains": "city 13", "speakers__name__search": "speaker 1"},
+        [Event.location, Event.speakers],
+        [func.lower(Location.city).contains("city 13"), search_match(Speaker.name, "speaker 1")],
+    ),
+}
+
+
+def get_joined_query(joins: list, statements: list) -> Select:
+    query = select(Event).distinct()
+    for join in joins:
+        query = query.join(join)
+    return query.where(*statements)
+
+
+def list_page_joined(session: Session, joins: list, statements: list, order_by: list) -> None:
+    query = get_joined_query(joins, statements)
+    session.execute(query.order_by(*order_by).limit(100)).unique().scalars().all()
+    count_rows(session, query)
+
+
+def list_page_exists(session: Session, filters: dict[str, Any], order_by: list) -> None:
+    event_filters = EventFilters(**filters).filters
+    crud.event.get_filtered(session, filters=event_filters.statements, joins=event_filters.related, order_by=order_by)
+    crud.event.get_filtered_row_count(session, filters=event_filters.statements, joins=event_filters.related)
+
+
+@click.command()
+@click.option("--events", default=100_000, help="Number of events to seed")
+@click.option("--repeat", default=10, help="Number of measured runs per query shape")
+def main(events: int, repeat: int) -> None:
+    with benchmark_session() as session:
+        seed_events(session, events)
+        seed_speakers(session)
+        order_by = EventSorter(sort_by="-held_at").keyset_order_by
+
+        click.echo(f"{'filter':<12}{'before ms':>12}{'after ms':>12}{'after/before':>14}")
+        for name, (filters, joins, statements) in CASES.items():
+            before = measure(partial(list_page_joined, session, joins, statements, order_by), repeat=repeat)
+            after = measure(partial(list_page_exists, session, filters, order_by), repeat=repeat)
+            click.echo(f"{name:<12}{before:>12.2f}{after:>12.2f}{after / before:>13.0%}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
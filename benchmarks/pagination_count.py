@@ -0,0 +1,36 @@
+"""
+Compare the database cost of an events listing page for every `CountMode`
+
+Usage: python -m benchmarks.pagination_count --events 100000
+"""
+import click
+
+from app.common.schemas import CountMode
+from app.events import crud
+from app.events.filters import EventFilters, EventSorter
+from benchmarks.utils import benchmark_session, measure, seed_events
+
+
+@click.command()
+@click.option("--events", default=100_000, help="Number of events to seed")
+@click.option("--repeat", default=20, help="Number of measured runs per mode")
+def main(events: int, repeat: int) -> None:
+    with benchmark_session() as session:
+        seed_events(session, events)
+        filters = EventFilters(is_active__exact=True, location__city__icontains="city 1").filters
+        order_by = EventSorter(sort_by="-held_at").keyset_order_by
+
+        def list_page(mode: CountMode) -> None:
+            crud.event.get_filtered(session, filters=filters.statements, joins=filters.related, order_by=order_by)
+            crud.event.get_filtered_row_count(session, filters=filters.statements, joins=filters.related, mode=mode)
+
+        baseline = None
+        click.echo(f"{'count mode':<12}{'median ms':>12}{'vs exact':>12}")
+        for mode in CountMode:
+            elapsed = measure(lambda: list_page(mode), repeat=repeat)  # pylint: disable=cell-var-from-loop
+            baseline = baseline or elapsed
+            click.echo(f"{mode.value:<12}{elapsed:>12.2f}{elapsed / baseline:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
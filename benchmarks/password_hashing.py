@@ -0,0 +1,66 @@
+"""
+Measure password hashing throughput for candidate schemes and costs on the current hardware
+
+Usage: python -m benchmarks.password_hashing --bcrypt-rounds 10 --bcrypt-rounds 12 --argon2-time-cost 3
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+from passlib.context import CryptContext
+
+from app.auth.security import create_password_context
+from app.core.config import settings
+from benchmarks.utils import measure
+
+PASSWORD = "Benchmark1234!"
+
+
+def hashes_per_second(context: CryptContext, repeat: int, workers: int) -> tuple[float, float]:
+    """
+    Median latency of a single hash in milliseconds and the throughput of `workers` hashing concurrently
+    """
+    latency = measure(lambda: context.hash(PASSWORD), repeat=repeat)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        batch = measure(lambda: list(executor.map(context.hash, [PASSWORD] * workers * 2)), repeat=repeat)
+    return latency, workers * 2 / batch * 1000
+
+
+@click.command()
+@click.option("--bcrypt-rounds", multiple=True, type=int, default=(10, 11, 12, 13), help="bcrypt cost to measure")
+@click.option("--argon2-time-cost", multiple=True, type=int, default=(2, 3, 4), help="argon2 passes to measure")
+@click.option("--argon2-memory-cost", default=settings.PASSWORD_ARGON2_MEMORY_COST_KIB, help="argon2 memory in KiB")
+@click.option("--argon2-parallelism", default=settings.PASSWORD_ARGON2_PARALLELISM, help="argon2 lanes")
+@click.option("--workers", default=settings.PASSWORD_HASHING_MAX_WORKERS, help="Concurrent hashing workers")
+@click.option("--repeat", default=5, help="Number of measured runs per setting")
+def main(  # pylint: disable=R0913
+    bcrypt_rounds: tuple[int, ...],
+    argon2_time_cost: tuple[int, ...],
+    argon2_memory_cost: int,
+    argon2_parallelism: int,
+    workers: int,
+    repeat: int,
+) -> None:
+    candidates = [
+        (f"bcrypt rounds={rounds}", create_password_context("bcrypt", bcrypt_rounds=rounds)) for rounds in bcrypt_rounds
+    ]
+    candidates += [
+        (
+            f"argon2 t={time_cost} m={argon2_memory_cost} p={argon2_parallelism}",
+            create_password_context(
+                "argon2",
+                argon2_memory_cost=argon2_memory_cost,
+                argon2_time_cost=time_cost,
+                argon2_parallelism=argon2_parallelism,
+            ),
+        )
+        for time_cost in argon2_time_cost
+    ]
+
+    click.echo(f"{'setting':<36}{'ms/hash':>10}{f'hashes/s ({workers} workers)':>26}")
+    for name, context in candidates:
+        latency, throughput = hashes_per_second(context, repeat=repeat, workers=workers)
+        click.echo(f"{name:<36}{latency:>10.1f}{throughput:>26.1f}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
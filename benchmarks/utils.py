@@ -0,0 +1,107 @@
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Generator
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.auth.models import User
+from app.core.config import settings
+from app.db.base import Base
+from app.events.models import Event, EventType, Location, Organizer, Speaker, event_speaker
+
+SEED_CHUNK_SIZE = 5000
+
+
+@contextmanager
+def benchmark_session() -> Generator:
+    """
+    Session bound to the test database inside a transaction that is rolled back on exit,
+    so the seeded data never persists
+    """
+    engine = create_engine(settings.SQLALCHEMY_TEST_DATABASE_URI)
+    Base.metadata.create_all(bind=engine)
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+def seed_events(session: Session, count: int, locations: int = 100, event_types: int = 10) -> None:
+    user_id = session.execute(
+        insert(User).values(email="benchmark@example.com", hashed_password="hash").returning(User.id)
+    ).scalar_one()
+    organizer_id = session.execute(insert(Organizer).values(name="Benchmark").returning(Organizer.id)).scalar_one()
+    session.execute(
+        insert(Location),
+        [
+            {
+                "name": f"Location {i}",
+                "city": f"City {i % 20}",
+                "slug": f"bench-location-{i}",
+                "latitude": 0,
+                "longitude": 0,
+            }
+            for i in range(locations)
+        ],
+    )
+    session.execute(insert(EventType), [{"name": f"Type {i}", "slug": f"bench-type-{i}"} for i in range(event_types)])
+    location_ids = session.execute(select(Location.id).where(Location.slug.startswith("bench-"))).scalars().all()
+    type_ids = session.execute(select(EventType.id).where(EventType.slug.startswith("bench-"))).scalars().all()
+    now = datetime.utcnow()
+    for start in range(0, count, SEED_CHUNK_SIZE):
+        rows = [
+            {
+                "name": f"Event {i}",
+                "slug": f"bench-event-{i}",
+                "description": "Lorem ipsum dolor sit amet " * 20,
+                "held_at": now + timedelta(minutes=i),
+                "is_active": i % 10 != 0,
+                "organizer_id": organizer_id,
+                "created_by_id": user_id,
+                "event_type_id": type_ids[i % len(type_ids)],
+                "location_id": location_ids[i % len(location_ids)],
+            }
+            for i in range(start, min(start + SEED_CHUNK_SIZE, count))
+        ]
+        session.execute(insert(Event), rows)
+    session.connection().exec_driver_sql("ANALYZE")
+
+
+def seed_speakers(session: Session, count: int = 1000, per_event: int = 2) -> None:
+    """
+    Add speakers to the seeded events, each event getting `per_event` consecutive speakers
+    """
+    session.execute(insert(Speaker), [{"name": f"Speaker {i}", "slug": f"bench-speaker-{i}"} for i in range(count)])
+    speaker_ids = session.execute(select(Speaker.id).where(Speaker.slug.startswith("bench-"))).scalars().all()
+    event_ids = session.execute(select(Event.id).where(Event.slug.startswith("bench-"))).scalars().all()
+    for start in range(0, len(event_ids), SEED_CHUNK_SIZE):
+        chunk = event_ids[start:][:SEED_CHUNK_SIZE]
+        rows = [
+            {"event_id": event_id, "speaker_id": speaker_ids[(i + offset) % len(speaker_ids)]}
+            for i, event_id in enumerate(chunk, start)
+            for offset in range(per_event)
+        ]
+        session.execute(insert(event_speaker), rows)
+    session.connection().exec_driver_sql("ANALYZE")
+
+
+def measure(func: Callable[[], object], repeat: int = 10) -> float:
+    """
+    Median wall time of the callable in milliseconds (after a warm-up call)
+    """
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
@@ -1,18 +1,44 @@
+import asyncio
+import csv
 import importlib
 import json
+import os
+from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Generator
+from datetime import date
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import itemgetter
+from pathlib import Path
+from typing import IO, Any, Generator, Iterable, Iterator
 
 import click
-from sqlalchemy import insert, text
+from fastapi_storages.integrations.sqlalchemy import FileType
+from sqlalchemy import Insert, Table, bindparam, func, insert, select, text, type_coerce
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import sort_tables
 
 from app.auth import crud
 from app.auth.schemas import UserCreate
+from app.common.models import ImportCheckpoint
+from app.common.outbox import run_outbox_worker
+from app.core.config import settings
+from app.db.base import Base
 from app.db.session import SessionLocal
+from app.events import crud as events_crud
+from app.events.models import EventType
 from app.loggers import logger
+from app.tickets import crud as tickets_crud
 
 MODELS_MODULE_NAME = "app.db.base"
+IMPORT_CHUNK_SIZE = 1000
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_GROUPS = {
+    "users": ("User",),
+    "events": ("Organizer", "Location", "EventType", "Speaker", "Event", "event_speaker", "TicketCategory"),
+    "tickets": ("Ticket",),
+}
 IMAGE_URL_QUERIES = [
     text(
         """
@@ -35,9 +61,48 @@ class DBDataImporter:
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def from_json(self, file_path: str) -> None:
+    def from_json(self, file_path: str, *, bulk: bool = False, chunk_size: int = IMPORT_CHUNK_SIZE) -> None:
         data = get_json_content(file_path)
-        insert_data_to_db(session=self._session, module_name=self.MODULE_NAME, raw_data=data)
+        if bulk:
+            bulk_insert_data_to_db(
+                session=self._session, module_name=self.MODULE_NAME, raw_data=data, chunk_size=chunk_size
+            )
+        else:
+            insert_data_to_db(session=self._session, module_name=self.MODULE_NAME, raw_data=data)
+        tables = {get_table(get_model_class(entry["model"], self.MODULE_NAME)) for entry in data}
+        reset_sequences(self._session, tables)
+        rebuild_derived_tables(self._session, tables)
+
+    def from_stream(self, file_path: str, *, batch_size: int = IMPORT_CHUNK_SIZE) -> None:
+        """
+        Insert rows parsed incrementally from a JSON or NDJSON file, committing every batch. Rows must be ordered so
+        that referenced rows come first. Every batch is committed together with the import checkpoint of the file, and
+        an interrupted import resumes after the committed rows
+        """
+        source = os.path.abspath(file_path)
+        checkpoint = self._session.get(ImportCheckpoint, source) or ImportCheckpoint(source=source, rows=0, tables=[])
+        rows_done, table_names = checkpoint.rows, set(checkpoint.tables)
+        if rows_done:
+            logger.info(f"Resuming import after {rows_done} rows")
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            entries = iter_ndjson_rows(file) if file_path.endswith(NDJSON_EXTENSIONS) else iter_json_rows(file)
+            rows = ((get_table(get_model_class(model_name, self.MODULE_NAME)), row) for model_name, row in entries)
+            for table, batch in iter_batches(islice(rows, rows_done, None), batch_size):
+                self._session.execute(get_insert(table), batch)
+                rows_done += len(batch)
+                table_names.add(table.name)
+                checkpoint.rows, checkpoint.tables = rows_done, sorted(table_names)
+                self._session.add(checkpoint)
+                self._session.commit()
+                logger.info(f"Imported {rows_done} rows")
+
+        tables = [Base.metadata.tables[name] for name in table_names]
+        reset_sequences(self._session, tables)
+        rebuild_derived_tables(self._session, tables)
+        if checkpoint in self._session:
+            self._session.delete(checkpoint)
+        self._session.commit()
 
 
 def get_json_content(file_path: str) -> list[dict]:
@@ -48,6 +113,109 @@ def get_json_content(file_path: str) -> list[dict]:
     return content
 
 
+class JSONStreamReader:
+    """
+    Read JSON values one by one from a file, keeping only the unparsed part of the current chunk in memory
+    """
+
+    decoder = json.JSONDecoder()
+
+    def __init__(self, file: IO[str], chunk_size: int = 65536) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+
+    def _fill(self) -> bool:
+        chunk = self.file.read(self.chunk_size)
+        position = self.position
+        self.buffer = self.buffer[position:] + chunk
+        self.position = 0
+        return bool(chunk)
+
+    def peek(self) -> str:
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON data, found '{found}'")
+        self.position += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number at the end of the buffer might continue in the next chunk
+            if end < len(self.buffer) or not self._fill():
+                self.position = end
+                return value
+
+    def iter_items(self, close: str) -> Iterator[None]:
+        """
+        Yield before every item of the opened array or object, consuming the separators and the closing char
+        """
+        if self.peek() == close:
+            self.position += 1
+            return
+        while True:
+            yield
+            separator = self.peek()
+            self.position += 1
+            if separator == close:
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '{close}' in JSON data, found '{separator}'")
+
+
+def iter_json_rows(file: IO[str], chunk_size: int = 65536) -> Iterator[tuple[str, dict]]:
+    """
+    Yield (model name, row) pairs of a JSON file in the `populate-db` format without loading it at once
+    """
+    reader = JSONStreamReader(file, chunk_size)
+    if reader.peek() != "[":
+        raise ValueError("JSON data should be a list")
+    reader.expect("[")
+    for _ in reader.iter_items("]"):
+        reader.expect("{")
+        model_name = None
+        for _ in reader.iter_items("}"):
+            key = reader.value()
+            reader.expect(":")
+            if key == "model":
+                model_name = reader.value()
+            elif key == "data":
+                if model_name is None:
+                    raise ValueError("Entry model should precede its data")
+                reader.expect("[")
+                for _ in reader.iter_items("]"):
+                    yield model_name, reader.value()
+            else:
+                reader.value()
+
+
+def iter_ndjson_rows(file: IO[str]) -> Iterator[tuple[str, dict]]:
+    """
+    Yield (model name, row) pairs of a file with one `{"model": ..., "data": {...}}` object per line
+    """
+    for line in file:
+        if line.strip():
+            entry = json.loads(line)
+            yield entry["model"], entry["data"]
+
+
+@lru_cache
 def get_model_class(model_name: str, module_name: str) -> Any:
     try:
         module = importlib.import_module(module_name)
@@ -63,8 +231,7 @@ def get_model_class(model_name: str, module_name: str) -> Any:
 
 
 def insert_row_to_db(session: Session, table: Any, row: dict) -> None:
-    query = insert(table).values(**row)
-    session.execute(query)
+    session.execute(get_insert(get_table(table)), row)
 
 
 def insert_data_to_db(session: Session, module_name: str, raw_data: list[dict]) -> None:
@@ -77,6 +244,151 @@ def insert_data_to_db(session: Session, module_name: str, raw_data: list[dict])
             insert_row_to_db(session, model, row)
 
 
+def get_table(model: Any) -> Table:
+    return model if isinstance(model, Table) else model.__table__
+
+
+def get_file_columns(table: Table) -> list[Any]:
+    return [column for column in table.columns if isinstance(column.type, FileType)]
+
+
+def get_insert(table: Table) -> Insert:
+    """
+    INSERT binding file columns as plain names of already stored files, instead of uploading them
+    """
+    query = insert(table)
+    if file_columns := get_file_columns(table):
+        query = query.values(
+            {
+                column.name: bindparam(column.name, type_=column.type.impl_instance, required=False)
+                for column in file_columns
+            }
+        )
+    return query
+
+
+def iter_row_chunks(rows: Iterable[dict], chunk_size: int) -> Iterator[list[dict]]:
+    """
+    Split rows into chunks of consecutive rows with the same columns, so that each chunk is inserted by a single
+    executemany
+    """
+    chunk: list[dict] = []
+    for row in rows:
+        if chunk and (len(chunk) == chunk_size or row.keys() != chunk[0].keys()):
+            yield chunk
+            chunk = []
+        chunk.append(row)
+    if chunk:
+        yield chunk
+
+
+def iter_batches(rows: Iterable[tuple[Table, dict]], batch_size: int) -> Iterator[tuple[Table, list[dict]]]:
+    for table, group in groupby(rows, key=itemgetter(0)):
+        for chunk in iter_row_chunks((row for _, row in group), batch_size):
+            yield table, chunk
+
+
+def bulk_insert_data_to_db(session: Session, module_name: str, raw_data: list[dict], chunk_size: int) -> None:
+    """
+    Insert rows grouped per table in chunks, inserting referenced tables before the tables depending on them
+    """
+    rows_by_table: dict[Table, list[dict]] = defaultdict(list)
+    for entry in raw_data:
+        table = get_table(get_model_class(entry["model"], module_name))
+        rows_by_table[table].extend(entry["data"])
+
+    for table in sort_tables(rows_by_table):
+        for chunk in iter_row_chunks(rows_by_table[table], chunk_size):
+            session.execute(get_insert(table), chunk)
+        logger.info(f"Inserted {len(rows_by_table[table])} rows into {table.name}")
+
+
+def reset_sequences(session: Session, tables: Iterable[Table]) -> None:
+    """
+    Move id sequences past the imported ids, so that rows created later don't collide with them
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    for table in tables:
+        column = table.autoincrement_column
+        if column is None:
+            continue
+        sequence = func.pg_get_serial_sequence(table.name, column.name)
+        session.execute(select(func.setval(sequence, func.coalesce(func.max(column), 0) + 1, False)))
+
+
+def rebuild_derived_tables(session: Session, tables: Iterable[Table]) -> None:
+    """
+    Recompute tables maintained on ORM writes, which imported rows bypass
+    """
+    if EventType.__tablename__ in {table.name for table in tables}:
+        events_crud.event_type.rebuild_closure(session)
+
+
+class DBDataExporter:
+    MODULE_NAME = "app.db.base"
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def iter_tables(self, model_names: Iterable[str]) -> Iterator[tuple[str, Table]]:
+        """
+        Yield tables of the given models ordered so that referenced tables come first, as the importers expect
+        """
+        tables = {get_table(get_model_class(model_name, self.MODULE_NAME)): model_name for model_name in model_names}
+        for table in sort_tables(tables):
+            yield tables[table], table
+
+    def iter_rows(self, table: Table, chunk_size: int) -> Iterator[dict]:
+        """
+        Stream rows through a server-side cursor, with file columns holding the stored file names
+        """
+        columns = [
+            type_coerce(column, column.type.impl_instance).label(column.name)
+            if isinstance(column.type, FileType)
+            else column
+            for column in table.columns
+        ]
+        query = select(*columns).order_by(*table.primary_key.columns).execution_options(yield_per=chunk_size)
+        for row in self._session.execute(query).mappings():
+            yield dict(row)
+
+    def to_ndjson(self, file: IO[str], model_names: Iterable[str], chunk_size: int = EXPORT_CHUNK_SIZE) -> None:
+        for model_name, table in self.iter_tables(model_names):
+            count = 0
+            for count, row in enumerate(self.iter_rows(table, chunk_size), start=1):
+                file.write(json.dumps({"model": model_name, "data": row}, default=serialize_value) + "\n")
+            logger.info(f"Exported {count} rows from {table.name}")
+
+    def to_json(self, file: IO[str], model_names: Iterable[str], chunk_size: int = EXPORT_CHUNK_SIZE) -> None:
+        file.write("[")
+        for index, (model_name, table) in enumerate(self.iter_tables(model_names)):
+            file.write(f'{"," if index else ""}\n{{"model": {json.dumps(model_name)}, "data": [')
+            count = 0
+            for count, row in enumerate(self.iter_rows(table, chunk_size), start=1):
+                file.write(f'{"," if count > 1 else ""}\n  {json.dumps(row, default=serialize_value)}')
+            file.write("\n]}")
+            logger.info(f"Exported {count} rows from {table.name}")
+        file.write("\n]\n")
+
+    def to_csv(self, directory: str, model_names: Iterable[str], chunk_size: int = EXPORT_CHUNK_SIZE) -> None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        for _, table in self.iter_tables(model_names):
+            with open(Path(directory) / f"{table.name}.csv", "w", encoding="utf-8", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=[column.name for column in table.columns])
+                writer.writeheader()
+                count = 0
+                for count, row in enumerate(self.iter_rows(table, chunk_size), start=1):
+                    writer.writerow(row)
+            logger.info(f"Exported {count} rows from {table.name}")
+
+
+def serialize_value(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 @contextmanager
 def get_safe_db_session() -> Generator:
     session = SessionLocal()
@@ -96,14 +408,52 @@ def cli() -> None:
 
 @cli.command()
 @click.argument("json_file", type=click.Path(exists=True))
-def populate_db(json_file: str) -> None:
-    """Populate database with JSON data"""
+@click.option("--bulk", is_flag=True, help="Insert rows in chunks per table instead of one by one")
+@click.option(
+    "--stream", is_flag=True, help="Parse the file incrementally and commit every chunk, always on for NDJSON"
+)
+@click.option("--chunk-size", default=IMPORT_CHUNK_SIZE, help="Rows inserted by one statement in bulk or stream mode")
+def populate_db(json_file: str, bulk: bool, stream: bool, chunk_size: int) -> None:
+    """Populate database with JSON or NDJSON data"""
     logger.info(f"Reading data from {json_file}...")
     with get_safe_db_session() as session:  # type: Session
-        DBDataImporter(session).from_json(json_file)
+        if stream or json_file.endswith(NDJSON_EXTENSIONS):
+            DBDataImporter(session).from_stream(json_file, batch_size=chunk_size)
+        else:
+            DBDataImporter(session).from_json(json_file, bulk=bulk, chunk_size=chunk_size)
         logger.info("Data import completed")
 
 
+@cli.command()
+@click.argument("output", type=click.Path())
+@click.option(
+    "--only", "groups", multiple=True, type=click.Choice(list(EXPORT_GROUPS)), help="Export only the given data"
+)
+@click.option(
+    "--format",
+    "output_format",
+    default="ndjson",
+    type=click.Choice(["ndjson", "json", "csv"]),
+    help="NDJSON and JSON can be loaded back with populate-db, CSV is written as one file per table into OUTPUT",
+)
+@click.option("--chunk-size", default=EXPORT_CHUNK_SIZE, help="Rows fetched from the database at once")
+def export_data(output: str, groups: tuple[str, ...], output_format: str, chunk_size: int) -> None:
+    """Export users, events and tickets"""
+    model_names = [model_name for group in groups or EXPORT_GROUPS for model_name in EXPORT_GROUPS[group]]
+    logger.info(f"Exporting data to {output}...")
+    with get_safe_db_session() as session:  # type: Session
+        exporter = DBDataExporter(session)
+        if output_format == "csv":
+            exporter.to_csv(output, model_names, chunk_size)
+        else:
+            with open(output, "w", encoding="utf-8") as file:
+                if output_format == "json":
+                    exporter.to_json(file, model_names, chunk_size)
+                else:
+                    exporter.to_ndjson(file, model_names, chunk_size)
+        logger.info("Data export completed")
+
+
 @cli.command()
 def regenerate_image_urls() -> None:
     """Set image urls for event posters and speaker photos"""
@@ -114,6 +464,25 @@ def regenerate_image_urls() -> None:
         logger.info("Urls regenerated")
 
 
+@cli.command()
+def reconcile_ticket_counters() -> None:
+    """Recompute sold tickets counters of all ticket categories"""
+    logger.info("Reconciling ticket counters...")
+    with get_safe_db_session() as session:  # type: Session
+        corrected = tickets_crud.ticket_category.reconcile_tickets_sold(session)
+        logger.info(f"Ticket counters reconciled ({corrected} categories corrected)")
+
+
+@cli.command()
+@click.option("--batch-size", default=settings.EMAIL_OUTBOX_BATCH_SIZE, help="Emails sent over one SMTP connection")
+@click.option("--poll-interval", default=settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS, help="Seconds between polls")
+@click.option("--once", is_flag=True, help="Exit once the outbox is drained")
+def send_emails(batch_size: int, poll_interval: float, once: bool) -> None:
+    """Deliver emails queued in the outbox"""
+    logger.info("Starting outbox worker...")
+    asyncio.run(run_outbox_worker(SessionLocal, batch_size=batch_size, poll_interval=poll_interval, once=once))
+
+
 @cli.command()
 @click.option("--email", prompt=True)
 @click.password_option()